@@ -0,0 +1,73 @@
+""" Time AbstractSynapseDynamics.convert_per_connection_data_to_rows against\
+    selecting the connections of each row in turn.
+
+The connections of each row were selected in turn before they were sorted
+into rows.  Each case has a number of rows (pre-neurons) and a fan-out
+(connections per row), with the connections in a random order.  Selecting
+each row in turn takes time proportional to rows times connections, so it
+is only timed where that is at most --max-selected.
+"""
+from __future__ import print_function
+import argparse
+import timeit
+import numpy
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    SynapseDynamicsStatic)
+
+# (number of rows, connections per row) of each case
+_CASES = [(1000, 10), (1000, 100), (5000, 200), (10000, 1000), (50000, 40),
+          (50000, 100)]
+
+# The bytes of data per connection, as for static synapses
+_BYTES_PER_CONNECTION = 4
+
+
+def _select_each_row(connection_row_indices, n_rows, data):
+    """ Get the data of each row by selecting the connections of each row in\
+        turn
+    """
+    return [data[connection_row_indices == i].reshape(-1)
+            for i in range(n_rows)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--max-selected", type=float, default=5e8,
+        help="the largest rows times connections to select each row in turn"
+             " for (default: %(default)s)")
+    args = parser.parse_args()
+
+    dynamics = SynapseDynamicsStatic()
+    rng = numpy.random.RandomState(1)
+    for n_rows, fan_out in _CASES:
+        connection_row_indices = numpy.repeat(
+            numpy.arange(n_rows, dtype="uint32"), fan_out)
+        rng.shuffle(connection_row_indices)
+        data = rng.randint(
+            0, 256, (len(connection_row_indices), _BYTES_PER_CONNECTION)
+        ).astype("uint8")
+
+        def sort_rows():
+            return dynamics.convert_per_connection_data_to_rows(
+                connection_row_indices, n_rows, data)
+
+        def select_rows():
+            return _select_each_row(connection_row_indices, n_rows, data)
+
+        sort_time = timeit.timeit(sort_rows, number=1)
+        select = "not timed"
+        if n_rows * len(connection_row_indices) <= args.max_selected:
+            assert all(
+                numpy.array_equal(sorted_row, selected_row)
+                for sorted_row, selected_row in zip(
+                    sort_rows(), select_rows()))
+            select_time = timeit.timeit(select_rows, number=1)
+            select = "{:.3f}s ({:.0f}x)".format(
+                select_time, select_time / sort_time)
+        print("{} rows of {}: sorted {:.3f}s, selected {}".format(
+            n_rows, fan_out, sort_time, select))
+
+
+if __name__ == "__main__":
+    main()
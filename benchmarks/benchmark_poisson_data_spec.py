@@ -0,0 +1,114 @@
+""" Time writing the Poisson parameters of every core of a population of a\
+    million Poisson sources.
+
+The parameters of each core are written to a data specification that only
+counts the bytes written.  The rate statistics that the shared parameters
+need are computed once for the population and then reused by each core.
+For comparison, the time to compute them over all the rates, as was done
+for each core before they were reused, is measured on one core and
+multiplied by the number of cores.
+"""
+from __future__ import print_function
+import argparse
+import timeit
+import numpy
+import scipy.stats
+from pacman.model.graphs.common import Slice
+from unittests.mocks import MockSimulator
+# Import the neuron models first to avoid a circular import
+import spynnaker.pyNN.models.neuron  # noqa: F401
+from spynnaker.pyNN.models.spike_source.spike_source_poisson_vertex import (
+    SpikeSourcePoissonVertex)
+
+
+class _CountingSpec(object):
+    """ A data specification that counts the bytes written to it
+    """
+
+    def __init__(self):
+        self.n_bytes = 0
+
+    def comment(self, comment):
+        pass
+
+    def switch_write_focus(self, region):
+        pass
+
+    def write_value(self, data, data_type):
+        self.n_bytes += 4
+
+    def write_array(self, array_values):
+        self.n_bytes += numpy.asarray(array_values).nbytes
+
+
+class _Placement(object):
+    x = 0
+    y = 0
+    p = 1
+    vertex = None
+
+
+class _RoutingInfo(object):
+    def get_first_key_from_pre_vertex(self, vertex, partition_id):
+        return 0
+
+
+class _Graph(object):
+    def get_edges_ending_at_vertex_with_partition_name(
+            self, vertex, partition_id):
+        return []
+
+
+def _recompute_rate_statistics(rate):
+    """ Compute the rate statistics over all the rates, as each core did\
+        before they were reused
+    """
+    total_mean_rate = numpy.sum(rate)
+    max_spikes = numpy.sum(scipy.stats.poisson.ppf(1.0 - (1.0 / rate), rate))
+    return total_mean_rate, max_spikes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--n-sources", type=int, default=1000000,
+        help="the number of Poisson sources (default: %(default)s)")
+    parser.add_argument(
+        "--atoms-per-core", type=int, default=256,
+        help="the number of sources on each core (default: %(default)s)")
+    args = parser.parse_args()
+
+    simulator = MockSimulator.setup()
+    simulator.machine_time_step = 1000
+    simulator.has_ran = False
+    rng = numpy.random.RandomState(1)
+    vertex = SpikeSourcePoissonVertex(
+        args.n_sources, None, "Poisson",
+        rate=rng.choice([1.0, 5.0, 10.0, 20.0, 50.0], args.n_sources),
+        max_rate=None, start=0, duration=None, seed=1,
+        max_atoms_per_core=args.atoms_per_core, model=None)
+    slices = [
+        Slice(lo_atom, min(lo_atom + args.atoms_per_core, args.n_sources) - 1)
+        for lo_atom in range(0, args.n_sources, args.atoms_per_core)]
+    vertex._n_subvertices = len(slices)
+    spec = _CountingSpec()
+
+    def write_all():
+        for vertex_slice in slices:
+            vertex._max_spikes_per_ts(1000)
+            vertex._write_poisson_parameters(
+                spec, _Graph(), _Placement(), _RoutingInfo(), vertex_slice,
+                1000, 1)
+
+    write_time = timeit.timeit(write_all, number=1)
+    recompute_time = timeit.timeit(
+        lambda: _recompute_rate_statistics(vertex.rate), number=1)
+    print("{} sources on {} cores, {} bytes".format(
+        args.n_sources, len(slices), spec.n_bytes))
+    print("write all cores {:.2f}s; recomputing the rate statistics for"
+          " each core would add about {:.0f}s".format(
+              write_time, recompute_time * len(slices)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+""" Time SynapticManager._get_ring_buffer_to_input_left_shifts for a\
+    population with many incoming projections.
+
+Half of the projections come from Poisson sources, drawn from a few rates
+and sizes, and half from spike source arrays.  The first time is with no
+remembered Poisson statistics; the second is for another population fed by
+the same sources, which reuses them.
+"""
+from __future__ import print_function
+import argparse
+import timeit
+import numpy
+from unittests.mocks import MockSimulator, MockPopulation
+# Import the neuron models first to avoid a circular import
+import spynnaker.pyNN.models.neuron  # noqa: F401
+from spynnaker.pyNN.models.neuron import synaptic_manager
+from spynnaker.pyNN.models.neuron.synaptic_manager import SynapticManager
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    SynapseDynamicsStatic)
+from spynnaker.pyNN.models.neural_projections import (
+    ProjectionApplicationEdge, SynapseInformation)
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    FixedProbabilityConnector)
+from spynnaker.pyNN.models.spike_source.spike_source_array_vertex import (
+    SpikeSourceArrayVertex)
+from spynnaker.pyNN.models.spike_source.spike_source_poisson_vertex import (
+    SpikeSourcePoissonVertex)
+
+
+class _Graph(object):
+    """ An application graph holding only the edges into the population
+    """
+
+    def __init__(self, edges):
+        self._edges = edges
+
+    def get_edges_ending_at_vertex(self, vertex):
+        return self._edges
+
+
+def _graph(n_edges, n_post_atoms, seed):
+    rng = numpy.random.RandomState(seed)
+    post_population = MockPopulation(n_post_atoms, "Post")
+    edges = list()
+    for i in range(n_edges):
+        n_atoms = int(rng.choice([10, 100, 1000]))
+        if i % 2:
+            rate = float(rng.choice([1.0, 5.0, 10.0, 50.0, 100.0]))
+            pre_vertex = SpikeSourcePoissonVertex(
+                n_atoms, None, "Poisson {}".format(i), rate=rate,
+                max_rate=rate, start=0, duration=None, seed=None,
+                max_atoms_per_core=256, model=None)
+        else:
+            pre_vertex = SpikeSourceArrayVertex(
+                n_atoms, [], None, "Array {}".format(i), 256, None)
+        connector = FixedProbabilityConnector(0.1)
+        connector.set_projection_information(
+            pre_population=MockPopulation(n_atoms, "Pre"),
+            post_population=post_population, rng=None,
+            machine_time_step=1000)
+        synapse_info = SynapseInformation(
+            connector, SynapseDynamicsStatic(), int(rng.randint(2)),
+            weight=rng.uniform(0.1, 2.0, 10),
+            delay=rng.randint(1, 16, 10).astype("float64"))
+        edges.append(ProjectionApplicationEdge(
+            pre_vertex, None, synapse_info))
+    return _Graph(edges)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--n-edges", type=int, default=5000,
+        help="the number of incoming projections (default: %(default)s)")
+    args = parser.parse_args()
+
+    simulator = MockSimulator.setup()
+    simulator.machine_time_step = 1000
+    graph = _graph(args.n_edges, 256, 1)
+    manager = SynapticManager(2, None, None, simulator.config)
+
+    def shifts():
+        return manager._get_ring_buffer_to_input_left_shifts(
+            None, graph, 1000, 1.0)
+
+    synaptic_manager._poisson_spikes_per_tick.clear()
+    first_time = timeit.timeit(shifts, number=1)
+    second_time = timeit.timeit(shifts, number=1)
+    print("{} edges, shifts {}".format(args.n_edges, list(shifts())))
+    print("first population {:.3f}s, next population {:.3f}s".format(
+        first_time, second_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+""" Time SynapseIORowBased._get_max_row_length_and_row_data against\
+    joining the synaptic rows one by one.
+
+The rows were joined one by one before they were written into one matrix.
+Both times include getting the row data from the synapse dynamics.
+"""
+from __future__ import print_function
+import argparse
+import timeit
+import numpy
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector)
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    SynapseDynamicsStatic, SynapseDynamicsSTDP)
+from spynnaker.pyNN.models.neuron.master_pop_table_generators import (
+    MasterPopTableAsBinarySearch)
+from spynnaker.pyNN.models.neuron.synapse_io import SynapseIORowBased
+from spynnaker.pyNN.models.neuron.plasticity.stdp.weight_dependence import (
+    WeightDependenceAdditive)
+from spynnaker.pyNN.models.neuron.plasticity.stdp.timing_dependence import (
+    TimingDependenceSpikePair)
+
+_N_HEADER_WORDS = 3
+
+
+def _connections(n_rows, n_post_atoms, p_connect, seed):
+    """ Make connections from every row to each post-neuron with the given\
+        probability, as a fixed probability connector would
+    """
+    rng = numpy.random.RandomState(seed)
+    n_per_row = rng.binomial(n_post_atoms, p_connect, n_rows)
+    connections = numpy.zeros(
+        numpy.sum(n_per_row), dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+    connections["source"] = numpy.repeat(numpy.arange(n_rows), n_per_row)
+    connections["target"] = rng.randint(0, n_post_atoms, len(connections))
+    connections["weight"] = rng.uniform(0, 1000, len(connections))
+    connections["delay"] = rng.randint(1, 16, len(connections))
+    connections["synapse_type"] = rng.randint(0, 2, len(connections))
+    return connections
+
+
+def _join_rows(
+        connections, n_rows, post_vertex_slice, population_table, dynamics):
+    """ Assemble the rows by joining the parts of each row, as the rows were\
+        assembled before they were written into one matrix
+    """
+    row_ids = range(n_rows)
+    if isinstance(dynamics, SynapseDynamicsStatic):
+        ff_data, ff_size = dynamics.get_static_synaptic_data(
+            connections, connections["source"], n_rows, post_vertex_slice, 2)
+        fp_data = [numpy.zeros(0, dtype="uint32") for _ in row_ids]
+        pp_data = [numpy.zeros(0, dtype="uint32") for _ in row_ids]
+        fp_size = [numpy.zeros(1, dtype="uint32") for _ in row_ids]
+        pp_size = [numpy.zeros(1, dtype="uint32") for _ in row_ids]
+    else:
+        ff_data = [numpy.zeros(0, dtype="uint32") for _ in row_ids]
+        ff_size = [numpy.zeros(1, dtype="uint32") for _ in row_ids]
+        fp_data, pp_data, fp_size, pp_size = \
+            dynamics.get_plastic_synaptic_data(
+                connections, connections["source"], n_rows,
+                post_vertex_slice, 2)
+
+    row_lengths = [
+        _N_HEADER_WORDS + pp_data[i].size + fp_data[i].size +
+        ff_data[i].size for i in row_ids]
+    max_length = max(row_lengths) - _N_HEADER_WORDS
+    max_row_length = population_table.get_allowed_row_length(max_length)
+    padding = [
+        numpy.zeros(
+            max_row_length - (row_length - _N_HEADER_WORDS), dtype="uint32")
+        for row_length in row_lengths]
+    items_to_join = [
+        pp_size, pp_data, ff_size, fp_size, ff_data, fp_data, padding]
+    rows = [numpy.concatenate(items) for items in zip(*items_to_join)]
+    return max_row_length, numpy.concatenate(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--n-rows", type=int, default=10000,
+        help="the number of pre-neurons (default: %(default)s)")
+    parser.add_argument(
+        "--n-post-atoms", type=int, default=256,
+        help="the number of post-neurons on the core (default: %(default)s)")
+    parser.add_argument(
+        "--p-connect", type=float, default=0.1,
+        help="the connection probability (default: %(default)s)")
+    parser.add_argument(
+        "--repeats", type=int, default=3,
+        help="the number of times to time each (default: %(default)s)")
+    args = parser.parse_args()
+
+    connections = _connections(
+        args.n_rows, args.n_post_atoms, args.p_connect, 1)
+    post_vertex_slice = Slice(0, args.n_post_atoms - 1)
+    population_table = MasterPopTableAsBinarySearch()
+    print("{} rows, {} connections".format(args.n_rows, len(connections)))
+
+    for name, dynamics in [
+            ("static", SynapseDynamicsStatic()),
+            ("STDP", SynapseDynamicsSTDP(
+                TimingDependenceSpikePair(), WeightDependenceAdditive()))]:
+
+        def matrix():
+            return SynapseIORowBased._get_max_row_length_and_row_data(
+                connections, connections["source"], args.n_rows,
+                post_vertex_slice, 2, population_table, dynamics, None, None)
+
+        def joined():
+            return _join_rows(
+                connections, args.n_rows, post_vertex_slice,
+                population_table, dynamics)
+
+        matrix_length, matrix_data = matrix()
+        joined_length, joined_data = joined()
+        assert matrix_length == joined_length
+        assert numpy.array_equal(matrix_data, joined_data)
+
+        matrix_time = min(timeit.repeat(matrix, number=1, repeat=args.repeats))
+        joined_time = min(timeit.repeat(joined, number=1, repeat=args.repeats))
+        print("{}: matrix {:.3f}s, joined rows {:.3f}s ({:.1f}x)".format(
+            name, matrix_time, joined_time, joined_time / matrix_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spinn_front_end_common.utility_models import CommandSender
 from spinn_front_end_common.utilities.utility_objs import ExecutableFinder
 from spinn_front_end_common.utilities import globals_variables
+from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
 from spynnaker.pyNN.models.utility_models import synapse_expander
 from spynnaker.pyNN import overridden_pacman_functions, model_binaries
 from spynnaker.pyNN.utilities import constants
@@ -287,6 +288,7 @@ class AbstractSpiNNakerCommon(AbstractSpinnakerBase,
         # pylint: disable=protected-access
         for population in self._populations:
             population._end()
+        self._delete_recorded_data_files()
 
         super(AbstractSpiNNakerCommon, self).stop(
             turn_off_machine, clear_routing_tables, clear_tags)
@@ -306,6 +308,21 @@ class AbstractSpiNNakerCommon(AbstractSpinnakerBase,
             projection._clear_cache()
         super(AbstractSpiNNakerCommon, self).run(run_time)
 
+    def reset(self):
+        """ Put the simulation back at time zero
+        """
+        self._delete_recorded_data_files()
+        super(AbstractSpiNNakerCommon, self).reset()
+
+    def _delete_recorded_data_files(self):
+        """ Delete the files that the populations' recorded data has been\
+            memory-mapped into
+        """
+        # pylint: disable=protected-access
+        for population in self._populations:
+            if isinstance(population._vertex, AbstractPopulationVertex):
+                population._vertex.delete_recorded_data_files()
+
     @property
     def time_scale_factor(self):
         """ The multiplicative scaling from application time to real\
@@ -18,3 +18,19 @@ class AbstractReadParametersBeforeSet(object):
         :param placement: the placement of a vertex
         :param vertex_slice: the slice of atoms for this vertex
         """
+
+    def read_all_parameters_from_machine(
+            self, transceiver, placements_and_slices, n_threads):
+        """ Read the parameters of all the cores of the vertex from the\
+            machine before any are changed
+
+        :param transceiver: the SpinnMan interface
+        :param placements_and_slices:\
+            the placement and slice of atoms of each machine vertex
+        :type placements_and_slices: list of (Placement, Slice)
+        :param n_threads:\
+            the maximum number of cores to read from at the same time
+        """
+        for placement, vertex_slice in placements_and_slices:
+            self.read_parameters_from_machine(
+                transceiver, placement, vertex_slice)
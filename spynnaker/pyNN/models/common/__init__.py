@@ -5,11 +5,13 @@ from .neuron_recorder import NeuronRecorder
 from .multi_spike_recorder import MultiSpikeRecorder
 from .recording_utils import (
     get_buffer_sizes, get_data, get_recording_region_size_in_bytes,
-    needs_buffering, pull_off_cached_lists)
+    needs_buffering, pull_off_cached_lists, read_spikes_file,
+    write_spikes_file)
 from .simple_population_settable import SimplePopulationSettable
 
 __all__ = ["AbstractNeuronRecordable", "AbstractSpikeRecordable",
            "EIEIOSpikeRecorder", "NeuronRecorder", "MultiSpikeRecorder",
            "SimplePopulationSettable", "get_buffer_sizes", "get_data",
            "needs_buffering", "get_recording_region_size_in_bytes",
-           "pull_off_cached_lists", ]
+           "pull_off_cached_lists", "read_spikes_file", "write_spikes_file",
+           ]
@@ -1,5 +1,6 @@
 from six import add_metaclass
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
+from .recording_utils import write_spikes_file
 
 
 @add_metaclass(AbstractBase)
@@ -55,6 +56,45 @@ class AbstractSpikeRecordable(object):
             ordered by time
         """
 
+    def iter_spikes(
+            self, placements, graph_mapper, buffer_manager, machine_time_step):
+        """ Get the recorded spikes from the object in chunks, so that they\
+            need not all be in memory at once.
+
+        By default this gives everything from :py:meth:`get_spikes` as a\
+        single chunk; objects that can read their spikes a part at a time\
+        should override it.
+
+        :param placements: the placements object
+        :param graph_mapper: the graph mapper object
+        :param buffer_manager: the buffer manager object
+        :param machine_time_step: the time step of the simulation
+        :return: an iterable of (neuron IDs, spike times) numpy arrays, each\
+            chunk sorted by ID and then time, but not sorted across chunks
+        """
+        spikes = self.get_spikes(
+            placements, graph_mapper, buffer_manager, machine_time_step)
+        if len(spikes):
+            yield spikes[:, 0], spikes[:, 1]
+
+    def write_spikes(
+            self, filename, placements, graph_mapper, buffer_manager,
+            machine_time_step):
+        """ Write the recorded spikes from the object to disk, one chunk of\
+            :py:meth:`iter_spikes` at a time.
+
+        :param filename: the base name of the files to write; see\
+            :py:func:`~spynnaker.pyNN.models.common.read_spikes_file`
+        :param placements: the placements object
+        :param graph_mapper: the graph mapper object
+        :param buffer_manager: the buffer manager object
+        :param machine_time_step: the time step of the simulation
+        :return: the number of spikes written
+        :rtype: int
+        """
+        return write_spikes_file(filename, self.iter_spikes(
+            placements, graph_mapper, buffer_manager, machine_time_step))
+
     @abstractmethod
     def get_spikes_sampling_interval(self):
         """ Return the current sampling interval for spikes
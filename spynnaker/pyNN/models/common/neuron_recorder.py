@@ -5,6 +5,7 @@ except ImportError:
     from collections import OrderedDict
 import logging
 import math
+import os
 import numpy
 from six import raise_from, iteritems
 from six.moves import range, xrange
@@ -15,9 +16,11 @@ from data_specification.enums import DataType
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spinn_front_end_common.utilities import globals_variables
 from spynnaker.pyNN.models.neural_properties import NeuronParameter
+from .recording_utils import read_spikes_file, write_spikes_file
 
 logger = logging.getLogger(__name__)
 SPIKES = "spikes"
+MATRIX_INDEX_SUFFIX = ".index.npz"
 
 
 class NeuronRecorder(object):
@@ -61,6 +64,15 @@ class NeuronRecorder(object):
                 recording.append(index)
         return recording
 
+    def get_n_neurons_recording(self, variable, vertex_slice):
+        """ Get the number of neurons of a slice that record a variable
+
+        :param variable: PyNN name of the variable
+        :param vertex_slice: the slice of neurons
+        :rtype: int
+        """
+        return self._count_recording_per_slice(variable, vertex_slice)
+
     def get_neuron_sampling_interval(self, variable):
         """ Return the current sampling interval for this variable
 
@@ -72,7 +84,8 @@ class NeuronRecorder(object):
 
     def get_matrix_data(
             self, label, buffer_manager, region, placements, graph_mapper,
-            application_vertex, variable, n_machine_time_steps):
+            application_vertex, variable, n_machine_time_steps,
+            filename=None):
         """ Read a uint32 mapped to time and neuron IDs from the SpiNNaker\
             machine.
 
@@ -86,28 +99,46 @@ class NeuronRecorder(object):
         :param variable: PyNN name for the variable (V, gsy_inh etc.)
         :type variable: str
         :param n_machine_time_steps:
-        :return:
+        :param filename: \
+            if not None, the data is written to a memory-mapped .npy file of\
+            this name instead of being held in memory, with the neuron IDs\
+            and sampling interval alongside; see\
+            :py:meth:`read_matrix_data`
+        :return: (data, neuron IDs, sampling interval)
         """
         if variable == SPIKES:
             msg = "Variable {} is not supported use get_spikes".format(SPIKES)
             raise ConfigurationException(msg)
         vertices = graph_mapper.get_machine_vertices(application_vertex)
-        progress = ProgressBar(
-            vertices, "Getting {} for {}".format(variable, label))
         sampling_rate = self._sampling_rates[variable]
         expected_rows = int(math.ceil(
             n_machine_time_steps / sampling_rate))
-        missing_str = ""
-        data = None
+
+        # Work out which neurons each core records so that the result can
+        # be allocated once up front
+        vertex_neurons = list()
         indexes = []
-        for vertex in progress.over(vertices):
+        for vertex in vertices:
+            neurons = self._neurons_recording(
+                variable, graph_mapper.get_slice(vertex))
+            if len(neurons) > 0:
+                vertex_neurons.append((vertex, len(indexes), len(neurons)))
+                indexes.extend(neurons)
+        data = None
+        if len(indexes) == 0:
+            filename = None
+        elif filename is not None:
+            data = numpy.lib.format.open_memmap(
+                filename, mode="w+", dtype="float64",
+                shape=(expected_rows, len(indexes)))
+        else:
+            data = numpy.empty((expected_rows, len(indexes)))
+
+        progress = ProgressBar(
+            vertex_neurons, "Getting {} for {}".format(variable, label))
+        missing_str = ""
+        for vertex, first_column, n_neurons in progress.over(vertex_neurons):
             placement = placements.get_placement_of_vertex(vertex)
-            vertex_slice = graph_mapper.get_slice(vertex)
-            neurons = self._neurons_recording(variable, vertex_slice)
-            n_neurons = len(neurons)
-            if n_neurons == 0:
-                continue
-            indexes.extend(neurons)
             # for buffering output info is taken form the buffer manager
             record_raw, missing_data = buffer_manager.get_data_by_placement(
                     placement, region)
@@ -123,48 +154,92 @@ class NeuronRecorder(object):
                 record = (numpy.asarray(record_raw, dtype="uint8").
                           view(dtype="<i4")).reshape((n_rows, (n_neurons + 1)))
             else:
-                record = numpy.empty((0, n_neurons))
+                record = numpy.empty((0, n_neurons + 1), dtype="<i4")
+            fragment = data[:, first_column:first_column + n_neurons]
             # Check if you have the expected data
             if not missing_data and n_rows == expected_rows:
                 # Just cut the timestamps off to get the fragment
-                fragment = (record[:, 1:] / float(DataType.S1615.scale))
+                fragment[:] = record[:, 1:] / float(DataType.S1615.scale)
             else:
                 missing_str += "({}, {}, {}); ".format(
                     placement.x, placement.y, placement.p)
-                # Start the fragment for this slice empty
-                fragment = numpy.empty((expected_rows, n_neurons))
-                for i in xrange(0, expected_rows):
-                    time = i * sampling_rate
-                    # Check if there is data for this timestep
-                    local_indexes = numpy.where(record[:, 0] == time)
-                    if len(local_indexes[0]) == 1:
-                        fragment[i] = (record[local_indexes[0], 1:] /
-                                       float(DataType.S1615.scale))
-                    elif len(local_indexes[0]) > 1:
-                        logger.warning(
-                            "Population {} on multiple recorded data for "
-                            "time {}".format(label, time))
-                    else:
-                        # Set row to nan
-                        fragment[i] = numpy.full(n_neurons, numpy.nan)
-            if data is None:
-                data = fragment
-            else:
-                # Add the slice fragment on axis 1 which is IDs/channel_index
-                data = numpy.append(data, fragment, axis=1)
+                self._fill_fragment(
+                    label, fragment, record, sampling_rate, expected_rows)
         if len(missing_str) > 0:
             logger.warning(
                 "Population {} is missing recorded data in region {} from the"
                 " following cores: {}".format(label, region, missing_str))
         sampling_interval = self.get_neuron_sampling_interval(variable)
+        if filename is not None:
+            data.flush()
+            numpy.savez(
+                filename + MATRIX_INDEX_SUFFIX, indexes=indexes,
+                sampling_interval=sampling_interval)
         return (data, indexes, sampling_interval)
 
-    def get_spikes(
+    @staticmethod
+    def read_matrix_data(filename):
+        """ Map data written by :py:meth:`get_matrix_data` back into memory.
+
+        :param filename: the name of the .npy file written
+        :return: \
+            (data, neuron IDs, sampling interval), where the data is a\
+            read-only memory-mapped array
+        """
+        with numpy.load(filename + MATRIX_INDEX_SUFFIX) as index:
+            indexes = list(index["indexes"])
+            sampling_interval = float(index["sampling_interval"])
+        data = numpy.load(filename, mmap_mode="r")
+        return (data, indexes, sampling_interval)
+
+    @staticmethod
+    def delete_matrix_data(filename):
+        """ Delete data written by :py:meth:`get_matrix_data`.
+
+        :param filename: the name of the .npy file written
+        """
+        for name in (filename, filename + MATRIX_INDEX_SUFFIX):
+            if os.path.exists(name):
+                os.remove(name)
+
+    @staticmethod
+    def _fill_fragment(label, fragment, record, sampling_rate, expected_rows):
+        """ Put the rows of a record into a fragment by their timestamp,\
+            leaving NaN for any time that is missing or recorded more than\
+            once.
+        """
+        fragment[:] = numpy.nan
+        times = record[:, 0]
+        valid = ((times >= 0) & (times % sampling_rate == 0) &
+                 (times < expected_rows * sampling_rate))
+        rows = times[valid] // sampling_rate
+        counts = numpy.bincount(rows, minlength=expected_rows)
+        single = counts[rows] == 1
+        fragment[rows[single]] = (
+            record[valid][single, 1:] / float(DataType.S1615.scale))
+        for row in numpy.flatnonzero(counts > 1):
+            logger.warning(
+                "Population {} on multiple recorded data for "
+                "time {}".format(label, row * sampling_rate))
+
+    def iter_spikes(
             self, label, buffer_manager, region, placements, graph_mapper,
             application_vertex, machine_time_step):
+        """ Read the spikes recorded on each core, one core at a time.
 
-        spike_times = list()
-        spike_ids = list()
+        :param label: vertex label
+        :param buffer_manager: the manager for buffered data
+        :param region: the DSG region ID used for this data
+        :param placements: the placements object
+        :param graph_mapper: \
+            the mapping between application and machine vertices
+        :param application_vertex:
+        :param machine_time_step: the time step of the simulation in \
+            microseconds
+        :return: \
+            an iterable of (neuron IDs, spike times) numpy arrays, one pair\
+            per core that recorded spikes, each sorted by ID and then time
+        """
         ms_per_tick = machine_time_step / 1000.0
 
         vertices = graph_mapper.get_machine_vertices(application_vertex)
@@ -175,13 +250,14 @@ class NeuronRecorder(object):
             placement = placements.get_placement_of_vertex(vertex)
             vertex_slice = graph_mapper.get_slice(vertex)
 
+            neurons = None
             if self._indexes[SPIKES] is None:
                 neurons_recording = vertex_slice.n_atoms
             else:
-                neurons_recording = sum(
-                    (index >= vertex_slice.lo_atom and
-                     index <= vertex_slice.hi_atom)
-                    for index in self._indexes[SPIKES])
+                neurons = numpy.array(
+                    self._neurons_recording(SPIKES, vertex_slice),
+                    dtype="uint32")
+                neurons_recording = len(neurons)
                 if neurons_recording == 0:
                     continue
             # Read the spikes
@@ -195,42 +271,88 @@ class NeuronRecorder(object):
             if data_missing:
                 missing_str += "({}, {}, {}); ".format(
                     placement.x, placement.y, placement.p)
-            if len(record_raw) > 0:
-                raw_data = (numpy.asarray(record_raw, dtype="uint8").
-                            view(dtype="<i4")).reshape(
-                    [-1, n_words_with_timestamp])
+            if len(record_raw) == 0:
+                continue
+            raw_data = (numpy.asarray(record_raw, dtype="uint8").
+                        view(dtype="<i4")).reshape(
+                [-1, n_words_with_timestamp])
+            record_time = raw_data[:, 0] * float(ms_per_tick)
+            spikes = raw_data[:, 1:].byteswap().view("uint8")
+            bits = numpy.fliplr(numpy.unpackbits(spikes).reshape(
+                (-1, 32))).reshape((-1, n_bytes * 8))
+            time_indices, local_indices = numpy.where(bits == 1)
+            if neurons is None:
+                indices = local_indices + vertex_slice.lo_atom
             else:
-                raw_data = record_raw
-            if len(raw_data) > 0:
-                record_time = raw_data[:, 0] * float(ms_per_tick)
-                spikes = raw_data[:, 1:].byteswap().view("uint8")
-                bits = numpy.fliplr(numpy.unpackbits(spikes).reshape(
-                    (-1, 32))).reshape((-1, n_bytes * 8))
-                time_indices, local_indices = numpy.where(bits == 1)
-                if self._indexes[SPIKES] is None:
-                    indices = local_indices + vertex_slice.lo_atom
-                    times = record_time[time_indices].reshape((-1))
-                    spike_ids.extend(indices)
-                    spike_times.extend(times)
-                else:
-                    neurons = self._neurons_recording(SPIKES, vertex_slice)
-                    n_neurons = len(neurons)
-                    for time_indice, local in zip(time_indices, local_indices):
-                        if local < n_neurons:
-                            spike_ids.append(neurons[local])
-                            spike_times.append(record_time[time_indice])
+                # Ignore the padding bits beyond the last recorded neuron
+                in_range = local_indices < neurons_recording
+                time_indices = time_indices[in_range]
+                indices = neurons[local_indices[in_range]]
+            if len(indices) == 0:
+                continue
+
+            # numpy.where gives time order, so a stable sort on ID is enough
+            order = numpy.argsort(indices, kind="mergesort")
+            yield indices[order], record_time[time_indices[order]]
 
         if len(missing_str) > 0:
             logger.warn(
                 "Population {} is missing spike data in region {} from the"
                 " following cores: {}".format(label, region, missing_str))
 
+    def get_spikes(
+            self, label, buffer_manager, region, placements, graph_mapper,
+            application_vertex, machine_time_step):
+        """ Read all the recorded spikes.
+
+        :return: a matrix of (neuron ID, spike time) sorted by ID and time
+        :rtype: numpy.ndarray
+        """
+        spike_ids = list()
+        spike_times = list()
+        for ids, times in self.iter_spikes(
+                label, buffer_manager, region, placements, graph_mapper,
+                application_vertex, machine_time_step):
+            spike_ids.append(ids)
+            spike_times.append(times)
+
         if len(spike_ids) == 0:
             return numpy.zeros((0, 2), dtype="float")
 
+        spike_ids = numpy.concatenate(spike_ids)
+        spike_times = numpy.concatenate(spike_times)
         result = numpy.column_stack((spike_ids, spike_times))
         return result[numpy.lexsort((spike_times, spike_ids))]
 
+    def write_spikes(
+            self, filename, label, buffer_manager, region, placements,
+            graph_mapper, application_vertex, machine_time_step):
+        """ Write the recorded spikes to disk one core at a time, without\
+            holding all the spikes in memory.
+
+        The neuron IDs are written to ``filename.ids`` as little-endian\
+        uint32 and the spike times in milliseconds to ``filename.times`` as\
+        little-endian float64.  The spikes are sorted by ID and time within\
+        each core but not across cores; use :py:meth:`read_spikes_file` to\
+        read them back.
+
+        :param filename: the base name of the files to write
+        :return: the number of spikes written
+        :rtype: int
+        """
+        return write_spikes_file(filename, self.iter_spikes(
+            label, buffer_manager, region, placements, graph_mapper,
+            application_vertex, machine_time_step))
+
+    @staticmethod
+    def read_spikes_file(filename):
+        """ Map spikes written by :py:meth:`write_spikes` back into memory.
+
+        :param filename: the base name of the files written
+        :return: (neuron IDs, spike times) as read-only memory-mapped arrays
+        """
+        return read_spikes_file(filename)
+
     def get_recordable_variables(self):
         return self._sampling_rates.keys()
 
@@ -1,5 +1,6 @@
 from __future__ import division
 import logging
+import os
 import struct
 import numpy
 from spinn_front_end_common.utilities.helpful_functions import (
@@ -8,6 +9,8 @@ from spynnaker.pyNN.exceptions import MemReadException
 
 logger = logging.getLogger(__name__)
 _RECORDING_COUNT = struct.Struct("<I")
+SPIKE_IDS_SUFFIX = ".ids"
+SPIKE_TIMES_SUFFIX = ".times"
 
 
 def get_recording_region_size_in_bytes(
@@ -98,3 +101,40 @@ def make_missing_string(missing):
             separator, placement.x, placement.y, placement.p)
         separator = "; "
     return missing_str
+
+
+def write_spikes_file(filename, spikes):
+    """ Write spikes to disk one chunk at a time, without holding all the\
+        spikes in memory.
+
+    The neuron IDs are written to ``filename.ids`` as little-endian uint32\
+    and the spike times in milliseconds to ``filename.times`` as\
+    little-endian float64, in the order of the chunks.
+
+    :param filename: the base name of the files to write
+    :param spikes: an iterable of (neuron IDs, spike times) numpy arrays
+    :return: the number of spikes written
+    :rtype: int
+    """
+    n_spikes = 0
+    with open(filename + SPIKE_IDS_SUFFIX, "wb") as ids_file, \
+            open(filename + SPIKE_TIMES_SUFFIX, "wb") as times_file:
+        for ids, times in spikes:
+            numpy.asarray(ids).astype("<u4").tofile(ids_file)
+            numpy.asarray(times).astype("<f8").tofile(times_file)
+            n_spikes += len(ids)
+    return n_spikes
+
+
+def read_spikes_file(filename):
+    """ Map spikes written by :py:func:`write_spikes_file` back into memory.
+
+    :param filename: the base name of the files written
+    :return: (neuron IDs, spike times) as read-only memory-mapped arrays
+    """
+    ids_file = filename + SPIKE_IDS_SUFFIX
+    times_file = filename + SPIKE_TIMES_SUFFIX
+    if os.path.getsize(ids_file) == 0:
+        return (numpy.zeros(0, dtype="<u4"), numpy.zeros(0, dtype="<f8"))
+    return (numpy.memmap(ids_file, dtype="<u4", mode="r"),
+            numpy.memmap(times_file, dtype="<f8", mode="r"))
@@ -37,6 +37,8 @@ class AbstractConnector(object):
         "_n_clipped_delays",
         "_n_post_neurons",
         "_n_pre_neurons",
+        "_post_positions",
+        "_pre_positions",
         "_rng",
         "_safe",
         "_space",
@@ -52,6 +54,8 @@ class AbstractConnector(object):
         self._post_population = None
         self._n_pre_neurons = None
         self._n_post_neurons = None
+        self._pre_positions = None
+        self._post_positions = None
         self._rng = rng
 
         self._n_clipped_delays = 0
@@ -71,12 +75,71 @@ class AbstractConnector(object):
         self._post_population = post_population
         self._n_pre_neurons = pre_population.size
         self._n_post_neurons = post_population.size
+        self._pre_positions = None
+        self._post_positions = None
         if self._rng is None and rng is not None:
             self._rng = rng
         if self._rng is None:
             self._rng = get_simulator().get_pynn_NumpyRNG()
         self._min_delay = machine_time_step / 1000.0
 
+    def _get_positions(self):
+        """ Get the positions of the pre- and post-neurons, reading them from\
+            the populations only once
+
+        :return: (pre-positions, post-positions), each of shape (3, n)
+        """
+        if self._pre_positions is None:
+            self._pre_positions = self._pre_population.positions
+            self._post_positions = self._post_population.positions
+        return self._pre_positions, self._post_positions
+
+    def _get_space_offset(self):
+        """ Get the offset that the space adds to the post-positions, as an\
+            array of shape (3, 1)
+        """
+        return numpy.reshape(
+            getattr(self._space, "offset", 0.0), (-1, 1)) * numpy.ones((3, 1))
+
+    def _transform_post_positions(self, post_positions):
+        """ Move and scale post-positions as the space does before finding\
+            their distance from pre-positions
+
+        :param post_positions: The positions, of shape (3, n)
+        :return: The transformed positions, of shape (3, n)
+        """
+        return getattr(self._space, "scale_factor", 1.0) * (
+            post_positions + self._get_space_offset())
+
+    def _get_distances(self, sources, targets, expand_distances):
+        """ Get the distances between each of a set of pairs of neurons
+
+        :param sources: The pre-neuron of each pair
+        :param targets: The post-neuron of each pair
+        :param expand_distances: \
+            True to get the distance along each axis rather than the total\
+            distance
+        :return: \
+            The distance of each pair, or an array of the distances along\
+            each axis if expand_distances
+        """
+        pre_positions, post_positions = self._get_positions()
+        n_pairs = len(sources)
+
+        # The space scales and moves the post-positions before finding the
+        # difference, so do that here to find the difference of each pair;
+        # the distance of each pair is then the distance of the difference
+        # from the point that the space moves to the origin
+        offset = self._get_space_offset()
+        differences = (
+            pre_positions[:, numpy.asarray(sources, dtype="int64")] -
+            self._transform_post_positions(
+                post_positions[:, numpy.asarray(targets, dtype="int64")]))
+        d = self._space.distances(differences, -offset, expand_distances)
+        if expand_distances:
+            return numpy.reshape(d, (-1, n_pairs))
+        return numpy.reshape(d, n_pairs)
+
     def _check_parameter(self, values, name, allow_lists):
         """ Check that the types of the values is supported.
         """
@@ -244,43 +307,69 @@ class AbstractConnector(object):
         regexpr = re.compile(r'.*d\[\d*\].*')
         return regexpr.match(d_expression)
 
-    def _generate_values(self, values, n_connections, connection_slices):
+    def _generate_values(
+            self, values, n_connections, connection_slices, sources=None,
+            targets=None):
+        """ Generate a value for each connection.
+
+        :param values: The values to generate from
+        :param n_connections: The number of connections
+        :param connection_slices: \
+            The slices of a list of values that give the connections
+        :param sources: \
+            The pre-neuron of each connection; needed if the values depend\
+            on distance
+        :param targets: \
+            The post-neuron of each connection; needed if the values depend\
+            on distance
+        """
+        # pylint: disable=too-many-arguments
         if get_simulator().is_a_pynn_random(values):
             if n_connections == 1:
                 return numpy.array([values.next(n_connections)],
                                    dtype="float64")
             return values.next(n_connections)
-        elif numpy.isscalar(values):
-            return numpy.repeat([values], n_connections).astype("float64")
-        elif hasattr(values, "__getitem__"):
-            return numpy.concatenate([
-                values[connection_slice]
-                for connection_slice in connection_slices]).astype("float64")
         elif isinstance(values, string_types) or callable(values):
             if self._space is None:
                 raise Exception(
                     "No space object specified in projection {}-{}".format(
                         self._pre_population, self._post_population))
+            if sources is None or targets is None:
+                raise Exception(
+                    "Distance dependent values need the connections in"
+                    " projection {}-{}".format(
+                        self._pre_population, self._post_population))
+            if n_connections == 0:
+                return numpy.zeros(0, dtype="float64")
 
             expand_distances = True
             if isinstance(values, string_types):
                 expand_distances = self._expand_distances(values)
 
-            d = self._space.distances(
-                self._pre_population.positions,
-                self._post_population.positions,
-                expand_distances)
+            d = self._get_distances(sources, targets, expand_distances)
 
+            generated = numpy.empty(n_connections, dtype="float64")
             if isinstance(values, string_types):
-                return _expr_context.eval(values)
-            return values(d)
+                generated[:] = _expr_context.eval(values, d=d)
+            else:
+                generated[:] = values(d)
+            return generated
+        elif numpy.isscalar(values):
+            return numpy.repeat([values], n_connections).astype("float64")
+        elif hasattr(values, "__getitem__"):
+            return numpy.concatenate([
+                values[connection_slice]
+                for connection_slice in connection_slices]).astype("float64")
         raise Exception("what on earth are you giving me?")
 
-    def _generate_weights(self, values, n_connections, connection_slices):
+    def _generate_weights(
+            self, values, n_connections, connection_slices, sources=None,
+            targets=None):
         """ Generate weight values.
         """
+        # pylint: disable=too-many-arguments
         weights = self._generate_values(
-            values, n_connections, connection_slices)
+            values, n_connections, connection_slices, sources, targets)
         if self._safe:
             if not weights.size:
                 logger_utils.warn_once(logger,
@@ -310,12 +399,14 @@ class AbstractConnector(object):
                 delays[delays < self._min_delay] = self._min_delay
         return delays
 
-    def _generate_delays(self, values, n_connections, connection_slices):
+    def _generate_delays(
+            self, values, n_connections, connection_slices, sources=None,
+            targets=None):
         """ Generate valid delay values.
         """
-
+        # pylint: disable=too-many-arguments
         delays = self._generate_values(
-            values, n_connections, connection_slices)
+            values, n_connections, connection_slices, sources, targets)
 
         return self._clip_delays(delays)
 
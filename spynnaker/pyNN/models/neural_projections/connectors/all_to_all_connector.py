@@ -104,9 +104,11 @@ class AllToAllConnector(AbstractGenerateConnectorOnMachine):
                 post_vertex_slice.lo_atom, post_vertex_slice.hi_atom + 1),
                 pre_vertex_slice.n_atoms)
         block["weight"] = self._generate_weights(
-            weights, n_connections, connection_slices)
+            weights, n_connections, connection_slices,
+            block["source"], block["target"])
         block["delay"] = self._generate_delays(
-            delays, n_connections, connection_slices)
+            delays, n_connections, connection_slices,
+            block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
@@ -93,9 +93,11 @@ class ArrayConnector(AbstractConnector):
         block["source"] = pre_neurons
         block["target"] = post_neurons
         block["weight"] = self._generate_weights(
-            weights, n_connections, None)
+            weights, n_connections, None,
+            block["source"], block["target"])
         block["delay"] = self._generate_delays(
-            delays, n_connections, None)
+            delays, n_connections, None,
+            block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
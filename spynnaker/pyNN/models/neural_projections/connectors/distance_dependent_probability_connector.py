@@ -1,3 +1,4 @@
+from collections import OrderedDict
 import logging
 import math
 import numpy
@@ -25,7 +26,16 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
     __slots__ = [
         "_allow_self_connections",
         "_d_expression",
-        "_probs"]
+        "_max_prob",
+        "_post_slice_max_probs",
+        "_prob_blocks"]
+
+    # The number of blocks of probabilities to keep
+    MAX_CACHED_BLOCKS = 4
+
+    # The largest number of probabilities to compute at once when scanning
+    # for the maximum probability
+    MAX_SCAN_BLOCK_SIZE = 1024 * 1024
 
     def __init__(
             self, d_expression, allow_self_connections=True, safe=True,
@@ -55,6 +65,9 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
             safe, verbose)
         self._d_expression = d_expression
         self._allow_self_connections = allow_self_connections
+        self._max_prob = None
+        self._post_slice_max_probs = dict()
+        self._prob_blocks = OrderedDict()
 
         if n_connections is not None:
             raise NotImplementedError(
@@ -66,14 +79,19 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
             self, pre_population, post_population, rng, machine_time_step):
         AbstractConnector.set_projection_information(
             self, pre_population, post_population, rng, machine_time_step)
-        self._set_probabilities()
+        self._max_prob = None
+        self._post_slice_max_probs = dict()
+        self._prob_blocks = OrderedDict()
 
-    def _set_probabilities(self):
-        # Set the probabilities up-front for now
-        # TODO: Work out how this can be done statistically
+    def _compute_probabilities(self, pre_lo, pre_hi, post_lo, post_hi):
+        """ Evaluate the probability of connecting each of the pre-neurons\
+            from pre_lo to pre_hi (exclusive) to each of the post-neurons\
+            from post_lo to post_hi (exclusive)
+        """
         expand_distances = self._expand_distances(self._d_expression)
-        pre_positions = self._pre_population.positions
-        post_positions = self._post_population.positions
+        pre_positions, post_positions = self._get_positions()
+        pre_positions = pre_positions[:, pre_lo:pre_hi]
+        post_positions = post_positions[:, post_lo:post_hi]
 
         d1 = self._space.distances(
             pre_positions, post_positions, expand_distances)
@@ -81,13 +99,68 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
         # PyNN 0.8 returns a flattened (C-style) array from space.distances,
         # so the easiest thing to do here is to reshape back to the "expected"
         # PyNN 0.7 shape; otherwise later code gets confusing and difficult
+        shape = (pre_hi - pre_lo, post_hi - post_lo)
         if (len(d1.shape) == 1):
-            d = numpy.reshape(d1, (pre_positions.shape[0],
-                                   post_positions.shape[0]))
+            d = numpy.reshape(d1, shape)
         else:
             d = d1
 
-        self._probs = _d_expr_context.eval(self._d_expression, d=d)
+        return numpy.broadcast_to(
+            _d_expr_context.eval(self._d_expression, d=d), shape)
+
+    def _get_probabilities(self, pre_vertex_slice, post_vertex_slice):
+        """ Get the probabilities of connection between a pair of slices,\
+            keeping the most recently used blocks in case they are needed\
+            again
+        """
+        key = (pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom,
+               post_vertex_slice.lo_atom, post_vertex_slice.hi_atom)
+        probs = self._prob_blocks.pop(key, None)
+        if probs is None:
+            probs = self._compute_probabilities(
+                pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom + 1,
+                post_vertex_slice.lo_atom, post_vertex_slice.hi_atom + 1)
+            while len(self._prob_blocks) >= self.MAX_CACHED_BLOCKS:
+                self._prob_blocks.popitem(last=False)
+        self._prob_blocks[key] = probs
+        return probs
+
+    def _scan_max_probability(self, post_lo, post_hi):
+        """ Find the largest probability of connection from any pre-neuron\
+            to the post-neurons from post_lo to post_hi (exclusive), a block\
+            of pre-neurons at a time
+        """
+        n_post = post_hi - post_lo
+        n_pre_per_block = max(1, self.MAX_SCAN_BLOCK_SIZE // max(1, n_post))
+        max_prob = -numpy.inf
+        for pre_lo in range(0, self._n_pre_neurons, n_pre_per_block):
+            pre_hi = min(pre_lo + n_pre_per_block, self._n_pre_neurons)
+            max_prob = max(max_prob, numpy.amax(self._compute_probabilities(
+                pre_lo, pre_hi, post_lo, post_hi)))
+        return max_prob
+
+    def _get_max_probability(self, post_vertex_slice=None):
+        """ Get the largest probability of connection to a slice of\
+            post-neurons, or to any post-neuron if the slice is None
+        """
+        if post_vertex_slice is None:
+            if self._max_prob is None:
+                n_post_per_block = max(
+                    1, self.MAX_SCAN_BLOCK_SIZE // max(
+                        1, self._n_pre_neurons))
+                self._max_prob = max(
+                    self._scan_max_probability(
+                        post_lo, min(post_lo + n_post_per_block,
+                                     self._n_post_neurons))
+                    for post_lo in range(
+                        0, self._n_post_neurons, n_post_per_block))
+            return self._max_prob
+
+        key = (post_vertex_slice.lo_atom, post_vertex_slice.hi_atom)
+        if key not in self._post_slice_max_probs:
+            self._post_slice_max_probs[key] = self._scan_max_probability(
+                post_vertex_slice.lo_atom, post_vertex_slice.hi_atom + 1)
+        return self._post_slice_max_probs[key]
 
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self, delays):
@@ -96,14 +169,13 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
             utility_calls.get_probable_maximum_selected(
                 self._n_pre_neurons * self._n_post_neurons,
                 self._n_pre_neurons * self._n_post_neurons,
-                numpy.amax(self._probs)))
+                self._get_max_probability()))
 
     @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
     def get_n_connections_from_pre_vertex_maximum(
             self, delays, post_vertex_slice, min_delay=None, max_delay=None):
         # pylint: disable=too-many-arguments
-        max_prob = numpy.amax(
-            self._probs[0:self._n_pre_neurons, post_vertex_slice.as_slice])
+        max_prob = self._get_max_probability(post_vertex_slice)
         n_connections = utility_calls.get_probable_maximum_selected(
             self._n_pre_neurons * self._n_post_neurons,
             post_vertex_slice.n_atoms, max_prob)
@@ -120,7 +192,7 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
         # pylint: disable=too-many-arguments
         return utility_calls.get_probable_maximum_selected(
             self._n_pre_neurons * self._n_post_neurons, self._n_post_neurons,
-            numpy.amax(self._probs))
+            self._get_max_probability())
 
     @overrides(AbstractConnector.get_weight_maximum)
     def get_weight_maximum(self, weights):
@@ -130,7 +202,7 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
             utility_calls.get_probable_maximum_selected(
                 self._n_pre_neurons * self._n_post_neurons,
                 self._n_pre_neurons * self._n_post_neurons,
-                numpy.amax(self._probs)))
+                self._get_max_probability()))
 
     @overrides(AbstractConnector.create_synaptic_block)
     def create_synaptic_block(
@@ -138,8 +210,8 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
             post_slice_index, pre_vertex_slice, post_vertex_slice,
             synapse_type):
 
-        probs = self._probs[
-            pre_vertex_slice.as_slice, post_vertex_slice.as_slice].reshape(-1)
+        probs = self._get_probabilities(
+            pre_vertex_slice, post_vertex_slice).reshape(-1)
         n_items = pre_vertex_slice.n_atoms * post_vertex_slice.n_atoms
         items = self._rng.next(n_items)
 
@@ -159,9 +231,11 @@ class DistanceDependentProbabilityConnector(AbstractConnector):
         block["target"] = (
             (ids % post_vertex_slice.n_atoms) + post_vertex_slice.lo_atom)
         block["weight"] = self._generate_weights(
-            weights, n_connections, None)
+            weights, n_connections, None,
+            block["source"], block["target"])
         block["delay"] = self._generate_delays(
-            delays, n_connections, None)
+            delays, n_connections, None,
+            block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
@@ -198,9 +198,11 @@ class FixedNumberPostConnector(AbstractConnector):
         block["source"] = pre_neurons_in_slice
         block["target"] = post_neurons_in_slice
         block["weight"] = self._generate_weights(
-            weights, n_connections, None)
+            weights, n_connections, None,
+            block["source"], block["target"])
         block["delay"] = self._generate_delays(
-            delays, n_connections, None)
+            delays, n_connections, None,
+            block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
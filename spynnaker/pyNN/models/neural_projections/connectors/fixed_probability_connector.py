@@ -16,11 +16,16 @@ class FixedProbabilityConnector(AbstractGenerateConnectorOnMachine):
 
     __slots__ = [
         "_allow_self_connections",
-        "_p_connect"]
+        "_p_connect",
+        "_sparse"]
+
+    # The largest probability for which connections are generated sparsely
+    # when sparse is None
+    SPARSE_P_CONNECT_MAX = 0.05
 
     def __init__(
             self, p_connect, allow_self_connections=True, safe=True,
-            verbose=False):
+            verbose=False, sparse=False):
         """
         :param p_connect:
             a float between zero and one. Each potential connection is created\
@@ -34,10 +39,20 @@ class FixedProbabilityConnector(AbstractGenerateConnectorOnMachine):
         :param `pyNN.Space` space:
             a Space object, needed if you wish to specify distance-dependent\
             weights or delays - not implemented
+        :param sparse:
+            if True, generate the connections by skipping ahead between the\
+            connections made, so that the time taken depends on the number\
+            of connections rather than the number of possible connections;\
+            if False (the default), draw a random number for each possible\
+            connection; if None, generate sparsely when p_connect is at most\
+            SPARSE_P_CONNECT_MAX.  The two modes make different connections\
+            from the same random seed.
+        :type sparse: bool or None
         """
         super(FixedProbabilityConnector, self).__init__(safe, verbose)
         self._p_connect = p_connect
         self._allow_self_connections = allow_self_connections
+        self._sparse = sparse
 
         if not 0 <= self._p_connect <= 1:
             raise ConfigurationException(
@@ -93,16 +108,23 @@ class FixedProbabilityConnector(AbstractGenerateConnectorOnMachine):
             synapse_type):
         # pylint: disable=too-many-arguments
         n_items = pre_vertex_slice.n_atoms * post_vertex_slice.n_atoms
-        items = self._rng.next(n_items)
+        if self._is_sparse:
+            ids = self._sparse_ids(n_items)
+
+            # If self connections are not allowed, remove any self
+            # connections that were selected
+            if not self._allow_self_connections:
+                ids = ids[ids % (post_vertex_slice.n_atoms + 1) != 0]
+        else:
+            items = self._rng.next(n_items)
 
-        # If self connections are not allowed, remove possibility the self
-        # connections by setting them to a value of infinity
-        if not self._allow_self_connections:
-            items[0:n_items:post_vertex_slice.n_atoms + 1] = numpy.inf
+            # If self connections are not allowed, remove possibility the
+            # self connections by setting them to a value of infinity
+            if not self._allow_self_connections:
+                items[0:n_items:post_vertex_slice.n_atoms + 1] = numpy.inf
 
-        present = items < self._p_connect
-        ids = numpy.where(present)[0]
-        n_connections = numpy.sum(present)
+            ids = numpy.where(items < self._p_connect)[0]
+        n_connections = len(ids)
 
         block = numpy.zeros(n_connections, dtype=self.NUMPY_SYNAPSES_DTYPE)
         block["source"] = (
@@ -110,12 +132,44 @@ class FixedProbabilityConnector(AbstractGenerateConnectorOnMachine):
         block["target"] = (
             (ids % post_vertex_slice.n_atoms) + post_vertex_slice.lo_atom)
         block["weight"] = self._generate_weights(
-            weights, n_connections, None)
+            weights, n_connections, None,
+            block["source"], block["target"])
         block["delay"] = self._generate_delays(
-            delays, n_connections, None)
+            delays, n_connections, None,
+            block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
+    @property
+    def _is_sparse(self):
+        if not 0 < self._p_connect < 1:
+            return False
+        if self._sparse is None:
+            return self._p_connect <= self.SPARSE_P_CONNECT_MAX
+        return self._sparse
+
+    def _sparse_ids(self, n_items):
+        """ Select each of n_items with probability p_connect by drawing the\
+            (geometrically distributed) gaps between the selected items
+
+        :param n_items: The number of items to select from
+        :return: The indices of the selected items in ascending order
+        :rtype: numpy.ndarray
+        """
+        log_q = math.log1p(-self._p_connect)
+        chunks = list()
+        last_id = -1
+        while last_id < n_items:
+            # Draw enough gaps to very probably reach the end in one go
+            expected = (n_items - last_id - 1) * self._p_connect
+            n_draws = int(expected + 5 * math.sqrt(expected)) + 16
+            gaps = numpy.minimum(numpy.floor(
+                numpy.log1p(-self._rng.next(n_draws)) / log_q), n_items)
+            ids = last_id + numpy.cumsum(gaps.astype("int64") + 1)
+            chunks.append(ids[ids < n_items])
+            last_id = ids[-1]
+        return numpy.concatenate(chunks)
+
     def __repr__(self):
         return "FixedProbabilityConnector({})".format(self._p_connect)
 
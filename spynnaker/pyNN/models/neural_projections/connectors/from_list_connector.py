@@ -143,13 +143,13 @@ class FromListConnector(AbstractConnector):
         # check that conn_list has weights, if not then use the value passed in
         if self._weights is None:
             block["weight"] = self._generate_weights(
-                weights, sources.size, None)
+                weights, sources.size, None, block["source"], block["target"])
         else:
             block["weight"] = self._weights[mask]
         # check that conn_list has delays, if not then use the value passed in
         if self._delays is None:
             block["delay"] = self._generate_delays(
-                delays, sources.size, None)
+                delays, sources.size, None, block["source"], block["target"])
         else:
             block["delay"] = self._clip_delays(self._delays[mask])
         block["synapse_type"] = synapse_type
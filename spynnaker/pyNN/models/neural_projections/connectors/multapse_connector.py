@@ -160,9 +160,11 @@ class MultapseConnector(AbstractGenerateConnectorOnMachine):
         block["source"] = pairs[chosen, 0]
         block["target"] = pairs[chosen, 1]
         block["weight"] = self._generate_weights(
-            weights, n_connections, [connection_slice])
+            weights, n_connections, [connection_slice],
+            block["source"], block["target"])
         block["delay"] = self._generate_delays(
-            delays, n_connections, [connection_slice])
+            delays, n_connections, [connection_slice],
+            block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
@@ -74,9 +74,11 @@ class OneToOneConnector(AbstractGenerateConnectorOnMachine):
         block["source"] = numpy.arange(max_lo_atom, min_hi_atom + 1)
         block["target"] = numpy.arange(max_lo_atom, min_hi_atom + 1)
         block["weight"] = self._generate_weights(
-            weights, n_connections, [connection_slice])
+            weights, n_connections, [connection_slice],
+            block["source"], block["target"])
         block["delay"] = self._generate_delays(
-            delays, n_connections, [connection_slice])
+            delays, n_connections, [connection_slice],
+            block["source"], block["target"])
         block["synapse_type"] = synapse_type
         return block
 
@@ -1,4 +1,5 @@
 import numpy
+from scipy.spatial import cKDTree  # @UnresolvedImport
 from spinn_utilities.overrides import overrides
 from .abstract_connector import AbstractConnector
 
@@ -6,10 +7,17 @@ from .abstract_connector import AbstractConnector
 class SmallWorldConnector(AbstractConnector):
     __slots__ = [
         "_degree",
-        "_mask",
+        "_max_connections_from_pre",
+        "_max_connections_to_post",
         "_n_connections",
+        "_post_ids",
+        "_pre_starts",
         "_rewiring"]
 
+    # The largest number of distances to compute at once when the space does
+    # not allow the use of a spatial index
+    MAX_DISTANCE_BLOCK_SIZE = 1024 * 1024
+
     def __init__(
             self, degree, rewiring, allow_self_connections=True, safe=True,
             verbose=False, n_connections=None):
@@ -30,28 +38,66 @@ class SmallWorldConnector(AbstractConnector):
             self, pre_population, post_population, rng, machine_time_step)
         self._set_n_connections()
 
-    def _set_n_connections(self):
-        # Get the probabilities up-front for now
-        # TODO: Work out how this can be done statistically
-        # space.distances(...) expects N,3 array in PyNN0.7, but 3,N in PyNN0.8
-        pre_positions = self._pre_population.positions
-        post_positions = self._post_population.positions
-
-        distances = self._space.distances(
-            pre_positions, post_positions, False)
+    def _find_candidates(self):
+        """ Find the pairs of neurons that might be within the degree of\
+            each other
+
+        :return: The pre-neuron and post-neuron of each pair
+        """
+        pre_positions, post_positions = self._get_positions()
+
+        # Without periodic boundaries, distances are Euclidean over the axes
+        # of the space once the post-positions are moved and scaled as the
+        # space does, so a KD-tree can find the neighbours
+        if getattr(self._space, "periodic_boundaries", None) is None:
+            axes = getattr(self._space, "axes", numpy.arange(3))
+            pre_tree = cKDTree(pre_positions[axes].T)
+            post_tree = cKDTree(
+                self._transform_post_positions(post_positions)[axes].T)
+            pairs = pre_tree.sparse_distance_matrix(
+                post_tree, self._degree, output_type="ndarray")
+            return pairs["i"], pairs["j"]
+
+        # Otherwise work through the distances a block of pre-neurons at a
+        # time
+        n_pre_per_block = max(
+            1, self.MAX_DISTANCE_BLOCK_SIZE // max(1, self._n_post_neurons))
+        pre_ids = list()
+        post_ids = list()
+        for pre_lo in range(0, self._n_pre_neurons, n_pre_per_block):
+            pre_hi = min(pre_lo + n_pre_per_block, self._n_pre_neurons)
+            d = self._space.distances(
+                pre_positions[:, pre_lo:pre_hi], post_positions, False)
+            block_pre, block_post = numpy.nonzero(numpy.reshape(
+                d, (pre_hi - pre_lo, self._n_post_neurons)) < self._degree)
+            pre_ids.append(block_pre + pre_lo)
+            post_ids.append(block_post)
+        return numpy.concatenate(pre_ids), numpy.concatenate(post_ids)
 
-        # PyNN 0.8 returns a flattened (C-style) array from space.distances,
-        # so the easiest thing to do here is to reshape back to the "expected"
-        # PyNN 0.7 shape; otherwise later code gets confusing and difficult
-        if (len(distances.shape) == 1):
-            d = numpy.reshape(distances, (pre_positions.shape[0],
-                                          post_positions.shape[0]))
-        else:
-            d = distances
-
-        self._mask = (d < self._degree).astype(float)
-
-        self._n_connections = numpy.sum(self._mask)
+    def _set_n_connections(self):
+        # Find the neighbours of each pre-neuron, keeping only those within
+        # the degree by the measure of the space
+        pre_ids, post_ids = self._find_candidates()
+        if len(pre_ids):
+            close = self._get_distances(
+                pre_ids, post_ids, False) < self._degree
+            pre_ids = pre_ids[close]
+            post_ids = post_ids[close]
+
+        # Store the post-neurons of each pre-neuron in order
+        order = numpy.lexsort((post_ids, pre_ids))
+        self._post_ids = post_ids[order].astype("uint32")
+        self._pre_starts = numpy.zeros(self._n_pre_neurons + 1, dtype="int64")
+        numpy.cumsum(
+            numpy.bincount(pre_ids, minlength=self._n_pre_neurons),
+            out=self._pre_starts[1:])
+
+        self._n_connections = len(self._post_ids)
+        self._max_connections_to_post = 0
+        if self._n_connections:
+            self._max_connections_to_post = int(numpy.amax(numpy.bincount(
+                self._post_ids, minlength=self._n_post_neurons)))
+        self._max_connections_from_pre = dict()
 
     @overrides(AbstractConnector.get_delay_maximum)
     def get_delay_maximum(self, delays):
@@ -61,9 +107,17 @@ class SmallWorldConnector(AbstractConnector):
     def get_n_connections_from_pre_vertex_maximum(
             self, delays, post_vertex_slice, min_delay=None, max_delay=None):
         # pylint: disable=too-many-arguments
-        n_connections = numpy.amax([
-            numpy.sum(self._mask[i, post_vertex_slice.as_slice])
-            for i in range(self._n_pre_neurons)])
+        key = (post_vertex_slice.lo_atom, post_vertex_slice.hi_atom)
+        if key not in self._max_connections_from_pre:
+            in_slice = ((self._post_ids >= post_vertex_slice.lo_atom) &
+                        (self._post_ids <= post_vertex_slice.hi_atom))
+            n_before = numpy.zeros(len(in_slice) + 1, dtype="int64")
+            numpy.cumsum(in_slice, out=n_before[1:])
+            n_in_slice = (n_before[self._pre_starts[1:]] -
+                          n_before[self._pre_starts[:-1]])
+            self._max_connections_from_pre[key] = int(
+                numpy.amax(n_in_slice)) if len(n_in_slice) else 0
+        n_connections = self._max_connections_from_pre[key]
 
         if min_delay is None or max_delay is None:
             return n_connections
@@ -74,8 +128,7 @@ class SmallWorldConnector(AbstractConnector):
     @overrides(AbstractConnector.get_n_connections_to_post_vertex_maximum)
     def get_n_connections_to_post_vertex_maximum(self):
         # pylint: disable=too-many-arguments
-        return numpy.amax([
-            numpy.sum(self._mask[:, i]) for i in range(self._n_post_neurons)])
+        return self._max_connections_to_post
 
     @overrides(AbstractConnector.get_weight_maximum)
     def get_weight_maximum(self, weights):
@@ -88,19 +141,27 @@ class SmallWorldConnector(AbstractConnector):
             post_slice_index, pre_vertex_slice, post_vertex_slice,
             synapse_type):
         # pylint: disable=too-many-arguments
-        ids = numpy.where(self._mask[
-            pre_vertex_slice.as_slice, post_vertex_slice.as_slice])
-        n_connections = len(ids[0])
+        first = self._pre_starts[pre_vertex_slice.lo_atom]
+        last = self._pre_starts[pre_vertex_slice.hi_atom + 1]
+        post_ids = self._post_ids[first:last]
+        pre_ids = numpy.repeat(
+            numpy.arange(pre_vertex_slice.lo_atom,
+                         pre_vertex_slice.hi_atom + 1),
+            numpy.diff(self._pre_starts[
+                pre_vertex_slice.lo_atom:pre_vertex_slice.hi_atom + 2]))
+        in_slice = ((post_ids >= post_vertex_slice.lo_atom) &
+                    (post_ids <= post_vertex_slice.hi_atom))
+        n_connections = numpy.count_nonzero(in_slice)
 
         block = numpy.zeros(n_connections, dtype=self.NUMPY_SYNAPSES_DTYPE)
-        block["source"] = (
-            (ids[0] % pre_vertex_slice.n_atoms) + pre_vertex_slice.lo_atom)
-        block["target"] = (
-            (ids[1] % post_vertex_slice.n_atoms) + post_vertex_slice.lo_atom)
+        block["source"] = pre_ids[in_slice]
+        block["target"] = post_ids[in_slice]
         block["weight"] = self._generate_weights(
-            weights, n_connections, None)
+            weights, n_connections, None,
+            block["source"], block["target"])
         block["delay"] = self._generate_delays(
-            delays, n_connections, None)
+            delays, n_connections, None,
+            block["source"], block["target"])
         block["synapse_type"] = synapse_type
 
         # Re-wire some connections
@@ -1,6 +1,7 @@
 import logging
 import os
 import math
+import tempfile
 from spinn_utilities.overrides import overrides
 from pacman.model.constraints.key_allocator_constraints import (
     ContiguousKeyRangeContraint)
@@ -21,10 +22,13 @@ from spinn_front_end_common.interface.simulation import simulation_utilities
 from spinn_front_end_common.interface.buffer_management import (
     recording_utilities)
 from spinn_front_end_common.interface.profiling import profile_utils
+from spinn_front_end_common.interface.provenance import (
+    AbstractProvidesLocalProvenanceData)
 from .synaptic_manager import SynapticManager
 from spynnaker.pyNN.models.common import (
     AbstractSpikeRecordable, AbstractNeuronRecordable, NeuronRecorder)
 from spynnaker.pyNN.utilities import constants
+from spynnaker.pyNN.utilities.utility_calls import run_in_threads
 from .population_machine_vertex import PopulationMachineVertex
 from spynnaker.pyNN.models.abstract_models import (
     AbstractPopulationInitializable, AbstractAcceptsIncomingSynapses,
@@ -59,7 +63,8 @@ class AbstractPopulationVertex(
         AbstractPopulationInitializable, AbstractPopulationSettable,
         AbstractChangableAfterRun,
         AbstractRewritesDataSpecification, AbstractReadParametersBeforeSet,
-        AbstractAcceptsIncomingSynapses, ProvidesKeyToAtomMappingImpl):
+        AbstractAcceptsIncomingSynapses, ProvidesKeyToAtomMappingImpl,
+        AbstractProvidesLocalProvenanceData):
     """ Underlying vertex model for Neural Populations.
     """
     __slots__ = [
@@ -72,6 +77,7 @@ class AbstractPopulationVertex(
         "_neuron_recorder",
         "_parameters",
         "_pynn_model",
+        "_recorded_data_files",
         "_state_variables",
         "_synapse_manager",
         "_time_between_requests",
@@ -129,6 +135,10 @@ class AbstractPopulationVertex(
         recordables.extend(self._neuron_impl.get_recordable_variables())
         self._neuron_recorder = NeuronRecorder(recordables, n_neurons)
 
+        # The file that the recorded data of each variable is memory-mapped
+        # into, as (number of timesteps recorded, filename)
+        self._recorded_data_files = dict()
+
         # Set up synapse handling
         self._synapse_manager = SynapticManager(
             self._neuron_impl.get_n_synapse_types(), ring_buffer_sigma,
@@ -495,6 +505,13 @@ class AbstractPopulationVertex(
             self.label, buffer_manager, self.SPIKE_RECORDING_REGION,
             placements, graph_mapper, self, machine_time_step)
 
+    @overrides(AbstractSpikeRecordable.iter_spikes)
+    def iter_spikes(
+            self, placements, graph_mapper, buffer_manager, machine_time_step):
+        return self._neuron_recorder.iter_spikes(
+            self.label, buffer_manager, self.SPIKE_RECORDING_REGION,
+            placements, graph_mapper, self, machine_time_step)
+
     @overrides(AbstractNeuronRecordable.get_recordable_variables)
     def get_recordable_variables(self):
         return self._neuron_recorder.get_recordable_variables()
@@ -518,9 +535,57 @@ class AbstractPopulationVertex(
         if variable != "spikes":
             index = 1 + self._neuron_impl.get_recordable_variable_index(
                 variable)
-        return self._neuron_recorder.get_matrix_data(
+
+        # The data of a run is only read from the machine once
+        recorded = self._recorded_data_files.get(variable)
+        if recorded is not None:
+            if recorded[0] == n_machine_time_steps:
+                return NeuronRecorder.read_matrix_data(recorded[1])
+            self._delete_recorded_data_file(variable)
+
+        filename = self._new_recorded_data_filename(variable, graph_mapper)
+        data = self._neuron_recorder.get_matrix_data(
             self.label, buffer_manager, index, placements, graph_mapper,
-            self, variable, n_machine_time_steps)
+            self, variable, n_machine_time_steps, filename)
+        if filename is not None:
+            self._recorded_data_files[variable] = (
+                n_machine_time_steps, filename)
+        return data
+
+    def _new_recorded_data_filename(self, variable, graph_mapper):
+        """ Get a new file to memory-map recorded data into, or None if the\
+            data should be held in memory or there is no data
+        """
+        config = globals_variables.get_simulator().config
+        if not helpful_functions.read_config_boolean(
+                config, "Recording", "memory_map_recorded_data"):
+            return None
+        if not any(
+                self._neuron_recorder.get_n_neurons_recording(
+                    variable, graph_mapper.get_slice(machine_vertex))
+                for machine_vertex in graph_mapper.get_machine_vertices(self)):
+            return None
+        folder = helpful_functions.read_config(
+            config, "Recording", "recorded_data_folder")
+        fd, filename = tempfile.mkstemp(
+            prefix="{}_".format(variable), suffix=".npy", dir=folder)
+        os.close(fd)
+        return filename
+
+    def _delete_recorded_data_file(self, variable):
+        """ Delete the file that the recorded data of a variable is\
+            memory-mapped into, if there is one
+        """
+        recorded = self._recorded_data_files.pop(variable, None)
+        if recorded is not None:
+            NeuronRecorder.delete_matrix_data(recorded[1])
+
+    def delete_recorded_data_files(self):
+        """ Delete the files that recorded data has been memory-mapped into;\
+            called when the simulation is reset or ends
+        """
+        for variable in list(self._recorded_data_files):
+            self._delete_recorded_data_file(variable)
 
     @overrides(AbstractNeuronRecordable.get_neuron_sampling_interval)
     def get_neuron_sampling_interval(self, variable):
@@ -607,10 +672,10 @@ class AbstractPopulationVertex(
         self._parameters.set_value(key, value)
         self._change_requires_neuron_parameters_reload = True
 
-    @overrides(AbstractReadParametersBeforeSet.read_parameters_from_machine)
-    def read_parameters_from_machine(
-            self, transceiver, placement, vertex_slice):
-
+    def _read_neuron_parameters(self, transceiver, placement, vertex_slice):
+        """ Read the neuron parameters region of a core, after the data that\
+            comes before the global parameters
+        """
         # locate SDRAM address to where the neuron parameters are stored
         neuron_region_sdram_address = \
             helpful_functions.locate_memory_region_for_placement(
@@ -629,10 +694,17 @@ class AbstractPopulationVertex(
         size_of_region -= self.BYTES_TILL_START_OF_GLOBAL_PARAMETERS
 
         # get data from the machine
-        byte_array = transceiver.read_memory(
+        return transceiver.read_memory(
             placement.x, placement.y, neuron_parameters_sdram_address,
             size_of_region)
 
+    @overrides(AbstractReadParametersBeforeSet.read_parameters_from_machine)
+    def read_parameters_from_machine(
+            self, transceiver, placement, vertex_slice):
+
+        byte_array = self._read_neuron_parameters(
+            transceiver, placement, vertex_slice)
+
         # Skip the recorder globals as these are not change on machine
         # Just written out in case data is changed and written back
         offset = self._neuron_recorder.get_sdram_usage_in_bytes(
@@ -643,6 +715,34 @@ class AbstractPopulationVertex(
             byte_array, offset, vertex_slice, self._parameters,
             self._state_variables)
 
+    @overrides(
+        AbstractReadParametersBeforeSet.read_all_parameters_from_machine)
+    def read_all_parameters_from_machine(
+            self, transceiver, placements_and_slices, n_threads):
+
+        # Updating all the atoms at once needs every atom to be read
+        if sum(vertex_slice.n_atoms
+               for _, vertex_slice in placements_and_slices) != self.n_atoms:
+            super(AbstractPopulationVertex, self).\
+                read_all_parameters_from_machine(
+                    transceiver, placements_and_slices, n_threads)
+            return
+
+        def read_placement(placement_and_slice):
+            placement, vertex_slice = placement_and_slice
+            return (
+                self._read_neuron_parameters(
+                    transceiver, placement, vertex_slice),
+                self._neuron_recorder.get_sdram_usage_in_bytes(vertex_slice),
+                vertex_slice)
+
+        # Read the cores at the same time, then update all the parameters
+        # from the data of all the cores at once
+        slice_data = list(run_in_threads(
+            read_placement, placements_and_slices, n_threads))
+        self._neuron_impl.read_data_for_slices(
+            slice_data, self._parameters, self._state_variables)
+
     @property
     def weight_scale(self):
         return self._neuron_impl.get_global_weight_scale()
@@ -696,6 +796,10 @@ class AbstractPopulationVertex(
     def clear_connection_cache(self):
         self._synapse_manager.clear_connection_cache()
 
+    @overrides(AbstractProvidesLocalProvenanceData.get_local_provenance_data)
+    def get_local_provenance_data(self):
+        return self._synapse_manager.get_provenance_data(self.label)
+
     def get_maximum_delay_supported_in_ms(self, machine_time_step):
         return self._synapse_manager.get_maximum_delay_supported_in_ms(
             machine_time_step)
@@ -728,6 +832,7 @@ class AbstractPopulationVertex(
         if variable != "spikes":
             index = 1 + self._neuron_impl.get_recordable_variable_index(
                 variable)
+        self._delete_recorded_data_file(variable)
         self._clear_recording_region(
             buffer_manager, placements, graph_mapper, index)
 
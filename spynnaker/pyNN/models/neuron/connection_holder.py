@@ -1,5 +1,11 @@
 import numpy
 from numpy.lib.recfunctions import merge_arrays
+import scipy.sparse  # @UnresolvedImport
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+
+# The ways in which multiple synapses between the same pair of neurons can be
+# combined when returned as a matrix
+_MULTIPLE_SYNAPSE_MERGES = ("last", "first", "sum", "min", "max")
 
 
 class ConnectionHolder(object):
@@ -34,11 +40,20 @@ class ConnectionHolder(object):
 
         # A callback to call with the data when finished
         "_notify",
+
+        # True if matrices should be returned as scipy.sparse matrices
+        # instead of dense matrices
+        "_sparse",
+
+        # How to combine multiple synapses between the same pair of neurons
+        # when returned as a matrix
+        "_multiple_synapses",
     )
 
     def __init__(
             self, data_items_to_return, as_list, n_pre_atoms, n_post_atoms,
-            connections=None, fixed_values=None, notify=None):
+            connections=None, fixed_values=None, notify=None, sparse=False,
+            multiple_synapses="last"):
         """
 
         :param data_items_to_return: A list of data fields to be returned
@@ -61,8 +76,21 @@ class ConnectionHolder(object):
             A callback to call when the connections have all been added.\
             This should accept a single parameter, which will contain the\
             data requested
+        :param sparse:\
+            True if matrices are to be returned as scipy.sparse CSR matrices\
+            holding only the connections that exist, rather than as dense\
+            matrices with NaN where there is no connection.  Ignored if\
+            as_list is True.
+        :param multiple_synapses:\
+            How to combine the values of multiple synapses between the same\
+            pair of neurons when returned as a matrix; one of "last",\
+            "first", "sum", "min" or "max"
         """
         # pylint: disable=too-many-arguments
+        if multiple_synapses not in _MULTIPLE_SYNAPSE_MERGES:
+            raise ConfigurationException(
+                "multiple_synapses must be one of {}".format(
+                    _MULTIPLE_SYNAPSE_MERGES))
         self._data_items_to_return = data_items_to_return
         self._as_list = as_list
         self._n_pre_atoms = n_pre_atoms
@@ -71,6 +99,8 @@ class ConnectionHolder(object):
         self._data_items = None
         self._notify = notify
         self._fixed_values = fixed_values
+        self._sparse = sparse
+        self._multiple_synapses = multiple_synapses
 
     def add_connections(self, connections):
         """ Add connections to the holder to be returned
@@ -172,19 +202,40 @@ class ConnectionHolder(object):
             if self._data_items_to_return is None:
                 return []
 
+            # Find the distinct (source, target) pairs; the sort is stable so
+            # the order in which the synapses were added is kept in each pair
+            order = numpy.lexsort(
+                (connections["target"], connections["source"]))
+            connections = connections[order]
+            new_pair = numpy.ones(len(connections), dtype="bool")
+            new_pair[1:] = (
+                (connections["source"][1:] != connections["source"][:-1]) |
+                (connections["target"][1:] != connections["target"][:-1]))
+            pair_starts = numpy.flatnonzero(new_pair)
+            sources = connections["source"][pair_starts]
+            targets = connections["target"][pair_starts]
+
             # Keep track of the matrices
             merged_connections = list()
             for item in self._data_items_to_return:
+                values = self._merge_multiple_synapses(
+                    connections[item], pair_starts)
+
+                if self._sparse:
+
+                    # Only store the values that have data
+                    matrix = scipy.sparse.csr_matrix(
+                        (values, (sources, targets)),
+                        shape=(self._n_pre_atoms, self._n_post_atoms))
+                else:
 
-                # Build an empty matrix and fill it with NAN
-                matrix = numpy.empty((self._n_pre_atoms, self._n_post_atoms))
-                matrix.fill(numpy.nan)
+                    # Build an empty matrix and fill it with NAN
+                    matrix = numpy.empty(
+                        (self._n_pre_atoms, self._n_post_atoms))
+                    matrix.fill(numpy.nan)
 
-                # Fill in the values that have data
-                # TODO: Change this to sum the items with the same
-                #       (source, target) pairs
-                matrix[connections["source"], connections["target"]] = \
-                    connections[item]
+                    # Fill in the values that have data
+                    matrix[sources, targets] = values
 
                 # Store the matrix generated
                 merged_connections.append(matrix)
@@ -199,6 +250,24 @@ class ConnectionHolder(object):
 
         return self._data_items
 
+    def _merge_multiple_synapses(self, values, pair_starts):
+        """ Combine the values of the synapses in each run of synapses\
+            between the same pair of neurons, where each run starts at the\
+            given index
+        """
+        if not len(values):
+            return values
+        if self._multiple_synapses == "first":
+            return values[pair_starts]
+        if self._multiple_synapses == "last":
+            pair_ends = numpy.append(pair_starts[1:], len(values)) - 1
+            return values[pair_ends]
+        if self._multiple_synapses == "sum":
+            return numpy.add.reduceat(values, pair_starts)
+        if self._multiple_synapses == "min":
+            return numpy.minimum.reduceat(values, pair_starts)
+        return numpy.maximum.reduceat(values, pair_starts)
+
     def __getitem__(self, s):
         data = self._get_data_items()
         return data[s]
@@ -165,6 +165,23 @@ class AbstractNeuronImpl(object):
             :py:class:`spinn_utilities.ranged.range_dictionary.RangeDictionary`
         """
 
+    def read_data_for_slices(self, slice_data, parameters, state_variables):
+        """ Read the parameters and state variables of the model from the\
+            data of several slices which together cover all the atoms
+
+        :param slice_data: The (data, offset, vertex_slice) of each slice
+        :type slice_data: list of (bytearray, int, Slice)
+        :param parameters: The holder of the parameters to update
+        :type parameters:\
+            :py:class:`spinn_utilities.ranged.range_dictionary.RangeDictionary`
+        :param state_variables: The holder of the state variables to update
+        :type state_variables:\
+            :py:class:`spinn_utilities.ranged.range_dictionary.RangeDictionary`
+        """
+        for data, offset, vertex_slice in slice_data:
+            self.read_data(
+                data, offset, vertex_slice, parameters, state_variables)
+
     @abstractmethod
     def get_units(self, variable):
         """ Get the units of the given variable
@@ -1,5 +1,7 @@
+import numpy
 from six import add_metaclass
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
+from pacman.model.graphs.common import Slice
 from .struct import Struct
 from .ranged_dict_vertex_slice import RangedDictVertexSlice
 
@@ -91,7 +93,9 @@ class AbstractStandardNeuronComponent(object):
         """
 
     def get_data(self, parameters, state_variables, vertex_slice):
-        """ Get the data to be written to the machine for this model
+        """ Get the data to be written to the machine for this model.\
+            This is a wrapper around :py:meth:`write_data`, which is what\
+            the neuron implementation calls, so override that instead
 
         :param parameters: The holder of the parameters
         :type parameters:\
@@ -102,9 +106,38 @@ class AbstractStandardNeuronComponent(object):
         :param vertex_slice: The slice of the vertex to generate parameters for
         :rtype: numpy array of uint32
         """
+        data = numpy.zeros(
+            self.get_sdram_usage_in_bytes(vertex_slice.n_atoms) // 4,
+            dtype="uint32")
+        n_bytes = self.write_data(
+            data, 0, parameters, state_variables, vertex_slice)
+        return data[:n_bytes // 4]
+
+    def write_data(
+            self, data, byte_offset, parameters, state_variables,
+            vertex_slice):
+        """ Write the data to be written to the machine for this model into\
+            part of a buffer of zeros.  Components that write something\
+            other than their struct of values should override this rather\
+            than :py:meth:`get_data`
+
+        :param data: The buffer to write to
+        :type data: numpy array of uint32
+        :param byte_offset: The offset in bytes where the data should start
+        :param parameters: The holder of the parameters
+        :type parameters:\
+            :py:class:`spinn_utilities.ranged.range_dictionary.RangeDictionary`
+        :param state_variables: The holder of the state variables
+        :type state_variables:\
+            :py:class:`spinn_utilities.ranged.range_dictionary.RangeDictionary`
+        :param vertex_slice: The slice of the vertex to generate parameters for
+        :return: The offset in bytes after the data
+        :rtype: int
+        """
         values = self.get_values(parameters, state_variables, vertex_slice)
-        return self.struct.get_data(
-            values, vertex_slice.lo_atom, vertex_slice.n_atoms)
+        return self.struct.write_data(
+            data, byte_offset, values, vertex_slice.lo_atom,
+            vertex_slice.n_atoms)
 
     @abstractmethod
     def update_values(self, values, parameters, state_variables):
@@ -142,6 +175,39 @@ class AbstractStandardNeuronComponent(object):
         self.update_values(values, params, variables)
         return new_offset
 
+    def read_data_for_slices(self, slice_data, parameters, state_variables):
+        """ Read the parameters and state variables of the model from the\
+            data of several slices which together cover all the atoms,\
+            updating each parameter and state variable once for all of them
+
+        :param slice_data: The (data, offset, vertex_slice) of each slice
+        :type slice_data: list of (bytearray, int, Slice)
+        :param parameters: The holder of the parameters to update
+        :type parameters:\
+            :py:class:`spinn_utilities.ranged.range_dictionary.RangeDictionary`
+        :param state_variables: The holder of the state variables to update
+        :type state_variables:\
+            :py:class:`spinn_utilities.ranged.range_dictionary.RangeDictionary`
+        :return: The (data, offset, vertex_slice) after reading each slice
+        :rtype: list of (bytearray, int, Slice)
+        """
+        n_atoms = len(parameters)
+        values = [numpy.zeros(n_atoms) for _ in self.struct.field_types]
+        new_slice_data = list()
+        for data, offset, vertex_slice in slice_data:
+            slice_values = self.struct.read_data(
+                data, offset, vertex_slice.n_atoms)
+            for all_values, values_read in zip(values, slice_values):
+                all_values[vertex_slice.as_slice] = values_read
+            new_slice_data.append((
+                data, offset + (self.struct.get_size_in_whole_words(
+                    vertex_slice.n_atoms) * 4), vertex_slice))
+        all_atoms = Slice(0, n_atoms - 1)
+        self.update_values(
+            values, RangedDictVertexSlice(parameters, all_atoms),
+            RangedDictVertexSlice(state_variables, all_atoms))
+        return new_slice_data
+
     @abstractmethod
     def has_variable(self, variable):
         """ Determine if this component has a variable by the given name
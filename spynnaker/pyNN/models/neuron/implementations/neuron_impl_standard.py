@@ -130,10 +130,16 @@ class NeuronImplStandard(AbstractNeuronImpl):
 
     @overrides(AbstractNeuronImpl.get_data)
     def get_data(self, parameters, state_variables, vertex_slice):
-        return numpy.concatenate([
-            component.get_data(parameters, state_variables, vertex_slice)
-            for component in self._components
-        ])
+        # Write all the components into one buffer; this calls write_data
+        # of each component rather than get_data
+        data = numpy.zeros(sum(
+            component.get_sdram_usage_in_bytes(vertex_slice.n_atoms)
+            for component in self._components) // 4, dtype="uint32")
+        n_bytes = 0
+        for component in self._components:
+            n_bytes = component.write_data(
+                data, n_bytes, parameters, state_variables, vertex_slice)
+        return data[:n_bytes // 4]
 
     @overrides(AbstractNeuronImpl.read_data)
     def read_data(
@@ -143,6 +149,12 @@ class NeuronImplStandard(AbstractNeuronImpl):
                 data, offset, vertex_slice, parameters, state_variables)
         return offset
 
+    @overrides(AbstractNeuronImpl.read_data_for_slices)
+    def read_data_for_slices(self, slice_data, parameters, state_variables):
+        for component in self._components:
+            slice_data = component.read_data_for_slices(
+                slice_data, parameters, state_variables)
+
     @overrides(AbstractNeuronImpl.get_units)
     def get_units(self, variable):
         for component in self._components:
@@ -1,6 +1,7 @@
 import itertools
 import numpy
 from spinn_utilities.helpful_functions import is_singleton
+from spynnaker.pyNN.utilities.ranged import SpynnakerRangedList
 
 
 class RangedDictVertexSlice(object):
@@ -12,7 +13,7 @@ class RangedDictVertexSlice(object):
         self._vertex_slice = vertex_slice
 
     def __getitem__(self, key):
-        if not isinstance(key, "str"):
+        if not isinstance(key, str):
             raise KeyError("Key must be a string")
         return _RangedListVertexSlice(
             self._ranged_dict[key], self._vertex_slice)
@@ -35,16 +36,25 @@ class _RangedListVertexSlice(object):
 
         if is_singleton(value):
             self._ranged_list.set_value_by_slice(
-                self._vertex_slice.lo_atom, self._vertex_slice.hi_atom, value)
+                self._vertex_slice.lo_atom, self._vertex_slice.hi_atom + 1,
+                value)
+
+        # If the slice covers the whole list, set it in one go
+        elif (self._vertex_slice.n_atoms == len(self._ranged_list) and
+                isinstance(self._ranged_list, SpynnakerRangedList)):
+            self._ranged_list.set_value_by_array(value)
+
         else:
 
             # Find the ranges where the data is the same
             changes = numpy.nonzero(numpy.diff(value))[0] + 1
 
             # Go through and set the data in ranges
+            lo_atom = self._vertex_slice.lo_atom
             start_index = 0
             for end_index in itertools.chain(
                     changes, [self._vertex_slice.n_atoms]):
                 self._ranged_list.set_value_by_slice(
-                    start_index, end_index, value[start_index])
+                    lo_atom + start_index, lo_atom + end_index,
+                    value[start_index])
                 start_index = end_index
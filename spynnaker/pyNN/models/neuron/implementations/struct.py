@@ -2,14 +2,25 @@ import numpy
 from spinn_utilities.helpful_functions import is_singleton
 from spinn_utilities.ranged.ranged_list import RangedList
 from spinn_front_end_common.utilities.globals_variables import get_simulator
-from spynnaker.pyNN.utilities.utility_calls import convert_to
+from spynnaker.pyNN.utilities.utility_calls import (
+    convert_array_to, convert_to)
 
 
 class Struct(object):
     """ Represents a C code structure
     """
 
-    __slots__ = ("_field_types")
+    __slots__ = (
+        "_field_types",
+
+        # The numpy data type of the struct, built once
+        "_numpy_dtype",
+
+        # The names of the fields in the numpy data type
+        "_field_names",
+
+        # The scale of each field as a float
+        "_scales")
 
     def __init__(self, field_types):
         """
@@ -20,6 +31,12 @@ class Struct(object):
             list of :py:class:`data_specification.enums.data_type.DataType`
         """
         self._field_types = field_types
+        self._field_names = ["f" + str(i) for i in range(len(field_types))]
+        self._numpy_dtype = numpy.dtype(
+            [(name, numpy.dtype(data_type.struct_encoding))
+             for name, data_type in zip(self._field_names, field_types)],
+            align=True)
+        self._scales = [float(data_type.scale) for data_type in field_types]
 
     @property
     def field_types(self):
@@ -35,10 +52,7 @@ class Struct(object):
 
         :rtype: :py:class:`numpy.dtype`
         """
-        return numpy.dtype(
-            [("f" + str(i), numpy.dtype(data_type.struct_encoding))
-             for i, data_type in enumerate(self.field_types)],
-            align=True)
+        return self._numpy_dtype
 
     def get_size_in_whole_words(self, array_size=1):
         """ Get the size of the struct in whole words in an array of given\
@@ -47,8 +61,7 @@ class Struct(object):
         :param array_size: The number of elements in an array of structs
         :rtype: int
         """
-        datatype = self.numpy_dtype
-        size_in_bytes = array_size * datatype.itemsize
+        size_in_bytes = array_size * self._numpy_dtype.itemsize
         return (size_in_bytes + 3) // 4
 
     def get_data(self, values, offset=0, array_size=1):
@@ -63,38 +76,59 @@ class Struct(object):
         :param array_size: The number of structs to generate
         :rtype: numpy.array(dtype="uint32")
         """
-        # Create an array to store values in
-        data = numpy.zeros(array_size, dtype=self.numpy_dtype)
+        data = numpy.zeros(
+            self.get_size_in_whole_words(array_size), dtype="uint32")
+        self.write_data(data, 0, values, offset, array_size)
+        return data
+
+    def write_data(self, data, byte_offset, values, offset=0, array_size=1):
+        """ Write the data for the given values into part of a buffer, which\
+            must be zero where the struct padding is
+
+        :param data: The buffer to write to
+        :type data: numpy.array(dtype="uint32")
+        :param byte_offset:\
+            The offset in bytes into the buffer where the structs start
+        :param values:\
+            A list of values with length the same size as the number of fields\
+            returned by field_types
+        :type values:\
+            list of (single value or list of values or RangedList of values)
+        :param offset: The offset into each of the values where to start
+        :param array_size: The number of structs to generate
+        :return: The offset in bytes after the structs, padded to whole words
+        :rtype: int
+        """
+        end_offset = byte_offset + self.get_size_in_whole_words(array_size) * 4
+        if not self._numpy_dtype.itemsize:
+            return end_offset
+        structs = data.view("uint8")[
+            byte_offset:
+            byte_offset + array_size * self._numpy_dtype.itemsize].view(
+                self._numpy_dtype)
 
         # Go through and get the values and put them in the array
-        for i, (values, data_type) in enumerate(zip(values, self.field_types)):
+        for name, values, data_type in zip(
+                self._field_names, values, self._field_types):
 
             if is_singleton(values):
-                data_value = convert_to(values, data_type)
-                data["f" + str(i)] = data_value
+                structs[name] = convert_to(values, data_type)
             elif not isinstance(values, RangedList):
-                data_value = [convert_to(v, data_type)
-                              for v in values[offset:(offset + array_size)]]
-                data["f" + str(i)] = data_value
+                structs[name] = convert_array_to(
+                    values[offset:(offset + array_size)], data_type)
             else:
                 for start, end, value in values.iter_ranges_by_slice(
                         offset, offset + array_size):
 
                     # Get the values and get them into the correct data type
                     if get_simulator().is_a_pynn_random(value):
-                        values = value.next(end - start)
-                        data_value = [convert_to(v, data_type) for v in values]
+                        data_value = convert_array_to(
+                            value.next(end - start), data_type)
                     else:
                         data_value = convert_to(value, data_type)
-                    data["f" + str(i)][
-                        start - offset:end - offset] = data_value
+                    structs[name][start - offset:end - offset] = data_value
 
-        # Pad to whole number of uint32s
-        overflow = (array_size * self.numpy_dtype.itemsize) % 4
-        if overflow != 0:
-            data = numpy.pad(data.view("uint8"), (0, 4 - overflow), "constant")
-
-        return data.view("uint32")
+        return end_offset
 
     def read_data(self, data, offset=0, array_size=1):
         """ Read a bytearray of data and convert to struct values
@@ -105,8 +139,8 @@ class Struct(object):
         :return:\
             a list of lists of data values, one list for each struct element
         """
-        if self.numpy_dtype.itemsize == 0:
-            return numpy.zeros(0, dtype=self.numpy_dtype)
+        if self._numpy_dtype.itemsize == 0:
+            return numpy.zeros(0, dtype=self._numpy_dtype)
 
         # Prepare items to return
         items_to_return = list()
@@ -114,21 +148,20 @@ class Struct(object):
         # It could be possible that a component has no parameters
         # (for example, InputTypeCurrent): this needs to be dealt with,
         # as numpy.frombuffer does not like an empty type
-        if len(self.numpy_dtype) == 0:
+        if len(self._numpy_dtype) == 0:
             return items_to_return
         else:
             # Read in the data values
             numpy_data = numpy.frombuffer(
-                data, offset=offset, dtype=self.numpy_dtype, count=array_size)
+                data, offset=offset, dtype=self._numpy_dtype,
+                count=array_size)
 
             # Go through the things to be set
             items_to_return = list()
-            for i, data_type in enumerate(self.field_types):
+            for name, scale in zip(self._field_names, self._scales):
 
                 # Get the data to set for this item
-                values = numpy_data["f" + str(i)]
-
-                items_to_return.append(values / float(data_type.scale))
+                items_to_return.append(numpy_data[name] / scale)
 
             # Return values read
             return items_to_return
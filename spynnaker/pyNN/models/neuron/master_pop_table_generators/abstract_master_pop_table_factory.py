@@ -30,6 +30,24 @@ class AbstractMasterPopTableFactory(object):
         :return: a synaptic matrix memory position.
         """
 
+    def read_master_population_table(
+            self, master_pop_base_mem_address, txrx, chip_x, chip_y):
+        """ Read the master population table of a core once, so that the\
+            locations of the synaptic matrices of many keys can be found\
+            without going back to the machine for each key.
+
+        :param master_pop_base_mem_address: the base address of the master pop
+        :param txrx: the transceiver object
+        :param chip_x: the x coordinate of the chip of this master pop
+        :param chip_y: the y coordinate of the chip of this master pop
+        :return: \
+            an object with an extract_synaptic_matrix_data_location(key)\
+            method that gives the same result as the method of the same name\
+            on this object for the table read
+        """
+        return _MasterPopTableReader(
+            self, master_pop_base_mem_address, txrx, chip_x, chip_y)
+
     @abstractmethod
     def update_master_population_table(
             self, spec, block_start_addr, row_length, key_and_mask,
@@ -71,3 +89,28 @@ class AbstractMasterPopTableFactory(object):
     def get_master_population_table_size(self, vertex_slice, in_edges):
         """ Get the size of the master population table in SDRAM
         """
+
+
+class _MasterPopTableReader(object):
+    """ Reads the master population table for each key as requested, for\
+        tables that cannot be read in one go
+    """
+    __slots__ = [
+        "_address",
+        "_chip_x",
+        "_chip_y",
+        "_table",
+        "_txrx"]
+
+    def __init__(self, table, address, txrx, chip_x, chip_y):
+        # pylint: disable=too-many-arguments
+        self._table = table
+        self._address = address
+        self._txrx = txrx
+        self._chip_x = chip_x
+        self._chip_y = chip_y
+
+    def extract_synaptic_matrix_data_location(self, incoming_key):
+        return self._table.extract_synaptic_matrix_data_location(
+            incoming_key, self._address, self._txrx, self._chip_x,
+            self._chip_y)
@@ -266,8 +266,14 @@ class MasterPopTableAsBinarySearch(AbstractMasterPopTableFactory):
     def extract_synaptic_matrix_data_location(
             self, incoming_key, master_pop_base_mem_address, txrx,
             chip_x, chip_y):
-        # pylint: disable=too-many-arguments, too-many-locals, arguments-differ
+        # pylint: disable=too-many-arguments, arguments-differ
+        return self.read_master_population_table(
+            master_pop_base_mem_address, txrx, chip_x, chip_y)\
+            .extract_synaptic_matrix_data_location(incoming_key)
 
+    @overrides(AbstractMasterPopTableFactory.read_master_population_table)
+    def read_master_population_table(
+            self, master_pop_base_mem_address, txrx, chip_x, chip_y):
         # get entries in master pop
         n_entries, n_addresses = _TWO_WORDS.unpack(txrx.read_memory(
             chip_x, chip_y, master_pop_base_mem_address, _TWO_WORDS.size))
@@ -288,52 +294,62 @@ class MasterPopTableAsBinarySearch(AbstractMasterPopTableFactory):
         address_list = numpy.frombuffer(
             full_data, 'uint8', n_address_bytes, n_entry_bytes).view(
                 dtype=self.ADDRESS_LIST_DTYPE)
-
-        entry = self._locate_entry(entry_list, incoming_key)
-        if entry is None:
-            return []
-        addresses = list()
-        for i in range(entry["start"], entry["start"] + entry["count"]):
-            address_and_row_length = address_list[i]
-            is_single = (
-                address_and_row_length &
-                MasterPopTableAsBinarySearch.SINGLE_BIT_FLAG_BIT) > 0
-            address = (
-                address_and_row_length &
-                MasterPopTableAsBinarySearch.ADDRESS_MASK)
-            row_length = (
-                address_and_row_length &
-                MasterPopTableAsBinarySearch.ROW_LENGTH_MASK)
-            if is_single:
-                address = address >> 8
-            else:
-                address = address >> self.ADDRESS_SCALED_SHIFT
-
-            addresses.append((row_length, address, is_single))
-        return addresses
-
-    @staticmethod
-    def _locate_entry(entries, key):
-        """ Search the binary tree structure for the correct entry.
-
-        :param key: the key to search the master pop table for a given entry
-        :return: the entry for this given key
-        :rtype: :py:class:`_MasterPopEntry`
-        """
-        imin = 0
-        imax = len(entries)
-
-        while imin < imax:
-            imid = (imax + imin) // 2
-            entry = entries[imid]
-            if key & entry["mask"] == entry["key"]:
-                return entry
-            if key > entry["key"]:
-                imin = imid + 1
-            else:
-                imax = imid
-        return None
+        return _MasterPopTableIndex(entry_list, address_list)
 
     @overrides(AbstractMasterPopTableFactory.get_edge_constraints)
     def get_edge_constraints(self):
         return list()
+
+
+class _MasterPopTableIndex(object):
+    """ Internal class that holds the master population table of a core as\
+        read from the machine, with the entries sorted by key for searching
+    """
+    __slots__ = [
+        "_addresses",
+        "_counts",
+        "_is_single",
+        "_keys",
+        "_masks",
+        "_row_lengths",
+        "_starts"]
+
+    def __init__(self, entry_list, address_list):
+        # The entries are written in key order
+        self._keys = entry_list["key"].astype("uint32")
+        self._masks = entry_list["mask"].astype("uint32")
+        self._starts = entry_list["start"].astype("uint32")
+        self._counts = entry_list["count"].astype("uint32")
+
+        # Decode all the addresses at once
+        address_list = address_list.astype("uint32")
+        self._is_single = (
+            address_list &
+            MasterPopTableAsBinarySearch.SINGLE_BIT_FLAG_BIT) > 0
+        addresses = (
+            address_list & MasterPopTableAsBinarySearch.ADDRESS_MASK)
+        self._addresses = numpy.where(
+            self._is_single, addresses >> 8,
+            addresses >> MasterPopTableAsBinarySearch.ADDRESS_SCALED_SHIFT)
+        self._row_lengths = (
+            address_list & MasterPopTableAsBinarySearch.ROW_LENGTH_MASK)
+
+    def extract_synaptic_matrix_data_location(self, incoming_key):
+        """ Get the locations of the synaptic matrices of a key
+
+        :param incoming_key: \
+            the source key which the synaptic matrix needs to be mapped to
+        :return: a list of (row length, address, is single) tuples
+        """
+        # The only entry that can match is the one with the largest key that
+        # is not bigger than the incoming key
+        i = numpy.searchsorted(self._keys, incoming_key, side="right") - 1
+        if i < 0 or incoming_key & self._masks[i] != self._keys[i]:
+            return []
+        start = self._starts[i]
+        end = start + self._counts[i]
+        return [
+            (int(row_length), int(address), bool(is_single))
+            for row_length, address, is_single in zip(
+                self._row_lengths[start:end], self._addresses[start:end],
+                self._is_single[start:end])]
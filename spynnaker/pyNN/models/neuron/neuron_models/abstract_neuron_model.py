@@ -52,13 +52,14 @@ class AbstractNeuronModel(AbstractStandardNeuronComponent):
         """
         return numpy.zeros(0, dtype="uint32")
 
-    @overrides(AbstractStandardNeuronComponent.get_data)
-    def get_data(self, parameters, state_variables, vertex_slice):
-        super_data = super(AbstractNeuronModel, self).get_data(
-            parameters, state_variables, vertex_slice)
-        values = self.get_global_values()
-        global_data = self.global_struct.get_data(values)
-        return numpy.concatenate([global_data, super_data])
+    @overrides(AbstractStandardNeuronComponent.write_data)
+    def write_data(
+            self, data, byte_offset, parameters, state_variables,
+            vertex_slice):
+        byte_offset = self.global_struct.write_data(
+            data, byte_offset, self.get_global_values())
+        return super(AbstractNeuronModel, self).write_data(
+            data, byte_offset, parameters, state_variables, vertex_slice)
 
     @overrides(AbstractStandardNeuronComponent.read_data)
     def read_data(
@@ -68,3 +69,14 @@ class AbstractNeuronModel(AbstractStandardNeuronComponent):
         offset += (self.global_struct.get_size_in_whole_words() * 4)
         return super(AbstractNeuronModel, self).read_data(
             data, offset, vertex_slice, parameters, state_variables)
+
+    @overrides(AbstractStandardNeuronComponent.read_data_for_slices)
+    def read_data_for_slices(self, slice_data, parameters, state_variables):
+
+        # Assume that the global data doesn't change
+        global_size = self.global_struct.get_size_in_whole_words() * 4
+        slice_data = [
+            (data, offset + global_size, vertex_slice)
+            for data, offset, vertex_slice in slice_data]
+        return super(AbstractNeuronModel, self).read_data_for_slices(
+            slice_data, parameters, state_variables)
@@ -56,4 +56,9 @@ class AbstractPlasticSynapseDynamics(AbstractSynapseDynamics):
             fp_size, fp_data):
         """ Read the connections indicated in the connection indices from the\
             data in pp_data and fp_data
+
+        pp_data and fp_data are matrices with the plastic-plastic and\
+        fixed-plastic region of each row in each row of the matrix; rows\
+        shorter than the matrix are padded at the end, so only the data given\
+        by pp_size and fp_size is valid in each row.
         """
@@ -47,4 +47,8 @@ class AbstractStaticSynapseDynamics(AbstractSynapseDynamics):
     def read_static_synaptic_data(
             self, post_vertex_slice, n_synapse_types, ff_size, ff_data):
         """ Read the connections from the words of data in ff_data
+
+        ff_data is a matrix with the fixed-fixed region of each row in each\
+        row of the matrix; rows shorter than the matrix are padded at the\
+        end, so only the words given by ff_size are valid in each row.
         """
@@ -1,4 +1,3 @@
-import math
 import numpy
 from six import add_metaclass
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
@@ -93,17 +92,32 @@ class AbstractSynapseDynamics(object):
         """ Converts per-connection data generated from connections into\
             row-based data to be returned from get_synaptic_data
         """
+        if n_rows == 0:
+            return []
+
+        # Sort the connections by row, keeping the connections of each row
+        # in their original order by sorting on a single key of row and
+        # position; each row is then a consecutive block of the data.  This
+        # is only needed if the connections are not already in row order.
+        connection_row_indices = numpy.asarray(connection_row_indices)
+        if (connection_row_indices[1:] < connection_row_indices[:-1]).any():
+            n_connections = len(connection_row_indices)
+            data = data[numpy.argsort(
+                connection_row_indices.astype("int64") * n_connections +
+                numpy.arange(n_connections))]
+        row_lengths = numpy.bincount(
+            connection_row_indices, minlength=n_rows)[:n_rows]
         return [
-            data[connection_row_indices == i].reshape(-1)
-            for i in range(n_rows)]
+            row.reshape(-1) for row in numpy.split(
+                data, numpy.cumsum(row_lengths[:-1]))]
 
     def get_n_items(self, rows, item_size):
         """ Get the number of items in each row as 4-byte values, given the\
             item size
         """
-        return numpy.array([
-            int(math.ceil(float(row.size) / float(item_size)))
-            for row in rows], dtype="uint32").reshape((-1, 1))
+        sizes = numpy.fromiter(
+            (row.size for row in rows), dtype="uint32", count=len(rows))
+        return ((sizes + (item_size - 1)) // item_size).reshape((-1, 1))
 
     def get_words(self, rows):
         """ Convert the row data to words
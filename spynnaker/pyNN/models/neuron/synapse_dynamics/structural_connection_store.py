@@ -0,0 +1,108 @@
+from collections import OrderedDict
+import numpy
+from spinn_front_end_common.utilities.utility_objs import ProvenanceDataItem
+
+
+class StructuralConnectionStore(object):
+    """ A compact store of the initial connections of structural synapses,\
+        holding only the source and target of each connection, grouped by\
+        post-synaptic slice and then by machine edge.  The connections of a\
+        slice are released once they have been written, and are stored\
+        again if the synaptic data is generated again.
+    """
+
+    __slots__ = [
+        # The connections as (app_edge, sources, targets) lists indexed by
+        # (post_vertex, post_slice lo_atom) and then by machine edge
+        "_slices",
+
+        # The number of bytes currently held
+        "_n_bytes",
+
+        # The largest number of bytes held at once
+        "_max_n_bytes",
+
+        # The number of slices released after being written
+        "_n_released"]
+
+    def __init__(self):
+        self._slices = dict()
+        self._n_bytes = 0
+        self._max_n_bytes = 0
+        self._n_released = 0
+
+    def add(self, connections, post_vertex_slice, app_edge, machine_edge):
+        """ Add the connections of a machine edge to the store
+
+        :param connections: The connections to add
+        :type connections: numpy.ndarray
+        :param post_vertex_slice: The slice of the post-synaptic vertex
+        :param app_edge: The application edge of the connections
+        :param machine_edge: The machine edge of the connections
+        """
+        if not len(connections):
+            return
+        key = (app_edge.post_vertex, post_vertex_slice.lo_atom)
+        edges = self._slices.setdefault(key, OrderedDict())
+        if machine_edge not in edges:
+            edges[machine_edge] = (app_edge, list(), list())
+        _, sources, targets = edges[machine_edge]
+        sources.append(connections["source"].astype("uint32"))
+        targets.append(connections["target"].astype("uint32"))
+        self._n_bytes += sources[-1].nbytes + targets[-1].nbytes
+        self._max_n_bytes = max(self._max_n_bytes, self._n_bytes)
+
+    def get_connections(self, post_vertex, post_vertex_slice):
+        """ Get the connections of a post-synaptic slice, in the order their\
+            machine edges were first added
+
+        :param post_vertex: The post-synaptic application vertex
+        :param post_vertex_slice: The slice of the post-synaptic vertex
+        :return: iterable of (app_edge, machine_edge, sources, targets)
+        """
+        edges = self._slices.get(
+            (post_vertex, post_vertex_slice.lo_atom), OrderedDict())
+        for machine_edge, (app_edge, sources, targets) in edges.items():
+            if len(sources) > 1:
+                sources[:] = [numpy.concatenate(sources)]
+                targets[:] = [numpy.concatenate(targets)]
+            yield app_edge, machine_edge, sources[0], targets[0]
+
+    def release(self, post_vertex, post_vertex_slice):
+        """ Remove the connections of a post-synaptic slice from the store
+
+        :param post_vertex: The post-synaptic application vertex
+        :param post_vertex_slice: The slice of the post-synaptic vertex
+        """
+        edges = self._slices.pop(
+            (post_vertex, post_vertex_slice.lo_atom), None)
+        if edges is None:
+            return
+        for _, sources, targets in edges.values():
+            self._n_bytes -= sum(s.nbytes for s in sources)
+            self._n_bytes -= sum(t.nbytes for t in targets)
+        self._n_released += 1
+
+    @property
+    def n_bytes(self):
+        """ The number of bytes of connections currently held
+        """
+        return self._n_bytes
+
+    @property
+    def max_n_bytes(self):
+        """ The largest number of bytes of connections held at once
+        """
+        return self._max_n_bytes
+
+    def get_provenance_data(self, label):
+        """ Get provenance data items for the memory used by the store
+
+        :param label: The label of the population the store is for
+        :rtype: list(ProvenanceDataItem)
+        """
+        name = "{}_structural_connection_store".format(label)
+        return [
+            ProvenanceDataItem([name, "Bytes_held"], self._n_bytes),
+            ProvenanceDataItem([name, "Max_bytes_held"], self._max_n_bytes),
+            ProvenanceDataItem([name, "Slices_released"], self._n_released)]
@@ -113,10 +113,12 @@ class SynapseDynamicsStatic(
         n_neuron_id_bits = get_n_bits(post_vertex_slice.n_atoms)
         neuron_id_mask = (1 << n_neuron_id_bits) - 1
 
-        data = numpy.concatenate(ff_data)
+        ff_words = self.get_n_static_words_per_row(ff_size)
+        data = ff_data[
+            numpy.arange(ff_data.shape[1]) < ff_words.reshape(-1, 1)]
         connections = numpy.zeros(data.size, dtype=self.NUMPY_CONNECTORS_DTYPE)
-        connections["source"] = numpy.concatenate(
-            [numpy.repeat(i, ff_size[i]) for i in range(len(ff_size))])
+        connections["source"] = numpy.repeat(
+            numpy.arange(len(ff_size)), ff_size)
         connections["target"] = (
             (data & neuron_id_mask) + post_vertex_slice.lo_atom)
         connections["weight"] = (data >> 16) & 0xFFFF
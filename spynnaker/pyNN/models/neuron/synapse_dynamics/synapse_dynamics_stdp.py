@@ -286,26 +286,31 @@ class SynapseDynamicsSTDP(
         n_neuron_id_bits = get_n_bits(post_vertex_slice.n_atoms)
         neuron_id_mask = (1 << n_neuron_id_bits) - 1
 
-        data_fixed = numpy.concatenate([
-            fp_data[i].view(dtype="uint16")[0:fp_size[i]]
-            for i in range(n_rows)])
-        pp_without_headers = [
-            row.view(dtype="uint8")[self._n_header_bytes:] for row in pp_data]
+        # Each fixed-plastic synapse is a half-word, so only take those
+        # half-words in each row that are in use
+        fp_half_words = numpy.ascontiguousarray(fp_data).view("uint16")
+        max_synapses = int(numpy.max(fp_size)) if n_rows else 0
+        synapse_mask = (
+            numpy.arange(max_synapses) < fp_size.reshape(-1, 1))
+        data_fixed = fp_half_words[:, :max_synapses][synapse_mask]
+
+        # The weight of each synapse is a half-word of the plastic-plastic
+        # data for that synapse, after the header of each row
         synapse_structure = self._timing_dependence.synaptic_structure
         n_half_words = synapse_structure.get_n_half_words_per_connection()
         half_word = synapse_structure.get_weight_half_word()
-        pp_half_words = numpy.concatenate([
-            pp[:size * n_half_words * 2].view("uint16")[
-                half_word::n_half_words]
-            for pp, size in zip(pp_without_headers, fp_size)])
+        pp_half_words = numpy.ascontiguousarray(pp_data).view("uint16")
+        weight_columns = (
+            (self._n_header_bytes // 2) + half_word +
+            (numpy.arange(max_synapses) * n_half_words))
+        pp_weights = pp_half_words[:, weight_columns][synapse_mask]
 
         connections = numpy.zeros(
             data_fixed.size, dtype=self.NUMPY_CONNECTORS_DTYPE)
-        connections["source"] = numpy.concatenate(
-            [numpy.repeat(i, fp_size[i]) for i in range(len(fp_size))])
+        connections["source"] = numpy.repeat(numpy.arange(n_rows), fp_size)
         connections["target"] = (
             (data_fixed & neuron_id_mask) + post_vertex_slice.lo_atom)
-        connections["weight"] = pp_half_words
+        connections["weight"] = pp_weights
         connections["delay"] = (data_fixed >> (
             n_neuron_id_bits + n_synapse_type_bits)) & 0xF
         connections["delay"][connections["delay"] == 0] = 16
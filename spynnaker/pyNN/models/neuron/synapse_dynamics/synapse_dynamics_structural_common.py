@@ -4,10 +4,18 @@ from six import itervalues
 from data_specification.enums.data_type import DataType
 from spynnaker.pyNN.models.neural_projections import ProjectionApplicationEdge
 from spynnaker.pyNN.models.neural_projections import ProjectionMachineEdge
+from .structural_connection_store import StructuralConnectionStore
 from .abstract_synapse_dynamics_structural import (
     AbstractSynapseDynamicsStructural)
 from spynnaker.pyNN.utilities import constants
 
+# The distance-dependent probability LUTs, indexed by
+# (grid, probability, sigma), least recently used first
+_distance_probabilities = collections.OrderedDict()
+
+# The most LUTs to keep in the above
+_MAX_DISTANCE_PROBABILITIES = 16
+
 
 class SynapseDynamicsStructuralCommon(AbstractSynapseDynamicsStructural):
     """ Common class that enables synaptic rewiring. It acts as a wrapper
@@ -79,8 +87,8 @@ class SynapseDynamicsStructuralCommon(AbstractSynapseDynamicsStructural):
         "_grid",
         # Flag whether to randomly select pre-synaptic partner for formation
         "_random_partner",
-        # Holds initial connectivity as defined via connector
-        "_connections",
+        # Holds initial connectivity as defined via connector until written
+        "_connection_store",
         # SDRAM usage estimates are not perfect. This value adjusts estimates
         "fudge_factor",
         # Maximum synaptic row length based on connectivity + padding
@@ -98,6 +106,10 @@ class SynapseDynamicsStructuralCommon(AbstractSynapseDynamicsStructural):
         # Exponentially decayed probability LUT for lateral formations
         "_lat_distance_probabilities"]
 
+    # The maximum number of distances to compute at once when generating the
+    # distance-dependent probability LUTs
+    MAX_DISTANCE_BLOCK_SIZE = 2 ** 20
+
     default_parameters = {
         'stdp_model': None, 'f_rew': 10 ** 4, 'weight': 0, 'delay': 1,
         's_max': 32, 'sigma_form_forward': 2.5, 'sigma_form_lateral': 1,
@@ -136,7 +148,7 @@ class SynapseDynamicsStructuralCommon(AbstractSynapseDynamicsStructural):
         self._p_elim_pot = p_elim_pot
         self._grid = np.asarray(grid, dtype=int)
         self._random_partner = random_partner
-        self._connections = {}
+        self._connection_store = StructuralConnectionStore()
 
         self.fudge_factor = 1.5
         self._actual_row_max_length = self._s_max
@@ -175,25 +187,27 @@ class SynapseDynamicsStructuralCommon(AbstractSynapseDynamicsStructural):
         """ Compute the distance between points x0 and x1 place on the grid\
             using periodic boundary conditions.
 
-        :param x0: first point in space
+        :param x0: first point in space, or an array of points with the\
+            coordinates in the last dimension
         :type x0: np.ndarray of ints
-        :param x1: second point in space
+        :param x1: second point in space, or an array of points with the\
+            coordinates in the last dimension
         :type x1: np.ndarray of ints
         :param grid: shape of grid
         :type grid: np.ndarray of ints
         :param type: distance metric, i.e. euclidian or manhattan
         :type type: str
-        :return: the distance
-        :rtype: float
+        :return: the distance, or an array of distances between the points\
+            broadcast together
+        :rtype: float or np.ndarray of floats
         """
         x0 = np.asarray(x0)
         x1 = np.asarray(x1)
         delta = np.abs(x0 - x1)
-        if (delta[0] > grid[0] * .5) and grid[0] > 0:
-            delta[0] -= grid[0]
-
-        if (delta[1] > grid[1] * .5) and grid[1] > 0:
-            delta[1] -= grid[1]
+        for axis in range(2):
+            if grid[axis] > 0:
+                axis_delta = delta[..., axis]
+                axis_delta[axis_delta > grid[axis] * .5] -= grid[axis]
 
         if type == 'manhattan':
             return np.abs(delta).sum(axis=-1)
@@ -209,19 +223,34 @@ class SynapseDynamicsStructuralCommon(AbstractSynapseDynamicsStructural):
         :return: distance-dependent probabilities
         :rtype: numpy.ndarray(float)
         """
-        euclidian_distances = np.ones(self._grid ** 2) * np.nan
-        for row in range(euclidian_distances.shape[0]):
-            for column in range(euclidian_distances.shape[1]):
-                if self._grid[0] > 1:
-                    pre = (row // self._grid[0], row % self._grid[1])
-                    post = (column // self._grid[0], column % self._grid[1])
-                else:
-                    pre = (0, row % self._grid[1])
-                    post = (0, column % self._grid[1])
-
-                euclidian_distances[row, column] = \
-                    self.distance(pre, post, grid=self._grid, type='euclidian')
-        largest_squared_distance = np.max(euclidian_distances ** 2)
+        key = (tuple(self._grid), probability, sigma)
+        if key in _distance_probabilities:
+            probabilities = _distance_probabilities.pop(key)
+            _distance_probabilities[key] = probabilities
+            return probabilities
+
+        rows = np.arange(self._grid[0] ** 2)
+        columns = np.arange(self._grid[1] ** 2)
+        if self._grid[0] > 1:
+            pre = np.column_stack(
+                (rows // self._grid[0], rows % self._grid[1]))
+            post = np.column_stack(
+                (columns // self._grid[0], columns % self._grid[1]))
+        else:
+            pre = np.column_stack(
+                (np.zeros_like(rows), rows % self._grid[1]))
+            post = np.column_stack(
+                (np.zeros_like(columns), columns % self._grid[1]))
+
+        # Find the largest distance a block of rows at a time to limit the
+        # memory used on large grids
+        block_size = max(1, self.MAX_DISTANCE_BLOCK_SIZE // len(columns))
+        largest_distance = max(
+            np.max(self.distance(
+                pre[start:start + block_size, np.newaxis], post,
+                grid=self._grid, type='euclidian'))
+            for start in range(0, len(rows), block_size))
+        largest_squared_distance = largest_distance ** 2
         squared_distances = np.arange(largest_squared_distance)
         raw_probabilities = probability * (
             np.exp(-squared_distances / (2 * sigma ** 2)))
@@ -237,6 +266,11 @@ class SynapseDynamicsStructuralCommon(AbstractSynapseDynamicsStructural):
                 (filtered_probabilities,
                  np.zeros(filtered_probabilities.size % 2, dtype="uint16")))
 
+        # The LUT is shared between instances, so must not be changed
+        filtered_probabilities.flags.writeable = False
+        while len(_distance_probabilities) >= _MAX_DISTANCE_PROBABILITIES:
+            _distance_probabilities.popitem(last=False)
+        _distance_probabilities[key] = filtered_probabilities
         return filtered_probabilities
 
     @property
@@ -603,58 +637,72 @@ class SynapseDynamicsStructuralCommon(AbstractSynapseDynamicsStructural):
         :return: None
         :rtype: None
         """
+        # Work out the index of each population, and the index of each of
+        # its subpopulations in order of lo_atom
+        subpopulation_indices = dict()
+        for pop_index, (pre_vertex, subpopulation_list) in enumerate(
+                population_to_subpopulation_information.items()):
+            lo_atoms = sorted(info[2] for info in subpopulation_list)
+            subpop_indices = dict()
+            for subpop_index, lo_atom in enumerate(lo_atoms):
+                subpop_indices.setdefault(lo_atom, subpop_index)
+            subpopulation_indices[pre_vertex] = (pop_index, subpop_indices)
+
+        # Get the identifier and local target of each synapse in order
+        identifiers = list()
+        targets = list()
+        for app_edge, machine_edge, sources, edge_targets in \
+                self._connection_store.get_connections(app_vertex, post_slice):
+            pre_vertex_slice = graph_mapper.get_slice(machine_edge.pre_vertex)
+            pop_index, subpop_indices = subpopulation_indices[
+                app_edge.pre_vertex]
+            masked_pop_index = pop_index & (2 ** 9 - 1)
+            masked_sub_pop_index = subpop_indices[
+                pre_vertex_slice.lo_atom] & (2 ** 9 - 1)
+            masked_pre_vertex_ids = (
+                sources.astype("int64") -
+                pre_vertex_slice.lo_atom) & (2 ** 17 - 1)
+
+            # identifier combines the vertex, pop and subpop
+            # into 1 x 32 bit word
+            identifiers.append(
+                (masked_pop_index << (32 - 8)) |
+                (masked_sub_pop_index << 16) | masked_pre_vertex_ids)
+            targets.append(edge_targets.astype("int64") - post_slice.lo_atom)
+
         # Setting up Post to Pre table
         post_to_pre_table = np.ones((post_slice.n_atoms, self._s_max),
                                     dtype=np.int32) * -1
-        for row in self._connections[post_slice.lo_atom]:
-            if row[0].size > 0 and row[1].post_vertex is app_vertex:
-                for source, target, _weight, _delay, _syn_type in row[0]:
-
-                    # Select pre vertex
-                    pre_vertex_slice = graph_mapper._slice_by_machine_vertex[
-                        row[2].pre_vertex]
-                    pre_vertex_id = source - pre_vertex_slice.lo_atom
-                    masked_pre_vertex_id = pre_vertex_id & (2 ** 17 - 1)
-
-                    # Select population index
-                    pop_index = population_to_subpopulation_information. \
-                        keys().index(row[1].pre_vertex)
-                    masked_pop_index = pop_index & (2 ** 9 - 1)
-
-                    # Select subpopulation index
-                    dt = np.dtype(
-                        [('key', 'int'), ('n_atoms', 'int'),
-                         ('lo_atom', 'int'), ('mask', 'uint')])
-                    structured_array = np.array(
-                        population_to_subpopulation_information[
-                            row[1].pre_vertex], dtype=dt)
-                    sorted_info_list = np.sort(
-                        structured_array, order='lo_atom')
-
-                    # find index where lo_atom equals the one in
-                    # pre_vertex_slice
-                    subpop_index = np.argwhere(
-                        sorted_info_list['lo_atom'] ==
-                        pre_vertex_slice.lo_atom).ravel()[0]
-                    masked_sub_pop_index = subpop_index & (2 ** 9 - 1)
-
-                    # identifier combines the vertex, pop and subpop
-                    # into 1 x 32 bit word
-                    identifier = (masked_pop_index << (32 - 8)) | (
-                            masked_sub_pop_index << 16) | masked_pre_vertex_id
-                    try:
-                        synaptic_entry = np.argmax(
-                            post_to_pre_table[target - post_slice.lo_atom] ==
-                            -1).ravel()[0]
-                    except Exception:
-                        break
-                    post_to_pre_table[
-                        target - post_slice.lo_atom, synaptic_entry] = \
-                        identifier
+        if identifiers and self._s_max > 0:
+            identifiers = np.concatenate(identifiers).astype(np.int32)
+            targets = np.concatenate(targets)
+
+            # Each target fills its slots in order of its synapses; the
+            # slot of each synapse is its position among those of its target
+            order = np.argsort(targets, kind="mergesort")
+            sorted_targets = targets[order]
+            group_starts = np.flatnonzero(np.concatenate(
+                ([True], sorted_targets[1:] != sorted_targets[:-1])))
+            group_sizes = np.diff(np.append(group_starts, len(order)))
+            slots = np.arange(len(order)) - np.repeat(
+                group_starts, group_sizes)
+            fits = slots < self._s_max
+            post_to_pre_table[sorted_targets[fits], slots[fits]] = \
+                identifiers[order[fits]]
+
+            # Once the slots of a target are full, each further synapse
+            # overwrites the first slot, so the last of them is kept
+            overflowed = group_sizes > self._s_max
+            group_ends = group_starts + group_sizes - 1
+            post_to_pre_table[sorted_targets[group_ends[overflowed]], 0] = \
+                identifiers[order[group_ends[overflowed]]]
 
         spec.write_array(post_to_pre_table.ravel(), data_type=DataType.INT32)
         total_words_written += post_to_pre_table.size
 
+        # The connections are stored again if the synaptic data is regenerated
+        self._connection_store.release(app_vertex, post_slice)
+
         self.actual_sdram_usage[
             machine_vertex] = 4 * 27 + 4 * total_words_written
 
@@ -730,12 +778,19 @@ class SynapseDynamicsStructuralCommon(AbstractSynapseDynamicsStructural):
     def synaptic_data_update(self, connections,
                              post_vertex_slice,
                              app_edge, machine_edge):
-        """ Get static synaptic data
+        """ Store the initial connections of a machine edge until the\
+            post-to-pre table of its post-synaptic slice is written
+        """
+        self._connection_store.add(
+            connections, post_vertex_slice, app_edge, machine_edge)
+
+    def get_provenance_data(self, label):
+        """ Get provenance data items for the initial connections stored
+
+        :param label: The label of the population
+        :rtype: list(ProvenanceDataItem)
         """
-        if post_vertex_slice.lo_atom not in self._connections.keys():
-            self._connections[post_vertex_slice.lo_atom] = []
-        self._connections[post_vertex_slice.lo_atom].append(
-            (connections, app_edge, machine_edge))
+        return self._connection_store.get_provenance_data(label)
 
     def n_words_for_plastic_connections(self, value):
         """ Get size of plastic connections in words
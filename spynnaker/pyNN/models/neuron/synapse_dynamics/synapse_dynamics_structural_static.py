@@ -196,6 +196,15 @@ class SynapseDynamicsStructuralStatic(AbstractSynapseDynamicsStructural,
                                                      n_synapse_types, ff_size,
                                                      ff_data)
 
+    def get_provenance_data(self, label):
+        """ Get provenance data items for the initial connections stored\
+            for rewiring
+
+        :param label: The label of the population
+        :rtype: list(ProvenanceDataItem)
+        """
+        return self._common_sp.get_provenance_data(label)
+
     @overrides(SynapseDynamicsStatic.get_parameter_names)
     def get_parameter_names(self):
         names = super(SynapseDynamicsStructuralStatic,
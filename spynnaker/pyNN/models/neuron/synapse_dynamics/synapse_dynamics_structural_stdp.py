@@ -195,6 +195,15 @@ class SynapseDynamicsStructuralSTDP(AbstractSynapseDynamicsStructural,
             post_vertex_slice, n_synapse_types,
             pp_size, pp_data, fp_size, fp_data)
 
+    def get_provenance_data(self, label):
+        """ Get provenance data items for the initial connections stored\
+            for rewiring
+
+        :param label: The label of the population
+        :rtype: list(ProvenanceDataItem)
+        """
+        return self._common_sp.get_provenance_data(label)
+
     @overrides(SynapseDynamicsSTDP.get_parameter_names)
     def get_parameter_names(self):
         names = super(SynapseDynamicsStructuralSTDP,
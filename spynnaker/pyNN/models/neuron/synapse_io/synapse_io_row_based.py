@@ -108,13 +108,36 @@ class SynapseIORowBased(AbstractSynapseIO):
             undelayed_max_bytes, delayed_max_bytes,
             undelayed_max_n_words, delayed_max_n_words)
 
+    @staticmethod
+    def _get_row_sizes(rows, n_rows):
+        """ Get the number of words in each of the given rows, where rows of\
+            None indicate that all the rows are empty
+        """
+        if rows is None:
+            return numpy.zeros(n_rows, dtype="int64")
+        return numpy.fromiter(
+            (row.size for row in rows), dtype="int64", count=n_rows)
+
+    @staticmethod
+    def _write_rows(row_data, rows, row_sizes, first_column):
+        """ Write variable length rows into a preallocated matrix, starting\
+            each row at the given column
+        """
+        n_items = int(numpy.sum(row_sizes))
+        if not n_items:
+            return
+        row_ids = numpy.repeat(numpy.arange(len(row_sizes)), row_sizes)
+        row_starts = numpy.cumsum(row_sizes) - row_sizes
+        columns = (numpy.arange(n_items) - row_starts[row_ids]) + \
+            first_column[row_ids]
+        row_data[row_ids, columns] = numpy.concatenate(rows)
+
     @staticmethod
     def _get_max_row_length_and_row_data(
             connections, row_indices, n_rows, post_vertex_slice,
             n_synapse_types, population_table, synapse_dynamics,
             app_edge, machine_edge):
         # pylint: disable=too-many-arguments, too-many-locals
-        row_ids = range(n_rows)
         ff_data, ff_size = None, None
         fp_data, pp_data, fp_size, pp_size = None, None, None, None
         if (isinstance(synapse_dynamics, AbstractStaticSynapseDynamics) or
@@ -130,19 +153,9 @@ class SynapseIORowBased(AbstractSynapseIO):
                 ff_data, ff_size = synapse_dynamics.get_static_synaptic_data(
                     connections, row_indices, n_rows, post_vertex_slice,
                     n_synapse_types)
-
-            # Blank the plastic data
-            fp_data = [numpy.zeros(0, dtype="uint32") for _ in range(n_rows)]
-            pp_data = [numpy.zeros(0, dtype="uint32") for _ in range(n_rows)]
-            fp_size = [numpy.zeros(1, dtype="uint32") for _ in range(n_rows)]
-            pp_size = [numpy.zeros(1, dtype="uint32") for _ in range(n_rows)]
         elif (isinstance(synapse_dynamics, SynapseDynamicsSTDP) or
               isinstance(synapse_dynamics, SynapseDynamicsStructuralSTDP)):
 
-            # Blank the static data
-            ff_data = [numpy.zeros(0, dtype="uint32") for _ in row_ids]
-            ff_size = [numpy.zeros(1, dtype="uint32") for _ in row_ids]
-
             # Get the plastic data
             if isinstance(synapse_dynamics, AbstractSynapseDynamicsStructural):
                 fp_data, pp_data, fp_size, pp_size = \
@@ -156,26 +169,38 @@ class SynapseIORowBased(AbstractSynapseIO):
                         connections, row_indices, n_rows, post_vertex_slice,
                         n_synapse_types)
 
-        # Add some padding
-        row_lengths = [
-            _N_HEADER_WORDS + pp_data[i].size + fp_data[i].size +
-            ff_data[i].size for i in row_ids]
-        max_length = max(row_lengths) - _N_HEADER_WORDS
+        # Get the number of words of each part of each row; parts that are
+        # not used by the dynamics are left blank
+        ff_words = SynapseIORowBased._get_row_sizes(ff_data, n_rows)
+        fp_words = SynapseIORowBased._get_row_sizes(fp_data, n_rows)
+        pp_words = SynapseIORowBased._get_row_sizes(pp_data, n_rows)
+
+        # Work out the padded row length
+        max_length = int(numpy.max(pp_words + fp_words + ff_words))
         max_row_length = population_table.get_allowed_row_length(max_length)
-        padding = [
-            numpy.zeros(
-                max_row_length - (row_length - _N_HEADER_WORDS),
-                dtype="uint32")
-            for row_length in row_lengths]
-
-        # Join the bits into rows
-        items_to_join = [
-            pp_size, pp_data, ff_size, fp_size, ff_data, fp_data, padding]
-        rows = [numpy.concatenate(items) for items in zip(*items_to_join)]
-        row_data = numpy.concatenate(rows)
+
+        # Fill in the rows in one matrix, leaving the padding as zeros; each
+        # row is [pp_size, pp_data, ff_size, fp_size, ff_data, fp_data]
+        row_data = numpy.zeros(
+            (n_rows, max_row_length + _N_HEADER_WORDS), dtype="uint32")
+        row_ids = numpy.arange(n_rows)
+        if pp_size is not None:
+            row_data[:, 0] = numpy.asarray(pp_size).reshape(-1)
+        SynapseIORowBased._write_rows(
+            row_data, pp_data, pp_words, numpy.ones(n_rows, dtype="int64"))
+        if ff_size is not None:
+            row_data[row_ids, pp_words + 1] = numpy.asarray(
+                ff_size).reshape(-1)
+        if fp_size is not None:
+            row_data[row_ids, pp_words + 2] = numpy.asarray(
+                fp_size).reshape(-1)
+        ff_start = pp_words + _N_HEADER_WORDS
+        SynapseIORowBased._write_rows(row_data, ff_data, ff_words, ff_start)
+        SynapseIORowBased._write_rows(
+            row_data, fp_data, fp_words, ff_start + ff_words)
 
         # Return the data
-        return max_row_length, row_data
+        return max_row_length, row_data.reshape(-1)
 
     @overrides(AbstractSynapseIO.get_synapses)
     def get_synapses(
@@ -318,15 +343,27 @@ class SynapseIORowBased(AbstractSynapseIO):
         return connections
 
     @staticmethod
-    def _parse_static_data(row_data, dynamics):
-        n_rows = row_data.shape[0]
+    def _parse_static_data(row_data):
+        """ Split the rows into the fixed-fixed sizes and a matrix of the\
+            fixed-fixed region of each row, which is padded beyond the size of\
+            each row
+        """
         ff_size = row_data[:, 1]
-        ff_words = dynamics.get_n_static_words_per_row(ff_size)
-        ff_start = _N_HEADER_WORDS
-        ff_end = ff_start + ff_words
-        return (
-            ff_size,
-            [row_data[row, ff_start:ff_end[row]] for row in range(n_rows)])
+        return ff_size, row_data[:, _N_HEADER_WORDS:]
+
+    @staticmethod
+    def _undo_delay_stages(connections, n_synapses, pre_vertex_slice):
+        """ Use the row index of each delayed connection to work out the\
+            actual delay and source of the connection
+        """
+        n_rows = len(n_synapses)
+        row_stage = (
+            numpy.arange(n_rows, dtype="uint32") //
+            numpy.uint32(pre_vertex_slice.n_atoms))
+        connection_stage = numpy.repeat(row_stage, n_synapses)
+        connections["source"] -= (
+            connection_stage * numpy.uint32(pre_vertex_slice.n_atoms))
+        connections["delay"] += (connection_stage + 1) * 16
 
     def _read_static_data(self, dynamics, pre_vertex_slice, post_vertex_slice,
                           n_synapse_types, row_data, delayed_row_data):
@@ -336,55 +373,48 @@ class SynapseIORowBased(AbstractSynapseIO):
         connections = []
 
         if row_data is not None and row_data.size:
-            ff_size, ff_data = self._parse_static_data(row_data, dynamics)
+            ff_size, ff_data = self._parse_static_data(row_data)
             undelayed_connections = dynamics.read_static_synaptic_data(
                 post_vertex_slice, n_synapse_types, ff_size, ff_data)
             undelayed_connections["source"] += pre_vertex_slice.lo_atom
             connections.append(undelayed_connections)
 
         if delayed_row_data is not None and delayed_row_data.size:
-            ff_size, ff_data = self._parse_static_data(
-                delayed_row_data, dynamics)
+            ff_size, ff_data = self._parse_static_data(delayed_row_data)
             delayed_connections = dynamics.read_static_synaptic_data(
                 post_vertex_slice, n_synapse_types, ff_size, ff_data)
-
-            # Use the row index to work out the actual delay and source
-            n_synapses = dynamics.get_n_synapses_in_rows(ff_size)
-            synapse_ids = range(len(n_synapses))
-            row_stage = numpy.array([
-                i // pre_vertex_slice.n_atoms
-                for i in synapse_ids], dtype="uint32")
-            row_min_delay = (row_stage + 1) * 16
-            connection_min_delay = numpy.concatenate([
-                numpy.repeat(row_min_delay[i], n_synapses[i])
-                for i in synapse_ids])
-            connection_source_extra = numpy.concatenate([
-                numpy.repeat(
-                    row_stage[i] * numpy.uint32(pre_vertex_slice.n_atoms),
-                    n_synapses[i])
-                for i in synapse_ids])
-            delayed_connections["source"] -= connection_source_extra
+            self._undo_delay_stages(
+                delayed_connections, dynamics.get_n_synapses_in_rows(ff_size),
+                pre_vertex_slice)
             delayed_connections["source"] += pre_vertex_slice.lo_atom
-            delayed_connections["delay"] += connection_min_delay
             connections.append(delayed_connections)
 
         return connections
 
     @staticmethod
     def _parse_plastic_data(row_data, dynamics):
-        n_rows = row_data.shape[0]
+        """ Split the rows into the plastic-plastic and fixed-plastic sizes,\
+            and matrices of the plastic-plastic and fixed-plastic regions of\
+            each row, which are padded beyond the size of each row
+        """
+        n_rows, n_columns = row_data.shape
         pp_size = row_data[:, 0]
         pp_words = dynamics.get_n_plastic_plastic_words_per_row(pp_size)
         fp_size = row_data[numpy.arange(n_rows), pp_words + 2]
         fp_words = dynamics.get_n_fixed_plastic_words_per_row(fp_size)
-        fp_start = pp_size + _N_HEADER_WORDS
-        fp_end = fp_start + fp_words
-        row_ids = range(n_rows)
-        return (
-            pp_size,
-            [row_data[row, 1:pp_words[row] + 1] for row in row_ids],
-            fp_size,
-            [row_data[row, fp_start[row]:fp_end[row]] for row in row_ids])
+
+        # The plastic-plastic region always starts just after the size
+        max_pp_words = int(numpy.max(pp_words)) if n_rows else 0
+        pp_data = row_data[:, 1:max_pp_words + 1]
+
+        # The fixed-plastic region starts at a different place in each row,
+        # so gather it into aligned columns
+        max_fp_words = int(numpy.max(fp_words)) if n_rows else 0
+        fp_columns = numpy.minimum(
+            (pp_size.reshape(-1, 1) + _N_HEADER_WORDS) +
+            numpy.arange(max_fp_words), n_columns - 1)
+        fp_data = row_data[numpy.arange(n_rows).reshape(-1, 1), fp_columns]
+        return pp_size, pp_data, fp_size, fp_data
 
     def _read_plastic_data(
             self, dynamics, pre_vertex_slice, post_vertex_slice,
@@ -409,26 +439,11 @@ class SynapseIORowBased(AbstractSynapseIO):
             delayed_connections = dynamics.read_plastic_synaptic_data(
                 post_vertex_slice, n_synapse_types, pp_size, pp_data,
                 fp_size, fp_data)
-
-            # Use the row index to work out the actual delay and source
-            n_synapses = dynamics.get_n_synapses_in_rows(pp_size, fp_size)
-            synapse_ids = range(len(n_synapses))
-            row_stage = numpy.array([
-                (i // pre_vertex_slice.n_atoms)
-                for i in synapse_ids], dtype="uint32")
-            row_min_delay = (row_stage + 1) * 16
-            connection_min_delay = numpy.concatenate([
-                numpy.repeat(row_min_delay[i], n_synapses[i])
-                for i in synapse_ids])
-            connection_source_extra = numpy.concatenate([
-                numpy.repeat(
-                    row_stage[i] * numpy.uint32(pre_vertex_slice.n_atoms),
-                    n_synapses[i])
-                for i in synapse_ids])
-
-            delayed_connections["source"] -= connection_source_extra
+            self._undo_delay_stages(
+                delayed_connections,
+                dynamics.get_n_synapses_in_rows(pp_size, fp_size),
+                pre_vertex_slice)
             delayed_connections["source"] += pre_vertex_slice.lo_atom
-            delayed_connections["delay"] += connection_min_delay
             connections.append(delayed_connections)
 
         return connections
@@ -0,0 +1,199 @@
+from collections import OrderedDict
+import tempfile
+import threading
+import numpy
+from spinn_front_end_common.utilities.utility_objs import ProvenanceDataItem
+
+
+class SynapticBlockCache(object):
+    """ A least-recently-used cache of the synaptic blocks read from the\
+        machine, limited to a number of bytes.  Blocks pushed out of memory\
+        can optionally be kept in a memory-mapped scratch file instead of\
+        being dropped.
+    """
+
+    __slots__ = [
+        # The blocks in memory, in order of least to most recently used,
+        # indexed by (placement, key, index)
+        "_blocks",
+
+        # The number of bytes held in memory
+        "_n_bytes",
+
+        # The maximum number of bytes to hold in memory, or None for no limit
+        "_max_bytes",
+
+        # True if blocks removed from memory should go to the scratch file
+        "_spill",
+
+        # The scratch file, or None if not yet created
+        "_spill_file",
+
+        # The number of bytes written to the scratch file
+        "_spill_file_size",
+
+        # The blocks in the scratch file as (offset, n_bytes, max_row_length)
+        # indexed by (placement, key, index)
+        "_spilled_blocks",
+
+        # Counts of cache hits, misses, evictions and spills
+        "_n_hits",
+        "_n_misses",
+        "_n_evictions",
+        "_n_spills",
+
+        # Lock as blocks may be read from several cores at once
+        "_lock"]
+
+    def __init__(self, max_bytes=None, spill=False):
+        """
+        :param max_bytes: \
+            The maximum number of bytes of blocks to hold in memory, or None\
+            for no limit
+        :param spill: \
+            True if blocks removed from memory should be written to a\
+            memory-mapped scratch file instead of being dropped
+        """
+        self._max_bytes = max_bytes
+        self._spill = spill
+        self._blocks = OrderedDict()
+        self._n_bytes = 0
+        self._spill_file = None
+        self._spill_file_size = 0
+        self._spilled_blocks = dict()
+        self._n_hits = 0
+        self._n_misses = 0
+        self._n_evictions = 0
+        self._n_spills = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _block_size(block):
+        if block is None:
+            return 0
+        return len(block)
+
+    def get(self, key):
+        """ Get a block from the cache
+
+        :param key: The (placement, key, index) of the block
+        :return: \
+            The (block, max_row_length) of the block, or None if the block is\
+            not in the cache
+        """
+        with self._lock:
+            if key in self._blocks:
+                self._n_hits += 1
+
+                # Move the block to the most recently used end
+                value = self._blocks.pop(key)
+                self._blocks[key] = value
+                return value
+            if key in self._spilled_blocks:
+                self._n_hits += 1
+                offset, n_bytes, max_row_length = self._spilled_blocks[key]
+                if not n_bytes:
+                    return numpy.zeros(0, dtype="uint8"), max_row_length
+                return numpy.memmap(
+                    self._spill_file, dtype="uint8", mode="r",
+                    offset=offset, shape=(n_bytes,)), max_row_length
+            self._n_misses += 1
+            return None
+
+    def add(self, key, block, max_row_length):
+        """ Add a block to the cache, removing the least recently used blocks\
+            from memory if there is not enough space
+
+        :param key: The (placement, key, index) of the block
+        :param block: The data of the block
+        :param max_row_length: The maximum row length of the block
+        """
+        with self._lock:
+            if key in self._blocks:
+                old_block, _ = self._blocks.pop(key)
+                self._n_bytes -= self._block_size(old_block)
+            self._blocks[key] = (block, max_row_length)
+            self._n_bytes += self._block_size(block)
+
+            # Keep the most recent block even if it is too big on its own
+            while (self._max_bytes is not None and len(self._blocks) > 1 and
+                    self._n_bytes > self._max_bytes):
+                old_key, (old_block, old_max_row_length) = \
+                    self._blocks.popitem(last=False)
+                self._n_bytes -= self._block_size(old_block)
+                self._n_evictions += 1
+                if self._spill:
+                    self._spill_block(old_key, old_block, old_max_row_length)
+
+    def _spill_block(self, key, block, max_row_length):
+        if key in self._spilled_blocks or block is None:
+            return
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(
+                prefix="synaptic_blocks_", suffix=".dat")
+        self._spill_file.seek(self._spill_file_size)
+        self._spill_file.write(bytes(block))
+        self._spill_file.flush()
+        self._spilled_blocks[key] = (
+            self._spill_file_size, len(block), max_row_length)
+        self._spill_file_size += len(block)
+        self._n_spills += 1
+
+    def clear(self):
+        """ Remove all the blocks from the cache, including any in the\
+            scratch file
+        """
+        with self._lock:
+            self._blocks = OrderedDict()
+            self._n_bytes = 0
+            self._spilled_blocks = dict()
+            self._spill_file_size = 0
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
+
+    @property
+    def n_bytes(self):
+        """ The number of bytes of blocks held in memory
+        """
+        return self._n_bytes
+
+    @property
+    def n_hits(self):
+        """ The number of times a block was found in the cache
+        """
+        return self._n_hits
+
+    @property
+    def n_misses(self):
+        """ The number of times a block was not found in the cache
+        """
+        return self._n_misses
+
+    @property
+    def n_evictions(self):
+        """ The number of blocks removed from memory to make space
+        """
+        return self._n_evictions
+
+    @property
+    def n_spills(self):
+        """ The number of blocks written to the scratch file
+        """
+        return self._n_spills
+
+    def get_provenance_data(self, label):
+        """ Get provenance data items for the use of the cache
+
+        :param label: The label of the population the cache is for
+        :rtype: list(ProvenanceDataItem)
+        """
+        name = "{}_synaptic_block_cache".format(label)
+        return [
+            ProvenanceDataItem([name, "Hits"], self._n_hits),
+            ProvenanceDataItem([name, "Misses"], self._n_misses),
+            ProvenanceDataItem([name, "Evictions"], self._n_evictions),
+            ProvenanceDataItem([name, "Spills"], self._n_spills),
+            ProvenanceDataItem([name, "Bytes_in_memory"], self._n_bytes),
+            ProvenanceDataItem(
+                [name, "Bytes_in_scratch_file"], self._spill_file_size)]
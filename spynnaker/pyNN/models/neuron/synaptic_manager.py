@@ -2,6 +2,7 @@ try:
     from collections.abc import defaultdict
 except ImportError:
     from collections import defaultdict
+from collections import OrderedDict
 import math
 import struct
 import sys
@@ -13,9 +14,11 @@ from pacman.model.graphs.application.application_vertex import (
     ApplicationVertex)
 from data_specification.enums import DataType
 from spinn_front_end_common.utilities.helpful_functions import (
-    locate_memory_region_for_placement)
+    locate_memory_region_for_placement, read_config_int, read_config_boolean)
 from spinn_front_end_common.utilities.globals_variables import get_simulator
 from spynnaker.pyNN.models.neuron.generator_data import GeneratorData
+from spynnaker.pyNN.models.neuron.synaptic_block_cache import (
+    SynapticBlockCache)
 from spynnaker.pyNN.exceptions import SynapticConfigurationException
 from spynnaker.pyNN.models.neural_projections.connectors import (
     OneToOneConnector, AbstractGenerateConnectorOnMachine)
@@ -32,7 +35,7 @@ from spynnaker.pyNN.utilities.constants import (
     POPULATION_BASED_REGIONS, POSSION_SIGMA_SUMMATION_LIMIT)
 from spynnaker.pyNN.utilities.utility_calls import (
     get_maximum_probable_value, get_n_bits)
-from spynnaker.pyNN.utilities.running_stats import RunningStats
+from spynnaker.pyNN.utilities.running_stats import grouped_stats
 
 TIME_STAMP_BYTES = 4
 
@@ -54,6 +57,13 @@ _SYNAPSE_SDRAM_OVERSCALE = 1.1
 
 _ONE_WORD = struct.Struct("<I")
 
+# The number of spikes per tick that Poisson sources are unlikely to exceed,
+# indexed by (rate, n_atoms, steps_per_second), least recently used first
+_poisson_spikes_per_tick = OrderedDict()
+
+# The most values to keep in the above
+_MAX_POISSON_SPIKES_PER_TICK = 10000
+
 
 class SynapticManager(object):
     """ Deals with synapses
@@ -64,6 +74,8 @@ class SynapticManager(object):
         "_n_synapse_types",
         "_one_to_one_connection_dtcm_max_bytes",
         "_poptable_type",
+        "_poptable_indices",
+        "_synaptic_addresses",
         "_pre_run_connection_holders",
         "_retrieved_blocks",
         "_ring_buffer_sigma",
@@ -111,7 +123,16 @@ class SynapticManager(object):
         self._weight_scales = dict()
         self._ring_buffer_shifts = None
         self._delay_key_index = dict()
-        self._retrieved_blocks = dict()
+        self._retrieved_blocks = SynapticBlockCache(
+            read_config_int(
+                config, "Simulation", "max_synaptic_block_cache_bytes"),
+            read_config_boolean(
+                config, "Simulation", "spill_synaptic_block_cache"))
+
+        # The master population tables and the addresses of the synaptic
+        # regions read from the machine, indexed by placement
+        self._poptable_indices = dict()
+        self._synaptic_addresses = dict()
 
         # A list of connection holders to be filled in pre-run, indexed by
         # the edge the connection is for
@@ -350,7 +371,9 @@ class SynapticManager(object):
         and timestep.
 
         All arguments should be assumed real values except n_synapses_in\
-        which will be an integer.
+        which will be an integer.  The weight and rate arguments and\
+        n_synapses_in may also be numpy arrays, in which case a bound is\
+        computed for each element.
 
         :param weight_mean: Mean of weight distribution (in either nA or\
             microSiemens as required)
@@ -362,19 +385,23 @@ class SynapticManager(object):
             good starting choice is 5.0. Given length of simulation we can\
             set this for approximate number of saturation events.
         """
+        weight_mean = numpy.asarray(weight_mean, dtype="float64")
+        weight_std_dev = numpy.asarray(weight_std_dev, dtype="float64")
+
         # E[ number of spikes ] in a timestep
         steps_per_second = 1000000.0 / machine_timestep
         average_spikes_per_timestep = (
-            float(n_synapses_in * spikes_per_second) / steps_per_second)
+            numpy.asarray(n_synapses_in * spikes_per_second,
+                          dtype="float64") / steps_per_second)
 
         # Exact variance contribution from inherent Poisson variation
         poisson_variance = average_spikes_per_timestep * (weight_mean ** 2)
 
         # Upper end of range for Poisson summation required below
-        # upper_bound needs to be an integer
-        upper_bound = int(round(average_spikes_per_timestep +
-                                POSSION_SIGMA_SUMMATION_LIMIT *
-                                math.sqrt(average_spikes_per_timestep)))
+        # upper_bound needs to be an integer (rounding halves up as round)
+        upper_bound = numpy.floor(
+            average_spikes_per_timestep + POSSION_SIGMA_SUMMATION_LIMIT *
+            numpy.sqrt(average_spikes_per_timestep) + 0.5)
 
         # Closed-form exact solution for summation that gives the variance
         # contributed by weight distribution variation when modulated by
@@ -383,29 +410,60 @@ class SynapticManager(object):
         # Mathematica because (1) it's regularised and needs a further
         # multiplication and (2) it's actually the complement that is needed
         # i.e. 'gammaincc']
-
-        weight_variance = 0.0
-
-        if weight_std_dev > 0:
+        with numpy.errstate(divide="ignore", invalid="ignore", over="ignore"):
             lngamma = special.gammaln(1 + upper_bound)
             gammai = special.gammaincc(
                 1 + upper_bound, average_spikes_per_timestep)
-
-            big_ratio = (math.log(average_spikes_per_timestep) * upper_bound -
-                         lngamma)
-
-            if -701.0 < big_ratio < 701.0 and big_ratio != 0.0:
-                log_weight_variance = (
-                    -average_spikes_per_timestep +
-                    math.log(average_spikes_per_timestep) +
-                    2.0 * math.log(weight_std_dev) +
-                    math.log(math.exp(average_spikes_per_timestep) * gammai -
-                             math.exp(big_ratio)))
-                weight_variance = math.exp(log_weight_variance)
+            log_average = numpy.log(average_spikes_per_timestep)
+
+            big_ratio = log_average * upper_bound - lngamma
+            log_weight_variance = (
+                -average_spikes_per_timestep + log_average +
+                2.0 * numpy.log(weight_std_dev) +
+                numpy.log(numpy.exp(average_spikes_per_timestep) * gammai -
+                          numpy.exp(big_ratio)))
+            weight_variance = numpy.where(
+                (weight_std_dev > 0) & (-701.0 < big_ratio) &
+                (big_ratio < 701.0) & (big_ratio != 0.0),
+                numpy.exp(log_weight_variance), 0.0)
 
         # upper bound calculation -> mean + n * SD
         return ((average_spikes_per_timestep * weight_mean) +
-                (sigma * math.sqrt(poisson_variance + weight_variance)))
+                (sigma * numpy.sqrt(poisson_variance + weight_variance)))
+
+    @staticmethod
+    def _get_poisson_spikes_per_tick(rates, n_atoms, steps_per_second):
+        """ Get the number of spikes per tick that each of a set of Poisson\
+            sources is unlikely to exceed, remembering the results for the\
+            most recently used rates, numbers of atoms and timesteps
+
+        :param rates: The rate of each source in Hz
+        :param n_atoms: The number of atoms of each source
+        :param steps_per_second: The number of timesteps per second
+        :rtype: list(float)
+        """
+        keys = [(rate, n, steps_per_second)
+                for rate, n in zip(rates, n_atoms)]
+        missing = list(set(
+            key for key in keys if key not in _poisson_spikes_per_tick))
+        spikes_per_tick = dict()
+        if missing:
+            rates, n_atoms, _ = (
+                numpy.array(values, dtype="float64")
+                for values in zip(*missing))
+            probs = 1.0 - ((1.0 / 100.0) / n_atoms)
+            spikes_per_tick.update(zip(missing, scipy.stats.poisson.ppf(
+                probs, rates / steps_per_second)))
+        for key in keys:
+            if key not in spikes_per_tick:
+                spikes_per_tick[key] = _poisson_spikes_per_tick.pop(key)
+
+        # Put the values used at the most recently used end, and forget the
+        # least recently used
+        _poisson_spikes_per_tick.update(spikes_per_tick)
+        while len(_poisson_spikes_per_tick) > _MAX_POISSON_SPIKES_PER_TICK:
+            _poisson_spikes_per_tick.popitem(last=False)
+        return [spikes_per_tick[key] for key in keys]
 
     def _get_ring_buffer_to_input_left_shifts(
             self, application_vertex, application_graph, machine_timestep,
@@ -415,44 +473,46 @@ class SynapticManager(object):
         """
         weight_scale_squared = weight_scale * weight_scale
         n_synapse_types = self._n_synapse_types
-        running_totals = [RunningStats() for _ in range(n_synapse_types)]
-        delay_running_totals = [RunningStats() for _ in range(n_synapse_types)]
-        total_weights = numpy.zeros(n_synapse_types)
-        biggest_weight = numpy.zeros(n_synapse_types)
-        weights_signed = False
-        rate_stats = [RunningStats() for _ in range(n_synapse_types)]
         steps_per_second = 1000000.0 / machine_timestep
+        default_spikes_per_tick = max(
+            1.0, self._spikes_per_second / steps_per_second)
+
+        # The details of each synapse information, to be combined by
+        # synapse type
+        synapse_types = list()
+        weight_means = list()
+        weight_variances = list()
+        delay_variances = list()
+        weight_maxes = list()
+        n_connections = list()
+        rates = list()
+        weights_signed = False
+
+        # The sources of the synapse information from Poisson sources, as
+        # (index into the above, rate, n_atoms)
+        poisson_sources = list()
 
         for app_edge in application_graph.get_edges_ending_at_vertex(
                 application_vertex):
             if isinstance(app_edge, ProjectionApplicationEdge):
                 for synapse_info in app_edge.synapse_information:
-                    synapse_type = synapse_info.synapse_type
                     synapse_dynamics = synapse_info.synapse_dynamics
                     connector = synapse_info.connector
 
-                    weight_mean = (
-                        synapse_dynamics.get_weight_mean(
-                            connector, synapse_info.weight) * weight_scale)
-                    n_connections = \
-                        connector.get_n_connections_to_post_vertex_maximum()
-                    weight_variance = synapse_dynamics.get_weight_variance(
-                        connector, synapse_info.weight) * weight_scale_squared
-                    running_totals[synapse_type].add_items(
-                        weight_mean, weight_variance, n_connections)
-
-                    delay_variance = synapse_dynamics.get_delay_variance(
-                        connector, synapse_info.delay)
-                    delay_running_totals[synapse_type].add_items(
-                        0.0, delay_variance, n_connections)
-
-                    weight_max = (synapse_dynamics.get_weight_maximum(
-                        connector, synapse_info.weight) * weight_scale)
-                    biggest_weight[synapse_type] = max(
-                        biggest_weight[synapse_type], weight_max)
-
-                    spikes_per_tick = max(
-                        1.0, self._spikes_per_second / steps_per_second)
+                    synapse_types.append(synapse_info.synapse_type)
+                    weight_means.append(synapse_dynamics.get_weight_mean(
+                        connector, synapse_info.weight))
+                    weight_variances.append(
+                        synapse_dynamics.get_weight_variance(
+                            connector, synapse_info.weight))
+                    delay_variances.append(
+                        synapse_dynamics.get_delay_variance(
+                            connector, synapse_info.delay))
+                    weight_maxes.append(synapse_dynamics.get_weight_maximum(
+                        connector, synapse_info.weight))
+                    n_connections.append(
+                        connector.get_n_connections_to_post_vertex_maximum())
+
                     spikes_per_second = self._spikes_per_second
                     if isinstance(app_edge.pre_vertex,
                                   SpikeSourcePoissonVertex):
@@ -466,35 +526,55 @@ class SynapticManager(object):
                                 spikes_per_second):
                             spikes_per_second = get_maximum_probable_value(
                                 spikes_per_second, app_edge.pre_vertex.n_atoms)
-                        prob = 1.0 - (
-                            (1.0 / 100.0) / app_edge.pre_vertex.n_atoms)
-                        spikes_per_tick = spikes_per_second / steps_per_second
-                        spikes_per_tick = scipy.stats.poisson.ppf(
-                            prob, spikes_per_tick)
-                    rate_stats[synapse_type].add_items(
-                        spikes_per_second, 0, n_connections)
-                    total_weights[synapse_type] += spikes_per_tick * (
-                        weight_max * n_connections)
+                        poisson_sources.append((
+                            len(rates), spikes_per_second,
+                            app_edge.pre_vertex.n_atoms))
+                    rates.append(spikes_per_second)
 
                     if synapse_dynamics.are_weights_signed():
                         weights_signed = True
 
-        max_weights = numpy.zeros(n_synapse_types)
-        for synapse_type in range(n_synapse_types):
-            stats = running_totals[synapse_type]
-            rates = rate_stats[synapse_type]
-            if delay_running_totals[synapse_type].variance == 0.0:
-                max_weights[synapse_type] = max(total_weights[synapse_type],
-                                                biggest_weight[synapse_type])
-            else:
-                max_weights[synapse_type] = min(
-                    self._ring_buffer_expected_upper_bound(
-                        stats.mean, stats.standard_deviation, rates.mean,
-                        machine_timestep, stats.n_items,
-                        self._ring_buffer_sigma),
-                    total_weights[synapse_type])
-                max_weights[synapse_type] = max(
-                    max_weights[synapse_type], biggest_weight[synapse_type])
+        synapse_types = numpy.array(synapse_types, dtype="int64")
+        weight_means = numpy.array(weight_means, dtype="float64") * \
+            weight_scale
+        weight_variances = numpy.array(weight_variances, dtype="float64") * \
+            weight_scale_squared
+        weight_maxes = numpy.array(weight_maxes, dtype="float64") * \
+            weight_scale
+        n_connections = numpy.array(n_connections, dtype="float64")
+        spikes_per_tick = numpy.full(len(rates), default_spikes_per_tick)
+        if poisson_sources:
+            indices, poisson_rates, poisson_n_atoms = zip(*poisson_sources)
+            spikes_per_tick[list(indices)] = \
+                self._get_poisson_spikes_per_tick(
+                    poisson_rates, poisson_n_atoms, steps_per_second)
+
+        # Combine the details by synapse type
+        n_items, weight_mean, weight_variance = grouped_stats(
+            synapse_types, weight_means, weight_variances, n_connections,
+            n_synapse_types)
+        _, _, delay_variance = grouped_stats(
+            synapse_types, numpy.zeros(len(synapse_types)), delay_variances,
+            n_connections, n_synapse_types)
+        _, rate_mean, _ = grouped_stats(
+            synapse_types, rates, numpy.zeros(len(synapse_types)),
+            n_connections, n_synapse_types)
+        total_weights = numpy.bincount(
+            synapse_types, spikes_per_tick * weight_maxes * n_connections,
+            minlength=n_synapse_types)
+        biggest_weight = numpy.zeros(n_synapse_types)
+        numpy.maximum.at(biggest_weight, synapse_types, weight_maxes)
+
+        max_weights = numpy.maximum(total_weights, biggest_weight)
+        delayed = delay_variance != 0.0
+        if numpy.any(delayed):
+            upper_bounds = self._ring_buffer_expected_upper_bound(
+                weight_mean[delayed], numpy.sqrt(weight_variance[delayed]),
+                rate_mean[delayed], machine_timestep, n_items[delayed],
+                self._ring_buffer_sigma)
+            max_weights[delayed] = numpy.maximum(
+                numpy.minimum(upper_bounds, total_weights[delayed]),
+                biggest_weight[delayed])
 
         # Convert these to powers
         max_weight_powers = (
@@ -953,7 +1033,9 @@ class SynapticManager(object):
             spec, post_vertex_slice, weight_scales, gen_data)
 
     def clear_connection_cache(self):
-        self._retrieved_blocks = dict()
+        self._retrieved_blocks.clear()
+        self._poptable_indices = dict()
+        self._synaptic_addresses = dict()
 
     def get_connections_from_machine(
             self, transceiver, placement, machine_edge, graph_mapper,
@@ -988,7 +1070,8 @@ class SynapticManager(object):
             direct_synapses, key, pre_vertex_slice.n_atoms, synapse_info.index,
             using_extra_monitor_cores, placements, data_receiver,
             sender_extra_monitor_core_placement,
-            extra_monitor_cores_for_router_timeout, fixed_routes)
+            extra_monitor_cores_for_router_timeout,
+            handle_time_out_configuration, fixed_routes)
 
         # Get the block for the connections from the delayed pre_vertex
         delayed_data = None
@@ -1014,6 +1097,9 @@ class SynapticManager(object):
         """ Helper for computing the addresses of the master pop table and\
             synaptic-matrix-related bits.
         """
+        if placement in self._synaptic_addresses:
+            return self._synaptic_addresses[placement]
+
         master_pop_table = locate_memory_region_for_placement(
             placement, POPULATION_BASED_REGIONS.POPULATION_TABLE.value,
             transceiver)
@@ -1023,8 +1109,22 @@ class SynapticManager(object):
         direct_synapses = locate_memory_region_for_placement(
             placement, POPULATION_BASED_REGIONS.DIRECT_MATRIX.value,
             transceiver) + 4
+        self._synaptic_addresses[placement] = (
+            master_pop_table, direct_synapses, synaptic_matrix)
         return master_pop_table, direct_synapses, synaptic_matrix
 
+    def __get_poptable_index(
+            self, transceiver, placement, master_pop_table_address):
+        """ Get the master population table of a placement, reading it from\
+            the machine only the first time it is asked for
+        """
+        if placement not in self._poptable_indices:
+            self._poptable_indices[placement] = \
+                self._poptable_type.read_master_population_table(
+                    master_pop_table_address, transceiver,
+                    placement.x, placement.y)
+        return self._poptable_indices[placement]
+
     def _retrieve_synaptic_block(
             self, transceiver, placement, master_pop_table_address,
             indirect_synapses_address, direct_synapses_address,
@@ -1036,12 +1136,13 @@ class SynapticManager(object):
             the machine
         """
         # See if we have already got this block
-        if (placement, key, index) in self._retrieved_blocks:
-            return self._retrieved_blocks[placement, key, index]
+        retrieved_block = self._retrieved_blocks.get((placement, key, index))
+        if retrieved_block is not None:
+            return retrieved_block
 
-        items = self._poptable_type.extract_synaptic_matrix_data_location(
-            key, master_pop_table_address, transceiver,
-            placement.x, placement.y)
+        items = self.__get_poptable_index(
+            transceiver, placement, master_pop_table_address)\
+            .extract_synaptic_matrix_data_location(key)
         if index >= len(items):
             return None, None
 
@@ -1078,7 +1179,8 @@ class SynapticManager(object):
                     transceiver, extra_monitor_cores_for_router_timeout,
                     placements)
 
-        self._retrieved_blocks[placement, key, index] = (block, max_row_length)
+        self._retrieved_blocks.add(
+            (placement, key, index), block, max_row_length)
         return block, max_row_length
 
     def __read_multiple_synaptic_blocks(
@@ -1124,6 +1226,20 @@ class SynapticManager(object):
         numpy_block[:, 1] = 1
         return bytearray(numpy_block.tobytes()), 1
 
+    def get_provenance_data(self, label):
+        """ Get provenance data items for the reading of synapses from the\
+            machine, and for any connections held for structural plasticity
+
+        :param label: The label of the population
+        :rtype: list(ProvenanceDataItem)
+        """
+        prov_items = self._retrieved_blocks.get_provenance_data(label)
+        if isinstance(self._synapse_dynamics,
+                      AbstractSynapseDynamicsStructural):
+            prov_items.extend(
+                self._synapse_dynamics.get_provenance_data(label))
+        return prov_items
+
     # inherited from AbstractProvidesIncomingPartitionConstraints
     def get_incoming_partition_constraints(self):
         return self._poptable_type.get_edge_constraints()
@@ -415,22 +415,17 @@ class PyNNPopulationCommon(object):
                 and not self._has_read_neuron_parameters_this_run \
                 and not globals_variables.get_simulator().use_virtual_board:
             # locate machine vertices from the application vertices
-            machine_vertices = globals_variables.get_simulator().graph_mapper\
-                .get_machine_vertices(self._vertex)
-
-            # go through each machine vertex and read the neuron parameters
-            # it contains
-            for machine_vertex in machine_vertices:
-
-                # tell the core to rewrite neuron params back to the
-                # SDRAM space.
-                placement = globals_variables.get_simulator().placements.\
-                    get_placement_of_vertex(machine_vertex)
-
-                self._vertex.read_parameters_from_machine(
-                    globals_variables.get_simulator().transceiver, placement,
-                    globals_variables.get_simulator().graph_mapper.get_slice(
-                        machine_vertex))
+            sim = globals_variables.get_simulator()
+            machine_vertices = sim.graph_mapper.get_machine_vertices(
+                self._vertex)
+
+            # read the neuron parameters of all the machine vertices
+            self._vertex.read_all_parameters_from_machine(
+                sim.transceiver, [
+                    (sim.placements.get_placement_of_vertex(machine_vertex),
+                     sim.graph_mapper.get_slice(machine_vertex))
+                    for machine_vertex in machine_vertices],
+                sim.config.getint("Simulation", "n_parameter_read_threads"))
 
             self._has_read_neuron_parameters_this_run = True
 
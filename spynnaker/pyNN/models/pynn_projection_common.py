@@ -1,3 +1,4 @@
+from collections import OrderedDict
 import logging
 import math
 from spinn_utilities.progress_bar import ProgressBar
@@ -12,6 +13,7 @@ from spynnaker.pyNN.models.neural_projections import (
     ProjectionApplicationEdge, DelayAfferentApplicationEdge)
 from spynnaker.pyNN.models.utility_models import DelayExtensionVertex
 from spynnaker.pyNN.utilities import constants
+from spynnaker.pyNN.utilities.utility_calls import run_in_threads
 from spynnaker.pyNN.models.neuron import ConnectionHolder
 # pylint: disable=protected-access
 
@@ -230,7 +232,29 @@ class PyNNProjectionCommon(object):
 
     def _get_synaptic_data(
             self, as_list, data_to_get, fixed_values=None, notify=None,
-            handle_time_out_configuration=True):
+            handle_time_out_configuration=True, sparse=False,
+            multiple_synapses="last"):
+        """ Get the synaptic data of the projection in a ConnectionHolder
+
+        :param as_list:\
+            True to get the data as a list, False to get it as matrices
+        :param data_to_get: The names of the fields to get
+        :param fixed_values:\
+            Fixed values to be added to the data, as a list of tuples of\
+            (field name, value)
+        :param notify: A callback to call when the data has been read
+        :param handle_time_out_configuration:\
+            True if the router time outs should be set up when reading using\
+            the extra monitor cores
+        :param sparse:\
+            True to get matrices as scipy.sparse matrices, which only hold\
+            the connections that exist
+        :param multiple_synapses:\
+            How to combine the values of multiple synapses between the same\
+            pair of neurons in matrices; one of "last", "first", "sum", "min"\
+            or "max"
+        :rtype: ConnectionHolder
+        """
         # pylint: disable=too-many-arguments
         post_vertex = self._projection_edge.post_vertex
         pre_vertex = self._projection_edge.pre_vertex
@@ -242,7 +266,8 @@ class PyNNProjectionCommon(object):
             connection_holder = ConnectionHolder(
                 data_to_get, as_list, pre_vertex.n_atoms, post_vertex.n_atoms,
                 self._virtual_connection_list, fixed_values=fixed_values,
-                notify=notify)
+                notify=notify, sparse=sparse,
+                multiple_synapses=multiple_synapses)
             connection_holder.finish()
             return connection_holder
 
@@ -250,7 +275,8 @@ class PyNNProjectionCommon(object):
         # possible later date
         connection_holder = ConnectionHolder(
             data_to_get, as_list, pre_vertex.n_atoms, post_vertex.n_atoms,
-            fixed_values=fixed_values, notify=notify)
+            fixed_values=fixed_values, notify=notify, sparse=sparse,
+            multiple_synapses=multiple_synapses)
 
         # If we haven't run, add the holder to get connections, and return it
         # and set up a callback for after run to fill in this connection holder
@@ -286,14 +312,16 @@ class PyNNProjectionCommon(object):
             receivers = None
             extra_monitor_placements = None
 
+        # Group the edges by the core that they are read from, so that each
+        # core is read by one thread
         edges = ctl.graph_mapper.get_machine_edges(self._projection_edge)
-        progress = ProgressBar(
-            edges, "Getting {}s for projection between {} and {}".format(
-                data_to_get, pre_vertex.label, post_vertex.label))
-        for edge in progress.over(edges):
+        edges_by_placement = OrderedDict()
+        for edge in edges:
             placement = ctl.placements.get_placement_of_vertex(
                 edge.post_vertex)
+            edges_by_placement.setdefault(placement, list()).append(edge)
 
+        def read_placement(placement):
             # if using extra monitor data extractor find local receiver
             if extra_monitors is not None:
                 receiver = helpful_functions.locate_extra_monitor_mc_receiver(
@@ -308,15 +336,33 @@ class PyNNProjectionCommon(object):
                 receiver = None
                 sender_monitor_place = None
 
-            connections = post_vertex.get_connections_from_machine(
-                ctl.transceiver, placement, edge, ctl.graph_mapper,
-                ctl.routing_infos, self._synapse_information,
-                ctl.machine_time_step, extra_monitors is not None,
-                ctl.placements, receiver, sender_monitor_place,
-                extra_monitors, handle_time_out_configuration,
-                ctl.fixed_routes)
-            if connections is not None:
-                connection_holder.add_connections(connections)
+            placement_edges = edges_by_placement[placement]
+            return len(placement_edges), [
+                post_vertex.get_connections_from_machine(
+                    ctl.transceiver, placement, edge, ctl.graph_mapper,
+                    ctl.routing_infos, self._synapse_information,
+                    ctl.machine_time_step, extra_monitors is not None,
+                    ctl.placements, receiver, sender_monitor_place,
+                    extra_monitors, handle_time_out_configuration,
+                    ctl.fixed_routes)
+                for edge in placement_edges]
+
+        # The extra monitor data extraction can only read one core at a time
+        n_threads = 1
+        if extra_monitors is None:
+            n_threads = ctl.config.getint(
+                "Simulation", "n_connection_read_threads")
+
+        progress = ProgressBar(
+            edges, "Getting {}s for projection between {} and {}".format(
+                data_to_get, pre_vertex.label, post_vertex.label))
+        for n_edges, placement_connections in run_in_threads(
+                read_placement, edges_by_placement, n_threads):
+            for connections in placement_connections:
+                if connections is not None:
+                    connection_holder.add_connections(connections)
+            progress.update(n_edges)
+        progress.end()
         connection_holder.finish()
 
     def _clear_cache(self):
@@ -11,7 +11,7 @@ from spinn_utilities.timer import Timer
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spinn_front_end_common.utilities.globals_variables import get_simulator
 from spynnaker.pyNN.models.common import (
-    AbstractSpikeRecordable, AbstractNeuronRecordable)
+    AbstractSpikeRecordable, AbstractNeuronRecordable, write_spikes_file)
 # pylint: disable=protected-access
 
 logger = FormatAdapter(logging.getLogger(__name__))
@@ -192,6 +192,40 @@ class RecordingCommon(object):
 
         :return: the spikes from a vertex
         """
+        if not self._check_spikes_available():
+            return numpy.zeros((0, 2))
+
+        # assuming we got here, everything is OK, so we should go get the
+        # spikes
+        sim = get_simulator()
+        return self._population._vertex.get_spikes(
+            sim.placements, sim.graph_mapper, sim.buffer_manager,
+            sim.machine_time_step)
+
+    def _write_spikes(self, filename):
+        """ Write the spikes from a vertex to disk without holding them all\
+            in memory.
+
+        :param filename: the base name of the files to write; read them back\
+            with :py:func:`~spynnaker.pyNN.models.common.read_spikes_file`
+        :return: the number of spikes written
+        :rtype: int
+        """
+        if not self._check_spikes_available():
+            return write_spikes_file(filename, [])
+
+        sim = get_simulator()
+        return self._population._vertex.write_spikes(
+            filename, sim.placements, sim.graph_mapper, sim.buffer_manager,
+            sim.machine_time_step)
+
+    def _check_spikes_available(self):
+        """ Check that spikes can be read from the vertex.
+
+        :return: True if there are spikes to read, or False (with a warning)\
+            if the simulation has not really run
+        :rtype: bool
+        """
 
         # check we're in a state where we can get spikes
         if not isinstance(self._population._vertex, AbstractSpikeRecordable):
@@ -206,19 +240,14 @@ class RecordingCommon(object):
             logger.warning(
                 "The simulation has not yet run, therefore spikes cannot "
                 "be retrieved, hence the list will be empty")
-            return numpy.zeros((0, 2))
+            return False
 
         if sim.use_virtual_board:
             logger.warning(
                 "The simulation is using a virtual machine and so has not "
                 "truly ran, hence the list will be empty")
-            return numpy.zeros((0, 2))
-
-        # assuming we got here, everything is OK, so we should go get the
-        # spikes
-        return self._population._vertex.get_spikes(
-            sim.placements, sim.graph_mapper, sim.buffer_manager,
-            sim.machine_time_step)
+            return False
+        return True
 
     def _turn_off_all_recording(self, indexes=None):
         """ Turns off recording, is used by a pop saying `.record()`
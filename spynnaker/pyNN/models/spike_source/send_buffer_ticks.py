@@ -0,0 +1,125 @@
+import numpy
+
+
+class SendBufferTicks(object):
+    """ The ticks at which each neuron of a spike source array sends spikes,\
+        held as one array of the ticks of all the neurons, sorted by neuron\
+        and then by tick, and the offset in the array of the first tick of\
+        each neuron.  This can be used wherever a list of arrays of ticks can\
+        be used; a slice of neurons shares the arrays of the ticks it was\
+        taken from.
+    """
+
+    __slots__ = [
+        # The ticks of the neurons, sorted by neuron and then by tick
+        "_ticks",
+
+        # The offset into the ticks of the first tick of each neuron, and
+        # then the offset after the last tick of the last neuron
+        "_offsets"]
+
+    def __init__(self, ticks, offsets):
+        """
+        :param ticks: The ticks, sorted by neuron and then by tick
+        :type ticks: numpy.array(int64)
+        :param offsets:\
+            The offset of the first tick of each neuron, followed by the\
+            offset after the last tick
+        :type offsets: numpy.array(int64)
+        """
+        self._ticks = ticks
+        self._offsets = offsets
+
+    @staticmethod
+    def from_neuron_ticks(ticks, n_ticks_per_neuron):
+        """ Create from the ticks of each neuron in turn, which need not be\
+            sorted
+
+        :param ticks: The ticks of the first neuron, then the second...
+        :type ticks: numpy.array(int64)
+        :param n_ticks_per_neuron: The number of ticks of each neuron
+        :type n_ticks_per_neuron: numpy.array(int)
+        :rtype: SendBufferTicks
+        """
+        n_ticks_per_neuron = numpy.asarray(n_ticks_per_neuron, dtype="int64")
+        offsets = numpy.zeros(len(n_ticks_per_neuron) + 1, dtype="int64")
+        numpy.cumsum(n_ticks_per_neuron, out=offsets[1:])
+        neurons = numpy.repeat(
+            numpy.arange(len(n_ticks_per_neuron)), n_ticks_per_neuron)
+        ticks = numpy.asarray(ticks, dtype="int64")
+
+        # Only sort if the ticks of some neuron are out of order
+        if not ((ticks[1:] < ticks[:-1]) &
+                (neurons[1:] == neurons[:-1])).any():
+            return SendBufferTicks(ticks, offsets)
+
+        # Sort by a single key of neuron and tick where that fits in an int
+        min_tick = int(ticks.min())
+        n_tick_values = int(ticks.max()) - min_tick + 1
+        if len(n_ticks_per_neuron) * n_tick_values < 2 ** 62:
+            order = numpy.argsort(
+                neurons * n_tick_values + (ticks - min_tick))
+        else:
+            order = numpy.lexsort((ticks, neurons))
+        return SendBufferTicks(ticks[order], offsets)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return SendBufferTicks(
+                self._ticks, self._offsets[start:max(start, stop) + 1])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Neuron {} is out of range".format(index))
+        return self._ticks[self._offsets[index]:self._offsets[index + 1]]
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._ticks[self._offsets[index]:self._offsets[index + 1]]
+
+    def update(self, ticks_by_neuron):
+        """ Replace the ticks of some of the neurons; slices taken before the\
+            update see the new ticks only if no neuron changes its number of\
+            ticks
+
+        :param ticks_by_neuron: The new ticks, indexed by neuron
+        :type ticks_by_neuron: dict(int, numpy.array(int64))
+        """
+        ticks_by_neuron = {
+            neuron: numpy.sort(numpy.asarray(ticks, dtype="int64").ravel())
+            for neuron, ticks in ticks_by_neuron.items()}
+        n_ticks_per_neuron = numpy.diff(self._offsets)
+        if all(len(neuron_ticks) == n_ticks_per_neuron[neuron]
+               for neuron, neuron_ticks in ticks_by_neuron.items()):
+            for neuron, neuron_ticks in ticks_by_neuron.items():
+                self._ticks[self._offsets[neuron]:
+                            self._offsets[neuron + 1]] = neuron_ticks
+            return
+
+        # Work out where the ticks of the neurons now start
+        changed = numpy.zeros(len(self), dtype="bool")
+        new_n_ticks_per_neuron = n_ticks_per_neuron.copy()
+        for neuron, neuron_ticks in ticks_by_neuron.items():
+            changed[neuron] = True
+            new_n_ticks_per_neuron[neuron] = len(neuron_ticks)
+        offsets = numpy.zeros(len(self) + 1, dtype="int64")
+        numpy.cumsum(new_n_ticks_per_neuron, out=offsets[1:])
+
+        # Move the ticks of the neurons that haven't changed, then add the
+        # ticks of those that have
+        ticks = numpy.zeros(offsets[-1], dtype="int64")
+        neurons = numpy.repeat(numpy.arange(len(self)), n_ticks_per_neuron)
+        kept = numpy.nonzero(~changed[neurons])[0]
+        ticks[offsets[neurons[kept]] + kept -
+              (self._offsets[neurons[kept]] - self._offsets[0])] = \
+            self._ticks[self._offsets[0] + kept]
+        for neuron, neuron_ticks in ticks_by_neuron.items():
+            ticks[offsets[neuron]:offsets[neuron + 1]] = neuron_ticks
+        self._ticks = ticks
+        self._offsets = offsets
@@ -1,7 +1,9 @@
+import itertools
 import logging
 import sys
 import numpy
 from spinn_utilities.overrides import overrides
+from spinn_utilities.ranged.abstract_list import AbstractList
 from spinn_front_end_common.utility_models import ReverseIpTagMultiCastSource
 from spinn_front_end_common.abstract_models import AbstractChangableAfterRun
 from spinn_front_end_common.abstract_models.impl import (
@@ -10,6 +12,8 @@ from spinn_front_end_common.utilities import globals_variables
 from spynnaker.pyNN.models.common import (
     AbstractSpikeRecordable, EIEIOSpikeRecorder, SimplePopulationSettable)
 from spynnaker.pyNN.utilities import constants
+from spynnaker.pyNN.utilities.ranged import SpynnakerRangedList
+from .send_buffer_ticks import SendBufferTicks
 
 logger = logging.getLogger(__name__)
 
@@ -20,9 +24,17 @@ def _as_numpy_ticks(times, time_step):
 
 
 def _send_buffer_times(spike_times, time_step):
-    # Convert to ticks
+    # Convert to ticks, converting the times of all the neurons at once
     if len(spike_times) and hasattr(spike_times[0], "__len__"):
-        return [_as_numpy_ticks(times, time_step) for times in spike_times]
+        n_times = [len(times) for times in spike_times]
+        if all(isinstance(times, numpy.ndarray) for times in spike_times):
+            all_times = numpy.concatenate(spike_times)
+        else:
+            all_times = numpy.fromiter(
+                itertools.chain.from_iterable(spike_times), "float64",
+                sum(n_times))
+        return SendBufferTicks.from_neuron_ticks(
+            _as_numpy_ticks(all_times, time_step), n_times)
     else:
         return _as_numpy_ticks(spike_times, time_step)
 
@@ -85,6 +97,28 @@ class SpikeSourceArrayVertex(
         self.send_buffer_times = _send_buffer_times(spike_times, time_step)
         self._spike_times = spike_times
 
+    @overrides(SimplePopulationSettable.set_value_by_selector)
+    def set_value_by_selector(self, selector, key, value):
+        send_buffer_ticks = self.send_buffer_times
+        if key != "spike_times" or not isinstance(
+                send_buffer_ticks, SendBufferTicks):
+            super(SpikeSourceArrayVertex, self).set_value_by_selector(
+                selector, key, value)
+            return
+
+        # Update the ticks of only the neurons selected
+        spike_times = self._spike_times
+        if not isinstance(spike_times, AbstractList):
+            spike_times = SpynnakerRangedList(
+                size=self.n_atoms, value=spike_times)
+            self._spike_times = spike_times
+        spike_times.set_value_by_selector(selector, value)
+        time_step = self.get_spikes_sampling_interval()
+        send_buffer_ticks.update({
+            neuron: _as_numpy_ticks(spike_times[neuron], time_step)
+            for neuron in spike_times.selector_to_ids(selector)})
+        self.send_buffer_times = send_buffer_ticks
+
     @overrides(AbstractSpikeRecordable.is_recording_spikes)
     def is_recording_spikes(self):
         return self._spike_recorder.record
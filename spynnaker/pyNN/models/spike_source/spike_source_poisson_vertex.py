@@ -8,6 +8,7 @@ from pacman.executor.injection_decorator import inject_items
 from pacman.model.constraints.key_allocator_constraints import (
     ContiguousKeyRangeContraint)
 from pacman.model.graphs.application import ApplicationVertex
+from pacman.model.graphs.common import Slice
 from pacman.model.resources import (
     ConstantSDRAM, CPUCyclesPerTickResource, DTCMResource, ResourceContainer)
 from spinn_front_end_common.abstract_models import (
@@ -107,6 +108,13 @@ class SpikeSourcePoissonVertex(
         self._max_rate = max_rate
         self._rate = self.convert_rate(rate)
         self._rate_change = numpy.zeros(self._rate.size)
+
+        # The (total mean rate, maximum spikes) of all the sources, or None
+        # if the rates have changed since they were computed
+        self._rate_statistics = None
+
+        # The maximum spikes per timestep, indexed by (max rate, timestep)
+        self._max_spikes_per_ts_cache = dict()
         self._start = utility_calls.convert_param_to_numpy(start, n_neurons)
         self._duration = utility_calls.convert_param_to_numpy(
             duration, n_neurons)
@@ -114,6 +122,13 @@ class SpikeSourcePoissonVertex(
             0, n_neurons)
         self._machine_time_step = None
 
+        # The atoms whose parameters have changed since they were last loaded
+        self._changed_atoms = numpy.zeros(n_neurons, dtype="bool")
+
+        # The (lo_atom, hi_atom) of the slices whose rates can be changed on
+        # the machine by a live Poisson control edge
+        self._live_controlled_slices = set()
+
         # Prepare for recording, and to get spikes
         self._spike_recorder = MultiSpikeRecorder()
 
@@ -132,6 +147,13 @@ class SpikeSourcePoissonVertex(
         self._change_requires_neuron_parameters_reload = True
 
     def _max_spikes_per_ts(self, machine_time_step):
+        key = (self._max_rate, machine_time_step)
+        if key not in self._max_spikes_per_ts_cache:
+            self._max_spikes_per_ts_cache[key] = \
+                self._compute_max_spikes_per_ts(machine_time_step)
+        return self._max_spikes_per_ts_cache[key]
+
+    def _compute_max_spikes_per_ts(self, machine_time_step):
 
         ts_per_second = MICROSECONDS_PER_SECOND / float(machine_time_step)
         if float(self._max_rate) / ts_per_second <= \
@@ -216,7 +238,28 @@ class SpikeSourcePoissonVertex(
     def rate(self, rate):
         new_rate = self.convert_rate(rate)
         self._rate_change = new_rate - self._rate
+        self._mark_changed(self._rate, new_rate)
         self._rate = new_rate
+        self._rate_statistics = None
+
+    def _get_rate_statistics(self):
+        """ Get the total mean rate of all the sources, and the sum over all\
+            the sources of the number of spikes per second each is unlikely\
+            to exceed, computing them only when the rates have changed
+
+        :return: (total mean rate, maximum spikes)
+        :rtype: tuple(float, float)
+        """
+        if self._rate_statistics is None:
+            total_mean_rate = numpy.sum(self._rate)
+            max_spikes = 0
+            if total_mean_rate > 0:
+                # Sources with the same rate have the same maximum
+                rates, counts = numpy.unique(self._rate, return_counts=True)
+                max_spikes = numpy.sum(scipy.stats.poisson.ppf(
+                    1.0 - (1.0 / rates), rates) * counts)
+            self._rate_statistics = (total_mean_rate, max_spikes)
+        return self._rate_statistics
 
     @property
     def start(self):
@@ -224,8 +267,9 @@ class SpikeSourcePoissonVertex(
 
     @start.setter
     def start(self, start):
-        self._start = utility_calls.convert_param_to_numpy(
-            start, self._n_atoms)
+        new_start = utility_calls.convert_param_to_numpy(start, self._n_atoms)
+        self._mark_changed(self._start, new_start)
+        self._start = new_start
 
     @property
     def duration(self):
@@ -233,8 +277,37 @@ class SpikeSourcePoissonVertex(
 
     @duration.setter
     def duration(self, duration):
-        self._duration = utility_calls.convert_param_to_numpy(
+        new_duration = utility_calls.convert_param_to_numpy(
             duration, self._n_atoms)
+        self._mark_changed(self._duration, new_duration)
+        self._duration = new_duration
+
+    def _mark_changed(self, old_values, new_values):
+        """ Remember which atoms have a different value of a parameter, so\
+            that only those atoms need to be loaded again
+
+        :param old_values: The values of the parameter before the change
+        :param new_values: The values of the parameter after the change
+        """
+        old_values = numpy.asarray(old_values, dtype="float")
+        new_values = numpy.asarray(new_values, dtype="float")
+        self._changed_atoms |= ~(
+            (old_values == new_values) |
+            (numpy.isnan(old_values) & numpy.isnan(new_values)))
+
+    @staticmethod
+    def _get_changed_ranges(changed):
+        """ Get the (lo_atom, hi_atom) of each run of changed atoms
+
+        :param changed: Whether each atom has changed
+        :type changed: numpy.ndarray(bool)
+        :rtype: list(tuple(int, int))
+        """
+        steps = numpy.diff(numpy.concatenate(
+            ([0], changed.astype("int8"), [0])))
+        starts = numpy.flatnonzero(steps == 1)
+        ends = numpy.flatnonzero(steps == -1) - 1
+        return list(zip(starts.tolist(), ends.tolist()))
 
     @property
     def seed(self):
@@ -281,19 +354,21 @@ class SpikeSourcePoissonVertex(
             label="Recording")
         placement.vertex.reserve_provenance_data_region(spec)
 
-    def _reserve_poisson_params_region(self, placement, graph_mapper, spec):
+    def _reserve_poisson_params_region(
+            self, placement, graph_mapper, spec, empty=False):
         """ does the allocation for the poisson params region itself, as\
             it can be reused for setters after an initial run
 
         :param placement: the location on machine for this vertex
         :param graph_mapper: the mapping between machine and application graphs
         :param spec: the dsg writer
+        :param empty: True if the region will not be written by the spec
         :return:  None
         """
         spec.reserve_memory_region(
             region=_REGIONS.POISSON_PARAMS_REGION.value,
             size=self.get_params_bytes(graph_mapper.get_slice(
-                placement.vertex)), label='PoissonParams')
+                placement.vertex)), label='PoissonParams', empty=empty)
 
     def _write_poisson_parameters(
             self, spec, graph, placement, routing_info,
@@ -310,18 +385,68 @@ class SpikeSourcePoissonVertex(
             the scaling between machine time step and real time
         :return: None
         """
-        # pylint: disable=too-many-arguments, too-many-locals
+        # pylint: disable=too-many-arguments
         spec.comment("\nWriting Neuron Parameters for {} poisson sources:\n"
                      .format(vertex_slice.n_atoms))
 
         # Set the focus to the memory region 2 (neuron parameters):
         spec.switch_write_focus(_REGIONS.POISSON_PARAMS_REGION.value)
 
+        for value, data_type in self._get_poisson_base_parameters(
+                graph, placement, routing_info, vertex_slice,
+                machine_time_step, time_scale_factor):
+            spec.write_value(data=value, data_type=data_type)
+
+        # After a run without a reset, the time to the next spike of each
+        # source is only up to date on the machine
+        simulator = globals_variables.get_simulator()
+        if (simulator.has_ran and not simulator.has_reset_last and
+                not simulator.use_virtual_board):
+            self._read_time_to_spike_from_machine(
+                simulator.transceiver, placement, vertex_slice)
+
+        spec.write_array(self._get_poisson_source_parameters(
+            vertex_slice, machine_time_step))
+        self._changed_atoms[vertex_slice.as_slice] = False
+
+    def _read_time_to_spike_from_machine(
+            self, transceiver, placement, vertex_slice):
+        """ Read the time to the next spike of each source of a machine\
+            vertex from the machine
+
+        :param transceiver: the transceiver to read the parameters with
+        :param placement: the location on machine for this vertex
+        :param vertex_slice:\
+            the slice of atoms a machine vertex holds from its application\
+            vertex
+        :return: None
+        """
+        address = helpful_functions.locate_memory_region_for_placement(
+            placement, _REGIONS.POISSON_PARAMS_REGION.value, transceiver)
+        byte_array = transceiver.read_memory(
+            placement.x, placement.y,
+            address + START_OF_POISSON_GENERATOR_PARAMETERS,
+            vertex_slice.n_atoms * PARAMS_WORDS_PER_NEURON * 4)
+        self._time_to_spike[vertex_slice.as_slice] = _PoissonStruct.read_data(
+            byte_array, 0, vertex_slice.n_atoms)[-1]
+
+    def _get_poisson_base_parameters(
+            self, graph, placement, routing_info, vertex_slice,
+            machine_time_step, time_scale_factor):
+        """ Get the parameters shared by all the Poisson sources of a\
+            machine vertex
+
+        :return: list of (value, data type) of each parameter, in order
+        :rtype: list(tuple(int or float, DataType))
+        """
+        # pylint: disable=too-many-arguments, too-many-locals
+        parameters = list()
+
         # Write Key info for this core:
         key = routing_info.get_first_key_from_pre_vertex(
             placement.vertex, constants.SPIKE_PARTITION_ID)
-        spec.write_value(data=1 if key is not None else 0)
-        spec.write_value(data=key if key is not None else 0)
+        parameters.append((1 if key is not None else 0, DataType.UINT32))
+        parameters.append((key if key is not None else 0, DataType.UINT32))
 
         # Write the incoming mask if there is one
         in_edges = graph.get_edges_ending_at_vertex_with_partition_name(
@@ -337,21 +462,21 @@ class SpikeSourcePoissonVertex(
             incoming_mask = \
                 routing_info.get_routing_info_for_edge(in_edge).first_mask
             incoming_mask = ~incoming_mask & 0xFFFFFFFF
-        spec.write_value(incoming_mask)
+            self._live_controlled_slices.add(
+                (vertex_slice.lo_atom, vertex_slice.hi_atom))
+        parameters.append((incoming_mask, DataType.UINT32))
 
         # Write the offset value
         max_offset = (
             machine_time_step * time_scale_factor) // _MAX_OFFSET_DENOMINATOR
-        spec.write_value(
+        parameters.append((
             int(math.ceil(max_offset / self._n_subvertices)) *
-            self._n_data_specs)
+            self._n_data_specs, DataType.UINT32))
         self._n_data_specs += 1
 
         # Write the number of microseconds between sending spikes
-        total_mean_rate = numpy.sum(self._rate)
+        total_mean_rate, max_spikes = self._get_rate_statistics()
         if total_mean_rate > 0:
-            max_spikes = numpy.sum(scipy.stats.poisson.ppf(
-                1.0 - (1.0 / self._rate), self._rate))
             spikes_per_timestep = (
                 max_spikes / (MICROSECONDS_PER_SECOND // machine_time_step))
             # avoid a possible division by zero / small number (which may
@@ -362,33 +487,32 @@ class SpikeSourcePoissonVertex(
                 time_between_spikes = (
                     (machine_time_step * time_scale_factor) /
                     (spikes_per_timestep * 2.0))
-            spec.write_value(data=int(time_between_spikes))
+            parameters.append((int(time_between_spikes), DataType.UINT32))
         else:
 
             # If the rate is 0 or less, set a "time between spikes" of 1
             # to ensure that some time is put between spikes in event
             # of a rate change later on
-            spec.write_value(data=1)
+            parameters.append((1, DataType.UINT32))
 
         # Write the number of seconds per timestep (unsigned long fract)
-        spec.write_value(
-            data=float(machine_time_step) / MICROSECONDS_PER_SECOND,
-            data_type=DataType.U032)
+        parameters.append((
+            float(machine_time_step) / MICROSECONDS_PER_SECOND,
+            DataType.U032))
 
         # Write the number of timesteps per second (accum)
-        spec.write_value(
-            data=MICROSECONDS_PER_SECOND / float(machine_time_step),
-            data_type=DataType.S1615)
+        parameters.append((
+            MICROSECONDS_PER_SECOND / float(machine_time_step),
+            DataType.S1615))
 
         # Write the slow-rate-per-tick-cutoff (accum)
-        spec.write_value(
-            data=SLOW_RATE_PER_TICK_CUTOFF, data_type=DataType.S1615)
+        parameters.append((SLOW_RATE_PER_TICK_CUTOFF, DataType.S1615))
 
         # Write the lo_atom id
-        spec.write_value(data=vertex_slice.lo_atom)
+        parameters.append((vertex_slice.lo_atom, DataType.UINT32))
 
         # Write the number of sources
-        spec.write_value(data=vertex_slice.n_atoms)
+        parameters.append((vertex_slice.n_atoms, DataType.UINT32))
 
         # Write the random seed (4 words), generated randomly!
         kiss_key = (vertex_slice.lo_atom, vertex_slice.hi_atom)
@@ -399,8 +523,18 @@ class SpikeSourcePoissonVertex(
                 self._rng.randint(-0x80000000, 0x7FFFFFFF) + 0x80000000
                 for _ in range(4)]
         for value in self._kiss_seed[kiss_key]:
-            spec.write_value(data=value)
+            parameters.append((value, DataType.UINT32))
+
+        return parameters
+
+    def _get_poisson_source_parameters(self, vertex_slice, machine_time_step):
+        """ Get the parameters of each of a range of Poisson sources
 
+        :param vertex_slice: the slice of atoms to get the parameters of
+        :param machine_time_step: the time between timer tick updates.
+        :return: the parameters, one row of words per source
+        :rtype: numpy.ndarray(uint32)
+        """
         # Compute the start times in machine time steps
         start = self._start[vertex_slice.as_slice]
         start_scaled = self._convert_ms_to_n_timesteps(
@@ -454,7 +588,7 @@ class SpikeSourcePoissonVertex(
             (time_to_spike * (2 ** 15)).astype("uint32")
         ))[0]
 
-        spec.write_array(data)
+        return data
 
     @staticmethod
     def _convert_ms_to_n_timesteps(value, machine_time_step):
@@ -510,6 +644,24 @@ class SpikeSourcePoissonVertex(
             self, spec, placement, machine_time_step, time_scale_factor,
             graph_mapper, routing_info, graph):
         # pylint: disable=too-many-arguments, arguments-differ
+        vertex_slice = graph_mapper.get_slice(placement.vertex)
+
+        # If the parameters on the machine are still valid, only update
+        # those that have changed, leaving the region in the spec empty.
+        # Writing to the machine here is safe because this is only called
+        # by the region reloader, between runs while the cores are paused;
+        # the reloader writes the regions of the spec straight away and
+        # skips empty ones, so nothing overwrites these writes.  Without a
+        # reset the region table on the machine is still valid.
+        simulator = globals_variables.get_simulator()
+        if not simulator.has_reset_last:
+            self._reserve_poisson_params_region(
+                placement, graph_mapper, spec, empty=True)
+            self._update_poisson_parameters_on_machine(
+                simulator.transceiver, graph, placement, routing_info,
+                vertex_slice, machine_time_step, time_scale_factor)
+            spec.end_specification()
+            return
 
         # reserve the neuron parameters data region
         self._reserve_poisson_params_region(placement, graph_mapper, spec)
@@ -517,14 +669,62 @@ class SpikeSourcePoissonVertex(
         # allocate parameters
         self._write_poisson_parameters(
             spec=spec, graph=graph, placement=placement,
-            routing_info=routing_info,
-            vertex_slice=graph_mapper.get_slice(placement.vertex),
+            routing_info=routing_info, vertex_slice=vertex_slice,
             machine_time_step=machine_time_step,
             time_scale_factor=time_scale_factor)
 
         # end spec
         spec.end_specification()
 
+    def _update_poisson_parameters_on_machine(
+            self, transceiver, graph, placement, routing_info, vertex_slice,
+            machine_time_step, time_scale_factor):
+        """ Write the shared parameters and the parameters of the sources\
+            that have changed directly to the machine
+
+        :param transceiver: the transceiver to write the parameters with
+        :param placement: the location on machine for this vertex
+        :param vertex_slice:\
+            the slice of atoms a machine vertex holds from its application\
+            vertex
+        :return: None
+        """
+        # pylint: disable=too-many-arguments
+        address = helpful_functions.locate_memory_region_for_placement(
+            placement, _REGIONS.POISSON_PARAMS_REGION.value, transceiver)
+
+        # The shared parameters depend on the rates of all the sources
+        transceiver.write_memory(
+            placement.x, placement.y, address, b"".join(
+                data_type.encode(value)
+                for value, data_type in self._get_poisson_base_parameters(
+                    graph, placement, routing_info, vertex_slice,
+                    machine_time_step, time_scale_factor)))
+
+        bytes_per_source = PARAMS_WORDS_PER_NEURON * 4
+        for lo_atom, hi_atom in self._get_changed_ranges(
+                self._changed_atoms[vertex_slice.as_slice]):
+            changed_slice = Slice(
+                vertex_slice.lo_atom + lo_atom,
+                vertex_slice.lo_atom + hi_atom)
+            source_address = (
+                address + START_OF_POISSON_GENERATOR_PARAMETERS +
+                lo_atom * bytes_per_source)
+
+            # Keep the time to the next spike from the machine
+            byte_array = transceiver.read_memory(
+                placement.x, placement.y, source_address,
+                changed_slice.n_atoms * bytes_per_source)
+            self._time_to_spike[changed_slice.as_slice] = \
+                _PoissonStruct.read_data(
+                    byte_array, 0, changed_slice.n_atoms)[-1]
+
+            transceiver.write_memory(
+                placement.x, placement.y, source_address,
+                self._get_poisson_source_parameters(
+                    changed_slice, machine_time_step).tobytes())
+        self._changed_atoms[vertex_slice.as_slice] = False
+
     @overrides(AbstractRewritesDataSpecification
                .requires_memory_regions_to_be_reloaded)
     def requires_memory_regions_to_be_reloaded(self):
@@ -538,6 +738,13 @@ class SpikeSourcePoissonVertex(
     def read_parameters_from_machine(
             self, transceiver, placement, vertex_slice):
 
+        # Only the rates of live controlled sources change on the machine;
+        # the time to the next spike is kept on the machine, and is read
+        # back when a source changes or the parameters are written again
+        if ((vertex_slice.lo_atom, vertex_slice.hi_atom) not in
+                self._live_controlled_slices):
+            return
+
         # locate sdram address to where the neuron parameters are stored
         poisson_parameter_region_sdram_address = \
             helpful_functions.locate_memory_region_for_placement(
@@ -585,6 +792,7 @@ class SpikeSourcePoissonVertex(
         self._rate[vertex_slice.as_slice] = (
             spikes_per_tick *
             (MICROSECONDS_PER_SECOND / float(self._machine_time_step)))
+        self._rate_statistics = None
 
         # Store the updated time until next spike so that it can be
         # rewritten when the parameters are loaded
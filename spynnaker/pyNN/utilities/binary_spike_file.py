@@ -0,0 +1,107 @@
+""" A binary spike file format which can be memory-mapped, so that the\
+    spikes of a range of atoms can be read without reading the whole file.
+
+The file holds, in little-endian order:
+
+* the 8 bytes of MAGIC
+* the number of atoms and the number of spikes, as 64-bit unsigned ints
+* the index of the first spike of each atom, and then the total number of\
+  spikes, as n_atoms + 1 64-bit unsigned ints
+* the spike times, sorted by atom and then by time, as 64-bit floats
+"""
+import math
+import numpy
+
+#: The bytes at the start of every binary spike file
+MAGIC = b"SPYNSPK1"
+
+_HEADER_BYTES = len(MAGIC) + 16
+_INDEX_DTYPE = numpy.dtype("<u8")
+_TIME_DTYPE = numpy.dtype("<f8")
+
+
+def is_binary_spike_file(file_path):
+    """ Determine if a file is a binary spike file
+
+    :param file_path: The path of the file to check
+    :rtype: bool
+    """
+    with open(file_path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def write_binary_spike_file(file_path, spikes):
+    """ Write spikes to a binary spike file
+
+    :param file_path: The path of the file to write
+    :param spikes:\
+        The spikes as an array of (atom ID, time), as returned by\
+        read_spikes_from_file
+    :type spikes: numpy.array(float, float)
+    """
+    spikes = numpy.asarray(spikes, dtype="float64").reshape(-1, 2)
+    atom_ids = spikes[:, 0].astype("int64")
+    if (atom_ids < 0).any() or (atom_ids != spikes[:, 0]).any():
+        raise ValueError("The atom IDs must be non-negative integers")
+    order = numpy.lexsort((spikes[:, 1], atom_ids))
+    n_atoms = int(atom_ids.max()) + 1 if len(atom_ids) else 0
+    index = numpy.zeros(n_atoms + 1, dtype=_INDEX_DTYPE)
+    numpy.cumsum(numpy.bincount(atom_ids, minlength=n_atoms), out=index[1:])
+
+    with open(file_path, "wb") as f:
+        f.write(MAGIC)
+        numpy.array([n_atoms, len(spikes)], dtype=_INDEX_DTYPE).tofile(f)
+        index.tofile(f)
+        spikes[order, 1].astype(_TIME_DTYPE).tofile(f)
+
+
+def read_binary_spike_file(
+        file_path, min_atom=0, max_atom=float('inf'), min_time=0,
+        max_time=float('inf')):
+    """ Read the spikes of a range of atoms and times from a binary spike\
+        file; only the part of the file holding the atoms in the range is\
+        read
+
+    :param file_path: The path of the file to read
+    :param min_atom: min neuron ID to which neurons to read in
+    :param max_atom: max neuron ID to which neurons to read in
+    :param min_time: min time slot to read neurons values of.
+    :param max_time: max time slot to read neurons values of.
+    :return: an array of (atom ID, time), sorted by atom ID and then time
+    :rtype: numpy.array(float, float)
+    """
+    # pylint: disable=too-many-arguments
+    with open(file_path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(
+                "{} is not a binary spike file".format(file_path))
+        n_atoms, n_spikes = (
+            int(value) for value in
+            numpy.fromfile(f, dtype=_INDEX_DTYPE, count=2))
+
+    first_atom = _clamp_atom(min_atom, n_atoms)
+    last_atom = max(first_atom, _clamp_atom(max_atom, n_atoms))
+    if not n_spikes or first_atom == last_atom:
+        return numpy.zeros((0, 2))
+
+    index = numpy.memmap(
+        file_path, dtype=_INDEX_DTYPE, mode="r", offset=_HEADER_BYTES,
+        shape=(n_atoms + 1,))
+    counts = numpy.diff(index[first_atom:last_atom + 1]).astype("int64")
+    times = numpy.memmap(
+        file_path, dtype=_TIME_DTYPE, mode="r",
+        offset=_HEADER_BYTES + index.nbytes, shape=(n_spikes,))[
+            int(index[first_atom]):int(index[last_atom])]
+    atom_ids = numpy.repeat(
+        numpy.arange(first_atom, last_atom, dtype="float64"), counts)
+    in_range = (times >= min_time) & (times < max_time)
+    return numpy.column_stack((atom_ids[in_range], times[in_range]))
+
+
+def _clamp_atom(atom, n_atoms):
+    """ Get the first whole atom ID which is at least the given ID, limited\
+        to the range of atoms in the file
+    """
+    if atom >= n_atoms:
+        return n_atoms
+    return max(0, int(math.ceil(atom)))
@@ -1,3 +1,4 @@
+import numpy
 from spinn_utilities.overrides import overrides
 from spinn_utilities.ranged.ranged_list import RangedList
 from spinn_front_end_common.utilities import globals_variables
@@ -22,3 +23,24 @@ class SpynnakerRangedList(RangedList):
             return value.next(n=size)
 
         return RangedList.as_list(value, size, ids)
+
+    def set_value_by_array(self, values):
+        """ Sets all the elements to the values in an array, storing each\
+            run of equal values as a single range
+
+        :param values: The new values, one for each element
+        :type values: numpy.array
+        """
+        values = numpy.asarray(values)
+        if len(values) != self._size:
+            raise Exception("The number of values does not equal the size")
+        if not self._size:
+            return
+
+        # Find where each run of equal values starts and stops
+        stops = numpy.append(
+            numpy.nonzero(values[1:] != values[:-1])[0] + 1, self._size)
+        starts = numpy.insert(stops[:-1], 0, 0)
+        self._ranges = list(zip(
+            starts.tolist(), stops.tolist(), values[starts].tolist()))
+        self._ranged_based = True
@@ -1,4 +1,5 @@
 import math
+import numpy
 
 
 class RunningStats(object):
@@ -55,3 +56,45 @@ class RunningStats(object):
     @property
     def standard_deviation(self):
         return math.sqrt(self.variance)
+
+
+def grouped_stats(groups, means, variances, n_items, n_groups):
+    """ Combine several sets of statistics into one set per group, giving\
+        the same result as calling :py:meth:`RunningStats.add_items` for\
+        each set in turn on the :py:class:`RunningStats` of its group
+
+    :param groups: The group of each set of statistics
+    :param means: The mean of each set
+    :param variances: The variance of each set
+    :param n_items: The number of items in each set
+    :param n_groups: The number of groups
+    :return: The number of items, mean and variance of each group
+    :rtype: tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray)
+    """
+    groups = numpy.asarray(groups, dtype="int64")
+    means = numpy.asarray(means, dtype="float64")
+    variances = numpy.asarray(variances, dtype="float64")
+    n_items = numpy.asarray(n_items, dtype="float64")
+
+    # Sets with no items are ignored by add_items
+    used = n_items > 0
+    groups = groups[used]
+    means = means[used]
+    variances = variances[used]
+    n_items = n_items[used]
+
+    total_items = numpy.bincount(groups, n_items, minlength=n_groups)
+    group_means = numpy.zeros(n_groups)
+    has_items = total_items > 0
+    group_means[has_items] = (
+        numpy.bincount(groups, n_items * means, minlength=n_groups)[
+            has_items] / total_items[has_items])
+    deltas = means - group_means[groups]
+    mean_2 = numpy.bincount(
+        groups, variances * (n_items - 1.0) + n_items * deltas * deltas,
+        minlength=n_groups)
+    group_variances = numpy.zeros(n_groups)
+    several_items = total_items > 1
+    group_variances[several_items] = (
+        mean_2[several_items] / (total_items[several_items] - 1.0))
+    return total_items, group_means, group_variances
@@ -5,14 +5,25 @@ from decimal import Decimal
 import os
 import logging
 import math
+from multiprocessing.pool import ThreadPool
+import warnings
 import numpy
 from scipy.stats import binom
 from spinn_utilities.safe_eval import SafeEval
 from spinn_front_end_common.utilities import globals_variables
 from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from .binary_spike_file import is_binary_spike_file, read_binary_spike_file
 
 MAX_RATE = 2 ** 32 - 1  # To allow a unit32_t to be used to store the rate
 
+# More than the largest relative difference between a float and the decimal
+# value of its string representation; str keeps 12 significant digits in
+# Python 2, so the difference is at most 5e-12
+_DECIMAL_RELATIVE_ERROR = 2.0 ** -37
+
+# The number of bytes of a text file to parse at once
+_READ_BLOCK_BYTES = 16 * 1024 * 1024
+
 logger = logging.getLogger(__name__)
 
 
@@ -70,6 +81,126 @@ def convert_to(value, data_type):
             numpy.dtype(data_type.struct_encoding))
 
 
+def convert_array_to(values, data_type):
+    """ Convert an array of values to a given data type, giving the same\
+        result as convert_to on each value
+
+    :param values: The values to convert
+    :param data_type: The data type to convert to
+    :return: The converted data as a numpy array of the data type
+    """
+    values = numpy.atleast_1d(values)
+    dtype = numpy.dtype(data_type.struct_encoding)
+    relative_error = _DECIMAL_RELATIVE_ERROR
+    if values.dtype.kind == "f":
+        relative_error = max(
+            relative_error, float(numpy.finfo(values.dtype).eps))
+    scaled = values.astype("float64") * float(data_type.scale)
+    rounded = numpy.round(scaled)
+
+    # Converting through the decimal string can only round differently when
+    # the scaled value is close to half way between two integers; these,
+    # and values that are not finite or do not fit in the data type, are
+    # converted one by one
+    with numpy.errstate(invalid="ignore"):
+        error = (numpy.abs(scaled) + 1.0) * relative_error
+        exact = numpy.abs(
+            numpy.abs(scaled - numpy.floor(scaled)) - 0.5) > error
+        if dtype.kind in "iu":
+            info = numpy.iinfo(dtype)
+            exact &= (rounded >= info.min) & (rounded < info.max + 1.0)
+    converted = numpy.zeros(values.shape, dtype=dtype)
+    converted[exact] = rounded[exact]
+    inexact = ~exact
+    if inexact.any():
+        converted[inexact] = [
+            convert_to(value, data_type) for value in values[inexact]]
+    return converted
+
+
+def _read_columns_from_file(
+        file_path, n_columns, split_value="\t", n_file_columns=None):
+    """ Read the first columns of a text file of values, a block of lines\
+        at a time, skipping lines that start with #.  Each block is parsed\
+        in one go where possible, and one line at a time otherwise.
+
+    :param file_path: absolute path to the file to read
+    :param n_columns: the number of columns to read from each line
+    :param split_value: the pattern that separates the columns
+    :param n_file_columns: \
+        the number of columns that each line must have, or None to take\
+        the number from the first line and ignore any extra columns
+    :return: an iterable of arrays of n_columns values, one for each block
+    :raises ValueError: if a line does not have n_file_columns columns
+    """
+    evaluator = SafeEval()
+    check_columns = n_file_columns is not None
+    with open(file_path, 'r') as f:
+        while True:
+            # Read a block of whole lines
+            block = f.read(_READ_BLOCK_BYTES)
+            if not block:
+                return
+            block += f.readline()
+
+            if "#" in block:
+                block = "\n".join(
+                    line for line in block.splitlines()
+                    if not line.startswith('#'))
+            if n_file_columns is None and block.strip():
+                first_line = block.strip().splitlines()[0]
+                n_file_columns = len(first_line.split(split_value))
+            if n_file_columns is None:
+                continue
+
+            values = _parse_block(
+                block, n_file_columns, n_columns, split_value)
+            if values is None:
+                lines = [line.split(split_value)
+                         for line in block.splitlines() if line.strip()]
+                if check_columns:
+                    for line in lines:
+                        if len(line) != n_file_columns:
+                            raise ValueError(
+                                "Expected {} values on each line of {} but"
+                                " found {} in {}".format(
+                                    n_file_columns, file_path, len(line),
+                                    split_value.join(line)))
+                values = numpy.array([
+                    [float(evaluator.eval(value))
+                     for value in line[:n_columns]]
+                    for line in lines],
+                    dtype="float64").reshape(-1, n_columns)
+            yield values
+
+
+def _parse_block(block, n_file_columns, n_columns, split_value):
+    """ Parse a block of lines of numbers all at once, or return None if\
+        the block can't be parsed this way
+    """
+    if not block.endswith("\n"):
+        block += "\n"
+    n_lines = block.count("\n")
+    if block.count(split_value) != n_lines * (n_file_columns - 1):
+        return None
+    if len(split_value) == 1 and ord(split_value) < 128:
+        # Check that every line has the same number of separators, as the
+        # total above would also match lines with too few and too many
+        text = numpy.frombuffer(
+            block if isinstance(block, bytes) else block.encode("utf-8"),
+            dtype="uint8")
+        ends = text[(text == ord(split_value)) | (text == ord("\n"))]
+        if (ends[n_file_columns - 1::n_file_columns] != ord("\n")).any():
+            return None
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        values = numpy.fromstring(
+            block.replace(split_value, " "), dtype="float64", sep=" ")
+    if len(values) != n_lines * n_file_columns:
+        return None
+    return values.reshape(n_lines, n_file_columns)[:, :n_columns]
+
+
 def read_in_data_from_file(
         file_path, min_atom, max_atom, min_time, max_time, extra=False):
     """ Read in a file of data values where the values are in a format of:
@@ -80,33 +211,22 @@ def read_in_data_from_file(
     :param max_atom: max neuron ID to which neurons to read in
     :param min_time: min time slot to read neurons values of.
     :param max_time: max time slot to read neurons values of.
+    :param extra: True if each line has a fourth value, which is ignored
     :return: a numpy array of (time stamp, atom ID, data value)
+    :raises ValueError: if a line has the wrong number of values
     """
-    times = list()
-    atom_ids = list()
-    data_items = list()
-    evaluator = SafeEval()
-    with open(file_path, 'r') as f:
-        for line in f.readlines():
-            if line.startswith('#'):
-                continue
-            if extra:
-                time, neuron_id, data_value, extra = line.split("\t")
-            else:
-                time, neuron_id, data_value = line.split("\t")
-            time = float(evaluator.eval(time))
-            neuron_id = int(evaluator.eval(neuron_id))
-            data_value = float(evaluator.eval(data_value))
-            if (min_atom <= neuron_id < max_atom and
-                    min_time <= time < max_time):
-                times.append(time)
-                atom_ids.append(neuron_id)
-                data_items.append(data_value)
-            else:
-                print("failed to enter {}:{}".format(neuron_id, time))
-
-    result = numpy.dstack((atom_ids, times, data_items))[0]
-    return result[numpy.lexsort((times, atom_ids))]
+    blocks = [numpy.zeros((0, 3))]
+    for values in _read_columns_from_file(
+            file_path, 3, n_file_columns=4 if extra else 3):
+        times = values[:, 0]
+        atom_ids = numpy.trunc(values[:, 1])
+        in_range = ((min_atom <= atom_ids) & (atom_ids < max_atom) &
+                    (min_time <= times) & (times < max_time))
+        blocks.append(numpy.column_stack((
+            atom_ids[in_range], times[in_range], values[in_range, 2])))
+
+    result = numpy.concatenate(blocks)
+    return result[numpy.lexsort((result[:, 1], result[:, 0]))]
 
 
 def read_spikes_from_file(file_path, min_atom=0, max_atom=float('inf'),
@@ -114,6 +234,11 @@ def read_spikes_from_file(file_path, min_atom=0, max_atom=float('inf'),
     """ Read spikes from a file formatted as:\
         <time>\t<neuron ID>
 
+    The file can also be a binary spike file, written by\
+    :py:func:`spynnaker.pyNN.utilities.binary_spike_file.\
+write_binary_spike_file`, in which case only the spikes of the atoms\
+    requested are read.
+
     :param file_path: absolute path to a file containing spike values
     :type file_path: str
     :param min_atom: min neuron ID to which neurons to read in
@@ -144,22 +269,21 @@ def read_spikes_from_file(file_path, min_atom=0, max_atom=float('inf'),
     if max_time is None:
         max_time = float('inf')
 
-    data = []
-    with open(file_path, 'r') as fsource:
-        read_data = fsource.readlines()
+    if is_binary_spike_file(file_path):
+        return read_binary_spike_file(
+            file_path, min_atom, max_atom, min_time, max_time)
 
-    evaluator = SafeEval()
-    for line in read_data:
-        if line.startswith('#'):
-            continue
-        values = line.split(split_value)
-        time = float(evaluator.eval(values[0]))
-        neuron_id = float(evaluator.eval(values[1]))
-        if (min_atom <= neuron_id < max_atom and
-                min_time <= time < max_time):
-            data.append([neuron_id, time])
-    data.sort()
-    return numpy.array(data)
+    blocks = [numpy.zeros((0, 2))]
+    for values in _read_columns_from_file(file_path, 2, split_value):
+        times = values[:, 0]
+        atom_ids = values[:, 1]
+        in_range = ((min_atom <= atom_ids) & (atom_ids < max_atom) &
+                    (min_time <= times) & (times < max_time))
+        blocks.append(numpy.column_stack(
+            (atom_ids[in_range], times[in_range])))
+
+    data = numpy.concatenate(blocks)
+    return data[numpy.lexsort((data[:, 1], data[:, 0]))]
 
 
 def get_probable_maximum_selected(
@@ -281,3 +405,37 @@ def get_n_bits(n_values):
     if n_values == 1:
         return 1
     return int(math.ceil(math.log(n_values, 2)))
+
+
+def run_in_threads(function, items, n_threads):
+    """ Call a function on each of the items using a bounded pool of\
+        threads, yielding the results in the order that they complete
+
+    :param function: The function to call with each item
+    :param items: The items to call the function on
+    :param n_threads:\
+        The maximum number of calls to make at once; if 1 or less, the calls\
+        are made one after the other in the calling thread
+    :return: An iterable of the results of the calls
+    """
+    items = list(items)
+    if n_threads <= 1 or len(items) <= 1:
+        for item in items:
+            yield function(item)
+        return
+
+    # If the results are not all taken (because of an error, or because the
+    # caller stops early and the generator is closed), stop the pool rather
+    # than waiting for the remaining calls
+    pool = ThreadPool(min(n_threads, len(items)))
+    completed = False
+    try:
+        for result in pool.imap_unordered(function, items):
+            yield result
+        completed = True
+    finally:
+        if completed:
+            pool.close()
+        else:
+            pool.terminate()
+        pool.join()
@@ -0,0 +1,74 @@
+import numpy
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    DistanceDependentProbabilityConnector)
+from unittests.mocks import MockSimulator, MockPopulation
+
+
+class _LinePopulation(MockPopulation):
+    def __init__(self, size, label):
+        super(_LinePopulation, self).__init__(size, label)
+        self.positions = numpy.zeros((3, size))
+        self.positions[0] = numpy.arange(size)
+
+
+class _LineSpace(object):
+    def __init__(self):
+        self.n_calls = 0
+
+    def distances(self, pre_positions, post_positions, expand_distances):
+        self.n_calls += 1
+        return numpy.abs(
+            pre_positions[0][:, None] - post_positions[0][None, :]).reshape(-1)
+
+
+class _SmallBlockConnector(DistanceDependentProbabilityConnector):
+    MAX_SCAN_BLOCK_SIZE = 250
+
+
+def _create_connector(n_pre, n_post):
+    MockSimulator.setup()
+    connector = _SmallBlockConnector("exp(-d / 10.0)")
+    space = _LineSpace()
+    connector.set_space(space)
+    connector.set_projection_information(
+        pre_population=_LinePopulation(n_pre, "Pre"),
+        post_population=_LinePopulation(n_post, "Post"),
+        rng=None, machine_time_step=1000)
+    return connector, space
+
+
+def test_block_probabilities():
+    connector, space = _create_connector(100, 60)
+    pre_slice = Slice(20, 39)
+    post_slice = Slice(30, 59)
+    probs = connector._get_probabilities(pre_slice, post_slice)
+    d = numpy.abs(
+        numpy.arange(20, 40)[:, None] - numpy.arange(30, 60)[None, :])
+    assert numpy.allclose(probs, numpy.exp(-d / 10.0))
+
+    # The same block is not recomputed
+    n_calls = space.n_calls
+    connector._get_probabilities(pre_slice, post_slice)
+    assert space.n_calls == n_calls
+
+    block = connector.create_synaptic_block(
+        1.0, 1.0, None, 0, None, 0, pre_slice, post_slice, 0)
+    assert numpy.all((block["source"] >= 20) & (block["source"] <= 39))
+    assert numpy.all((block["target"] >= 30) & (block["target"] <= 59))
+
+
+def test_max_probability_in_blocks():
+    connector, space = _create_connector(100, 60)
+    assert connector._get_max_probability(Slice(10, 19)) == 1.0
+    far_slice = Slice(0, 9)
+    connector._pre_population.positions[0] += 200
+    assert numpy.isclose(
+        connector._get_max_probability(far_slice), numpy.exp(-19.1))
+    assert numpy.isclose(connector._get_max_probability(), numpy.exp(-14.1))
+
+    # The maxima are remembered
+    n_calls = space.n_calls
+    connector._get_max_probability(far_slice)
+    connector._get_max_probability()
+    assert space.n_calls == n_calls
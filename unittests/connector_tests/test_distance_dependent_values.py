@@ -0,0 +1,84 @@
+import numpy
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AllToAllConnector, FromListConnector)
+from unittests.mocks import MockSimulator, MockPopulation, MockSpace
+
+
+class _GridPopulation(MockPopulation):
+    def __init__(self, size, label, offset):
+        super(_GridPopulation, self).__init__(size, label)
+        self.positions = numpy.zeros((3, size))
+        self.positions[0] = numpy.arange(size) % 4 + offset
+        self.positions[1] = numpy.arange(size) // 4
+
+
+class _EuclideanSpace(object):
+    def distances(self, pre_positions, post_positions, expand_distances):
+        d = pre_positions[:, :, None] - post_positions[:, None, :]
+        if expand_distances:
+            return numpy.abs(d)
+        return numpy.sqrt(numpy.sum(d ** 2, axis=0))
+
+
+def _setup(connector, space=None):
+    MockSimulator.setup()
+    pre = _GridPopulation(16, "Pre", 0.0)
+    post = _GridPopulation(12, "Post", 10.0)
+    connector.set_space(_EuclideanSpace() if space is None else space)
+    connector.set_projection_information(
+        pre_population=pre, post_population=post, rng=None,
+        machine_time_step=1000)
+    return pre, post
+
+
+def _expected_distances(pre, post, block):
+    return numpy.sqrt(numpy.sum((
+        pre.positions[:, block["source"]] -
+        post.positions[:, block["target"]]) ** 2, axis=0))
+
+
+def test_all_to_all_distance_weights():
+    connector = AllToAllConnector()
+    pre, post = _setup(connector)
+    pre_slice = Slice(4, 11)
+    post_slice = Slice(3, 8)
+    block = connector.create_synaptic_block(
+        "d * 2", "1 + d[1]", [pre_slice], 0, [post_slice], 0, pre_slice,
+        post_slice, 0)
+    assert len(block) == 8 * 6
+    assert numpy.allclose(
+        block["weight"], 2 * _expected_distances(pre, post, block))
+    assert numpy.allclose(block["delay"], 1 + numpy.abs(
+        pre.positions[1, block["source"]] -
+        post.positions[1, block["target"]]))
+
+
+def test_from_list_distance_weights():
+    connector = FromListConnector([(0, 5), (15, 0), (3, 3), (7, 11)])
+    pre, post = _setup(connector)
+    pre_slice = Slice(0, 15)
+    post_slice = Slice(0, 11)
+    block = connector.create_synaptic_block(
+        lambda d: numpy.sqrt(numpy.sum(d ** 2, axis=0)) + 0.5, 1.0,
+        [pre_slice], 0, [post_slice], 0, pre_slice, post_slice, 0)
+    assert numpy.allclose(
+        block["weight"], _expected_distances(pre, post, block) + 0.5)
+
+
+def test_scaled_space_distance_weights():
+    connector = AllToAllConnector()
+    space = MockSpace(scale_factor=2.0, offset=numpy.array([-9.0, 0.5, 1.0]))
+    pre, post = _setup(connector, space)
+    pre_slice = Slice(0, 15)
+    post_slice = Slice(0, 11)
+    block = connector.create_synaptic_block(
+        "d", "1 + d[1]", [pre_slice], 0, [post_slice], 0, pre_slice,
+        post_slice, 0)
+    d = space.distances(pre.positions, post.positions).reshape(16, 12)
+    d_y = space.distances(
+        pre.positions, post.positions, expand=True).reshape(3, 16, 12)[1]
+    assert numpy.allclose(
+        block["weight"], d[block["source"], block["target"]])
+    assert numpy.allclose(
+        block["delay"], 1 + d_y[block["source"], block["target"]])
@@ -0,0 +1,79 @@
+import numpy
+import pytest
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    FixedProbabilityConnector)
+from unittests.mocks import MockSimulator, MockPopulation, MockRNG
+
+
+def _create_block(p_connect, seed, allow_self_connections=True,
+                  sparse=False, n_atoms=200):
+    MockSimulator.setup()
+    rng = MockRNG()
+    rng.seed(seed)
+    connector = FixedProbabilityConnector(
+        p_connect, allow_self_connections=allow_self_connections,
+        sparse=sparse)
+    connector.set_projection_information(
+        pre_population=MockPopulation(n_atoms, "Pre"),
+        post_population=MockPopulation(n_atoms, "Post"),
+        rng=rng, machine_time_step=1000)
+    vertex_slice = Slice(0, n_atoms - 1)
+    return connector.create_synaptic_block(
+        1.0, 1.0, [vertex_slice], 0, [vertex_slice], 0, vertex_slice,
+        vertex_slice, 0)
+
+
+@pytest.mark.parametrize("p_connect", [0.001, 0.01, 0.2, 0.9])
+def test_sparse_connection_count(p_connect):
+    n_connections = [
+        len(_create_block(p_connect, seed, sparse=True))
+        for seed in range(20)]
+    expected = 200 * 200 * p_connect
+    assert abs(numpy.mean(n_connections) - expected) < (
+        5 * numpy.sqrt(expected / 20.0) + 1)
+
+
+def test_sparse_connections_unique_and_sorted():
+    block = _create_block(0.3, 1, sparse=True)
+    ids = block["source"].astype("int64") * 200 + block["target"]
+    assert numpy.all(numpy.diff(ids) > 0)
+
+
+def test_sparse_no_self_connections():
+    block = _create_block(0.5, 2, allow_self_connections=False, sparse=True)
+    assert len(block) > 0
+    assert not numpy.any(block["source"] == block["target"])
+
+
+def test_sparse_reproducible():
+    assert numpy.array_equal(
+        _create_block(0.01, 3, sparse=True),
+        _create_block(0.01, 3, sparse=True))
+    assert not numpy.array_equal(
+        _create_block(0.01, 3, sparse=True),
+        _create_block(0.01, 4, sparse=True))
+
+
+def test_dense_by_default():
+    MockSimulator.setup()
+    rng = MockRNG()
+    rng.seed(6)
+    items = rng.next(200 * 200)
+    ids = numpy.where(items < 0.01)[0]
+    block = _create_block(0.01, 6)
+    assert numpy.array_equal(block["source"], ids // 200)
+    assert numpy.array_equal(block["target"], ids % 200)
+
+
+def test_sparse_when_none():
+    assert numpy.array_equal(
+        _create_block(0.01, 7, sparse=None),
+        _create_block(0.01, 7, sparse=True))
+    assert numpy.array_equal(
+        _create_block(0.2, 7, sparse=None), _create_block(0.2, 7))
+
+
+def test_extreme_probabilities():
+    assert len(_create_block(0.0, 5, sparse=True)) == 0
+    assert len(_create_block(1.0, 5, sparse=True)) == 200 * 200
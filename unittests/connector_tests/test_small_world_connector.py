@@ -0,0 +1,88 @@
+import numpy
+import pytest
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    SmallWorldConnector)
+from unittests.mocks import MockSimulator, MockPopulation, MockSpace
+
+
+class _RandomPopulation(MockPopulation):
+    def __init__(self, size, label, seed):
+        super(_RandomPopulation, self).__init__(size, label)
+        self.positions = numpy.random.RandomState(seed).uniform(
+            0, 10, (3, size))
+
+
+class _Space(object):
+    """ Euclidean distance over the x and y axes, optionally wrapping around\
+        at 10 in x
+    """
+    def __init__(self, periodic):
+        self.axes = numpy.array([0, 1])
+        self.periodic_boundaries = None
+        if periodic:
+            self.periodic_boundaries = ((0, 10), None, None)
+
+    def distances(self, pre_positions, post_positions, expand_distances):
+        d = numpy.abs(
+            pre_positions[self.axes, :, None] -
+            post_positions[self.axes, None, :])
+        if self.periodic_boundaries is not None:
+            d[0] = numpy.minimum(d[0], 10 - d[0])
+        return numpy.sqrt(numpy.sum(d ** 2, axis=0))
+
+
+@pytest.mark.parametrize("periodic", [False, True])
+def test_small_world_neighbours(periodic):
+    MockSimulator.setup()
+    pre = _RandomPopulation(60, "Pre", 1)
+    post = _RandomPopulation(50, "Post", 2)
+    space = _Space(periodic)
+    connector = SmallWorldConnector(degree=2.5, rewiring=0.0)
+    connector.set_space(space)
+    connector.set_projection_information(
+        pre_population=pre, post_population=post, rng=None,
+        machine_time_step=1000)
+
+    mask = space.distances(pre.positions, post.positions, False) < 2.5
+    assert connector._n_connections == numpy.sum(mask)
+    assert connector.get_n_connections_to_post_vertex_maximum() == \
+        numpy.amax(numpy.sum(mask, axis=0))
+    post_slice = Slice(10, 29)
+    assert connector.get_n_connections_from_pre_vertex_maximum(
+        None, post_slice) == numpy.amax(
+            numpy.sum(mask[:, post_slice.as_slice], axis=1))
+
+    pre_slice = Slice(20, 44)
+    block = connector.create_synaptic_block(
+        1.0, 1.0, None, 0, None, 0, pre_slice, post_slice, 0)
+    sources, targets = numpy.nonzero(
+        mask[pre_slice.as_slice, post_slice.as_slice])
+    assert numpy.array_equal(block["source"], sources + pre_slice.lo_atom)
+    assert numpy.array_equal(block["target"], targets + post_slice.lo_atom)
+
+
+@pytest.mark.parametrize("periodic", [False, True])
+def test_small_world_scaled_space(periodic):
+    MockSimulator.setup()
+    pre = _RandomPopulation(60, "Pre", 3)
+    post = _RandomPopulation(50, "Post", 4)
+    space = MockSpace(
+        axes="xy", scale_factor=2.0, offset=numpy.array([-5.0, -4.0, 0.0]),
+        periodic_boundaries=((0, 10), None, None) if periodic else None)
+    connector = SmallWorldConnector(degree=1.5, rewiring=0.0)
+    connector.set_space(space)
+    connector.set_projection_information(
+        pre_population=pre, post_population=post, rng=None,
+        machine_time_step=1000)
+
+    mask = space.distances(
+        pre.positions, post.positions).reshape(60, 50) < 1.5
+    assert connector._n_connections == numpy.sum(mask)
+    pre_slice = Slice(0, 59)
+    post_slice = Slice(0, 49)
+    block = connector.create_synaptic_block(
+        1.0, 1.0, None, 0, None, 0, pre_slice, post_slice, 0)
+    sources, targets = numpy.nonzero(mask)
+    assert numpy.array_equal(block["source"], sources)
+    assert numpy.array_equal(block["target"], targets)
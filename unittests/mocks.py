@@ -43,7 +43,9 @@ class MockSimulator(object):
             {"spikes_per_second": "30",
              "incoming_spike_buffer_size": "256",
              "ring_buffer_sigma": "5",
-             "one_to_one_connection_dtcm_max_bytes": "0"}
+             "one_to_one_connection_dtcm_max_bytes": "0",
+             "max_synaptic_block_cache_bytes": "67108864",
+             "spill_synaptic_block_cache": "False"}
         self.config["Buffers"] = {"time_between_requests": "10",
                                   "minimum_buffer_sdram": "10",
                                   "use_auto_pause_and_resume": "True",
@@ -88,3 +90,34 @@ class MockSimulator(object):
         globals_variables.set_failed_state(SpynnakerFailedState())
         globals_variables.set_simulator(simulator)
         return simulator
+
+
+class MockSpace(object):
+    """ A space which finds distances as pyNN.space.Space does, for positions\
+        of shape (3, n)
+    """
+
+    AXES = {None: [0, 1, 2], "x": [0], "y": [1], "z": [2], "xy": [0, 1]}
+
+    def __init__(self, axes=None, scale_factor=1.0, offset=0.0,
+                 periodic_boundaries=None):
+        self.axes = numpy.array(self.AXES[axes])
+        self.scale_factor = scale_factor
+        self.offset = offset
+        self.periodic_boundaries = periodic_boundaries
+
+    def distances(self, A, B, expand=False):
+        B = self.scale_factor * (
+            B + numpy.reshape(self.offset, (-1, 1)))
+        d = numpy.zeros((len(self.axes), A.shape[1], B.shape[1]))
+        for i, axis in enumerate(self.axes):
+            diff = A[axis, :, None] - B[axis, None, :]
+            if self.periodic_boundaries is not None:
+                boundaries = self.periodic_boundaries[axis]
+                if boundaries is not None:
+                    size = boundaries[1] - boundaries[0]
+                    diff = numpy.minimum(abs(diff), size - abs(diff))
+            d[i] = diff ** 2
+        if not expand:
+            d = numpy.sum(d, 0)
+        return numpy.sqrt(d).flatten()
@@ -1,6 +1,7 @@
 import math
 import pytest
 import numpy
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
 from spynnaker.pyNN.models.neuron import ConnectionHolder
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     AbstractSynapseDynamics)
@@ -146,3 +147,40 @@ def test_connection_holder_matrix_multiple_items():
         [(0, 0, 1, 10), (0, 0, 2, 20), (0, 1, 3, 30)],
         AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE)
     connection_holder.add_connections(connections)
+
+
+@pytest.mark.parametrize(
+    "multiple_synapses,weight_0_0",
+    [("last", 2), ("first", 1), ("sum", 3), ("min", 1), ("max", 2)])
+@pytest.mark.parametrize("sparse", [True, False], ids=["Sparse", "Dense"])
+def test_connection_holder_matrix_multiple_synapses(
+        multiple_synapses, weight_0_0, sparse):
+    connection_holder = ConnectionHolder(
+        data_items_to_return=["weight", "delay"], as_list=False,
+        n_pre_atoms=3, n_post_atoms=2, sparse=sparse,
+        multiple_synapses=multiple_synapses)
+    connection_holder.add_connections(numpy.array(
+        [(0, 1, 3, 30), (0, 0, 1, 10)],
+        AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE))
+    connection_holder.add_connections(numpy.array(
+        [(2, 1, 4, 40), (0, 0, 2, 20)],
+        AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE))
+    weights, delays = connection_holder
+
+    assert weights.shape == (3, 2)
+    assert weights[0, 0] == weight_0_0
+    assert delays[0, 0] == weight_0_0 * 10
+    assert weights[0, 1] == 3
+    assert weights[2, 1] == 4
+    if sparse:
+        assert weights.nnz == 3
+        assert weights[1, 0] == 0
+    else:
+        assert math.isnan(weights[1, 0])
+
+
+def test_connection_holder_bad_multiple_synapses():
+    with pytest.raises(ConfigurationException):
+        ConnectionHolder(
+            data_items_to_return=["weight"], as_list=False, n_pre_atoms=2,
+            n_post_atoms=2, multiple_synapses="average")
@@ -1,7 +1,18 @@
-from unittests.mocks import MockSimulator
+import numpy
+from unittests.mocks import MockPopulation, MockSimulator
 from pacman.model.graphs.common import Slice
+from pacman.model.placements import Placement
 from spinn_front_end_common.utilities import globals_variables
-from spynnaker.pyNN.models.common import NeuronRecorder
+from spynnaker.pyNN.models.common import (
+    AbstractSpikeRecordable, NeuronRecorder, read_spikes_file)
+from spynnaker.pyNN.models.recording_common import RecordingCommon
+from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
+from spynnaker.pyNN.models.neuron.implementations import NeuronImplStandard
+from spynnaker.pyNN.models.neuron.input_types import InputTypeCurrent
+from spynnaker.pyNN.models.neuron.neuron_models import (
+    NeuronModelLeakyIntegrateAndFire)
+from spynnaker.pyNN.models.neuron.synapse_types import SynapseTypeExponential
+from spynnaker.pyNN.models.neuron.threshold_types import ThresholdTypeStatic
 from spynnaker.pyNN.utilities.spynnaker_failed_state import (
     SpynnakerFailedState)
 
@@ -42,3 +53,269 @@ def test_recording_variables():
     nr.set_recording("gsyn_inh", True)
     assert(["v", "gsyn_inh"] == nr.recording_variables)
     assert([1, 3] == nr.recorded_region_ids)
+
+
+class _MockPlacements(object):
+    def get_placement_of_vertex(self, vertex):
+        return Placement(vertex, 0, 0, 1)
+
+
+class _MockGraphMapper(object):
+    def __init__(self, slices):
+        self._slices = slices
+
+    def get_machine_vertices(self, application_vertex):
+        return list(self._slices)
+
+    def get_slice(self, vertex):
+        return self._slices[vertex]
+
+
+class _MockBufferManager(object):
+    def __init__(self, data):
+        self._data = data
+
+    def get_data_by_placement(self, placement, region):
+        return self._data[placement.vertex], False
+
+
+def _spike_record(n_neurons, spikes):
+    """ Encode {time: [local neuron]} as a recorded spike region
+    """
+    n_words = (n_neurons + 31) // 32
+    record = numpy.zeros((len(spikes), n_words + 1), dtype="<u4")
+    for row, time in enumerate(sorted(spikes)):
+        record[row, 0] = time
+        for neuron in spikes[time]:
+            record[row, 1 + neuron // 32] |= 1 << (neuron % 32)
+    return bytearray(record.tobytes())
+
+
+def test_spikes(tmpdir):
+    simulator = MockSimulator()
+    globals_variables.set_failed_state(SpynnakerFailedState())
+    globals_variables.set_simulator(simulator)
+
+    nr = NeuronRecorder(["spikes", "v"], 70)
+    nr.set_recording("spikes", True, indexes=[1, 3, 40, 45, 69])
+    slices = {"a": Slice(40, 69), "b": Slice(0, 39)}
+    # Local neurons are positions in the recorded indexes of each slice
+    data = {"a": _spike_record(3, {0: [2, 1], 3: [0, 2]}),
+            "b": _spike_record(2, {1: [1], 2: [0, 1]})}
+    args = ("test", _MockBufferManager(data), 0, _MockPlacements(),
+            _MockGraphMapper(slices), None, 1000)
+
+    expected = numpy.array(
+        [[1, 2], [3, 1], [3, 2], [40, 3], [45, 0], [69, 0], [69, 3]])
+    assert numpy.array_equal(nr.get_spikes(*args), expected)
+
+    filename = str(tmpdir.join("spikes"))
+    assert nr.write_spikes(filename, *args) == len(expected)
+    ids, times = NeuronRecorder.read_spikes_file(filename)
+    written = numpy.column_stack((ids, times))
+    assert numpy.array_equal(
+        written[numpy.lexsort((times, ids))], expected)
+
+
+def _matrix_record(times, values):
+    record = numpy.column_stack((times, numpy.array(values) * 32768))
+    return bytearray(record.astype("<i4").tobytes())
+
+
+def test_matrix_data_with_gaps():
+    simulator = _MockBasicSimulator()
+    globals_variables.set_failed_state(SpynnakerFailedState())
+    globals_variables.set_simulator(simulator)
+
+    nr = NeuronRecorder(["spikes", "v"], 5)
+    nr.set_recording("v", True)
+    slices = {"a": Slice(0, 1), "b": Slice(2, 4)}
+    data = {
+        "a": _matrix_record([0, 1, 2, 3], [[1, 2], [3, 4], [5, 6], [7, 8]]),
+        # Times 1 and 3 are missing and time 2 is recorded twice
+        "b": _matrix_record(
+            [0, 2, 2], [[1, 1, 1], [2, 2, 2], [3, 3, 3]])}
+    matrix, indexes, _ = nr.get_matrix_data(
+        "test", _MockBufferManager(data), 0, _MockPlacements(),
+        _MockGraphMapper(slices), None, "v", 4)
+    nan = numpy.nan
+    expected = numpy.array([
+        [1, 2, 1, 1, 1], [3, 4, nan, nan, nan],
+        [5, 6, nan, nan, nan], [7, 8, nan, nan, nan]])
+    assert sorted(indexes) == [0, 1, 2, 3, 4]
+    ordered = matrix[:, numpy.argsort(indexes)]
+    assert numpy.array_equal(numpy.isnan(ordered), numpy.isnan(expected))
+    assert numpy.array_equal(
+        numpy.nan_to_num(ordered), numpy.nan_to_num(expected))
+
+
+def test_matrix_data_to_file(tmpdir):
+    simulator = _MockBasicSimulator()
+    globals_variables.set_failed_state(SpynnakerFailedState())
+    globals_variables.set_simulator(simulator)
+
+    nr = NeuronRecorder(["spikes", "v"], 4)
+    nr.set_recording("v", True, sampling_interval=2)
+    slices = {"a": Slice(0, 1), "b": Slice(2, 3)}
+    data = {"a": _matrix_record([0, 2], [[1, 2], [3, 4]]),
+            "b": _matrix_record([0, 2], [[5, 6], [7, 8]])}
+    args = ("test", _MockBufferManager(data), 0, _MockPlacements(),
+            _MockGraphMapper(slices), None, "v", 4)
+    in_memory = nr.get_matrix_data(*args)
+
+    filename = str(tmpdir.join("v.npy"))
+    on_disk = nr.get_matrix_data(*args, filename=filename)
+    assert isinstance(on_disk[0], numpy.memmap)
+    for read in (on_disk, NeuronRecorder.read_matrix_data(filename)):
+        assert numpy.array_equal(read[0], in_memory[0])
+        assert list(read[1]) == list(in_memory[1])
+        assert read[2] == in_memory[2] == 2
+
+
+class _CountingBufferManager(_MockBufferManager):
+    def __init__(self, data):
+        super(_CountingBufferManager, self).__init__(data)
+        self.n_reads = 0
+
+    def get_data_by_placement(self, placement, region):
+        self.n_reads += 1
+        return super(_CountingBufferManager, self).get_data_by_placement(
+            placement, region)
+
+    def clear_recorded_data(self, x, y, p, region):
+        pass
+
+
+def test_vertex_recorded_data_files(tmpdir):
+    simulator = MockSimulator.setup()
+    simulator.machine_time_step = 1000
+    simulator.config["Recording"] = {
+        "memory_map_recorded_data": "True",
+        "recorded_data_folder": str(tmpdir)}
+    vertex = AbstractPopulationVertex(
+        4, "test", None, 255, None, None, None, NeuronImplStandard(
+            "LIF", "lif.aplx",
+            NeuronModelLeakyIntegrateAndFire(
+                v_init=-65.0, v_rest=-65.0, tau_m=20.0, cm=1.0,
+                i_offset=0.0, v_reset=-65.0, tau_refrac=0.1),
+            InputTypeCurrent(),
+            SynapseTypeExponential(
+                tau_syn_E=5.0, tau_syn_I=5.0, isyn_exc=0.0, isyn_inh=0.0),
+            ThresholdTypeStatic(v_thresh=-50.0)), None)
+    vertex.set_recording("v")
+    slices = {"a": Slice(0, 1), "b": Slice(2, 3)}
+    buffer_manager = _CountingBufferManager({
+        "a": _matrix_record([0, 1], [[1, 2], [3, 4]]),
+        "b": _matrix_record([0, 1], [[5, 6], [7, 8]])})
+
+    def get_data(n_machine_time_steps):
+        return vertex.get_data(
+            "v", n_machine_time_steps, _MockPlacements(),
+            _MockGraphMapper(slices), buffer_manager, 1000)
+
+    # The data of a run is read from the machine once, into one file
+    first = get_data(2)
+    again = get_data(2)
+    assert buffer_manager.n_reads == 2
+    assert numpy.array_equal(first[0], again[0])
+    assert list(first[1]) == list(again[1])
+    assert len(tmpdir.listdir()) == 2
+
+    # A later run replaces the file of the earlier one
+    get_data(1)
+    assert buffer_manager.n_reads == 4
+    assert len(tmpdir.listdir()) == 2
+
+    vertex.clear_recording("v", buffer_manager, _MockPlacements(),
+                           _MockGraphMapper(slices))
+    assert len(tmpdir.listdir()) == 0
+    get_data(2)
+    vertex.delete_recorded_data_files()
+    assert len(tmpdir.listdir()) == 0
+
+    # No file is made when no neurons are recorded
+    vertex.set_recording("v", indexes=[3])
+    data = vertex.get_data(
+        "v", 2, _MockPlacements(), _MockGraphMapper({"a": Slice(0, 1)}),
+        buffer_manager, 1000)
+    assert data[0] is None
+    assert len(tmpdir.listdir()) == 0
+
+
+class _SpikeRecordable(AbstractSpikeRecordable):
+    """ Spikes that can only be read all at once
+    """
+
+    def __init__(self, spikes):
+        self._spikes = spikes
+
+    def is_recording_spikes(self):
+        return True
+
+    def set_recording_spikes(
+            self, new_state=True, sampling_interval=None, indexes=None):
+        pass
+
+    def clear_spike_recording(self, buffer_manager, placements, graph_mapper):
+        pass
+
+    def get_spikes(
+            self, placements, graph_mapper, buffer_manager, machine_time_step):
+        return self._spikes
+
+    def get_spikes_sampling_interval(self):
+        return 1.0
+
+
+def test_population_write_spikes(tmpdir):
+    simulator = MockSimulator.setup()
+    simulator.machine_time_step = 1000
+    simulator.has_ran = True
+    simulator.use_virtual_board = False
+    simulator.placements = _MockPlacements()
+    slices = {"a": Slice(2, 3), "b": Slice(0, 1)}
+    simulator.graph_mapper = _MockGraphMapper(slices)
+    simulator.buffer_manager = _MockBufferManager({
+        "a": _spike_record(2, {0: [1], 2: [0, 1]}),
+        "b": _spike_record(2, {1: [0]})})
+    population = MockPopulation(4, "test")
+    population._vertex = AbstractPopulationVertex(
+        4, "test", None, 255, None, None, None, NeuronImplStandard(
+            "LIF", "lif.aplx",
+            NeuronModelLeakyIntegrateAndFire(
+                v_init=-65.0, v_rest=-65.0, tau_m=20.0, cm=1.0,
+                i_offset=0.0, v_reset=-65.0, tau_refrac=0.1),
+            InputTypeCurrent(),
+            SynapseTypeExponential(
+                tau_syn_E=5.0, tau_syn_I=5.0, isyn_exc=0.0, isyn_inh=0.0),
+            ThresholdTypeStatic(v_thresh=-50.0)), None)
+    population._vertex.set_recording_spikes()
+    recording = RecordingCommon(population)
+    expected = recording._get_spikes()
+    assert numpy.array_equal(
+        expected, [[0, 1], [2, 2], [3, 0], [3, 2]])
+
+    # The population vertex streams its spikes one core at a time
+    chunks = list(population._vertex.iter_spikes(
+        simulator.placements, simulator.graph_mapper,
+        simulator.buffer_manager, 1000))
+    assert len(chunks) == 2
+    filename = str(tmpdir.join("spikes"))
+    assert recording._write_spikes(filename) == len(expected)
+    ids, times = read_spikes_file(filename)
+    written = numpy.column_stack((ids, times))
+    assert numpy.array_equal(written[numpy.lexsort((times, ids))], expected)
+
+    # Other spike recordables write what get_spikes gives
+    population._vertex = _SpikeRecordable(expected)
+    filename = str(tmpdir.join("all_spikes"))
+    assert recording._write_spikes(filename) == len(expected)
+    ids, times = read_spikes_file(filename)
+    assert numpy.array_equal(numpy.column_stack((ids, times)), expected)
+
+    # Nothing is written when the simulation has not really run
+    simulator.use_virtual_board = True
+    filename = str(tmpdir.join("no_spikes"))
+    assert recording._write_spikes(filename) == 0
+    ids, times = read_spikes_file(filename)
+    assert len(ids) == 0 and len(times) == 0
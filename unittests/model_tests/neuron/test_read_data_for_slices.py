@@ -0,0 +1,68 @@
+from pacman.executor.injection_decorator import injection_context
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.neuron.implementations import NeuronImplStandard
+from spynnaker.pyNN.models.neuron.input_types import InputTypeCurrent
+from spynnaker.pyNN.models.neuron.neuron_models import (
+    NeuronModelLeakyIntegrateAndFire)
+from spynnaker.pyNN.models.neuron.synapse_types import SynapseTypeExponential
+from spynnaker.pyNN.models.neuron.threshold_types import ThresholdTypeStatic
+from spynnaker.pyNN.utilities.ranged import SpynnakerRangeDictionary
+from unittests.mocks import MockSimulator
+
+N_ATOMS = 10
+SLICES = [Slice(0, 3), Slice(4, 8), Slice(9, 9)]
+
+
+def _neuron_impl():
+    return NeuronImplStandard(
+        "LIF", "lif.aplx",
+        NeuronModelLeakyIntegrateAndFire(
+            v_init=-65.0, v_rest=-65.0, tau_m=20.0, cm=1.0, i_offset=0.0,
+            v_reset=-65.0, tau_refrac=0.1),
+        InputTypeCurrent(),
+        SynapseTypeExponential(
+            tau_syn_E=5.0, tau_syn_I=5.0, isyn_exc=0.0, isyn_inh=0.0),
+        ThresholdTypeStatic(v_thresh=-50.0))
+
+
+def _holders(neuron_impl):
+    parameters = SpynnakerRangeDictionary(N_ATOMS)
+    state_variables = SpynnakerRangeDictionary(N_ATOMS)
+    neuron_impl.add_parameters(parameters)
+    neuron_impl.add_state_variables(state_variables)
+    return parameters, state_variables
+
+
+def test_read_data_for_slices():
+    MockSimulator.setup()
+    neuron_impl = _neuron_impl()
+    parameters, state_variables = _holders(neuron_impl)
+    state_variables["v"] = [-60.0] * 3 + [-55.0] * 5 + [-70.0] * 2
+    state_variables["isyn_exc"] = 1.5
+    with injection_context({"MachineTimeStep": 1000}):
+        slice_data = [
+            (bytearray(neuron_impl.get_data(
+                parameters, state_variables, vertex_slice).tobytes()), 0,
+             vertex_slice)
+            for vertex_slice in SLICES]
+
+    # Read each slice on its own
+    parameters, slice_state_variables = _holders(neuron_impl)
+    for data, offset, vertex_slice in slice_data:
+        neuron_impl.read_data(
+            data, offset, vertex_slice, parameters, slice_state_variables)
+
+    # Read all the slices at once, in a different order
+    parameters, all_state_variables = _holders(neuron_impl)
+    neuron_impl.read_data_for_slices(
+        list(reversed(slice_data)), parameters, all_state_variables)
+
+    for key in ["v", "isyn_exc", "isyn_inh", "count_refrac"]:
+        assert (list(slice_state_variables[key]) ==
+                list(all_state_variables[key]) ==
+                list(state_variables[key])), key
+    assert all_state_variables["v"].range_based()
+    assert list(all_state_variables["v"].iter_ranges()) == [
+        (0, 3, -60.0), (3, 8, -55.0), (8, 10, -70.0)]
+    assert list(all_state_variables["isyn_exc"].iter_ranges()) == [
+        (0, 10, 1.5)]
@@ -0,0 +1,202 @@
+import binascii
+import numpy
+import pytest
+from data_specification.enums import DataType
+from pacman.executor.injection_decorator import injection_context
+from pacman.model.graphs.common import Slice
+from spinn_utilities.ranged import RangedList
+from spynnaker.pyNN.models.neuron.additional_inputs import (
+    AdditionalInputCa2Adaptive)
+from spynnaker.pyNN.models.neuron.implementations import (
+    NeuronImplStandard, Struct)
+from spynnaker.pyNN.models.neuron.input_types import (
+    InputTypeConductance, InputTypeCurrent)
+from spynnaker.pyNN.models.neuron.neuron_models import (
+    AbstractNeuronModel, NeuronModelIzh, NeuronModelLeakyIntegrateAndFire)
+from spynnaker.pyNN.models.neuron.synapse_types import SynapseTypeExponential
+from spynnaker.pyNN.models.neuron.threshold_types import (
+    ThresholdTypeMaassStochastic, ThresholdTypeStatic)
+from spynnaker.pyNN.utilities.ranged import SpynnakerRangeDictionary
+from unittests.mocks import MockSimulator
+
+
+def test_numpy_dtype_cached():
+    struct = Struct([DataType.S1615, DataType.UINT8, DataType.UINT16])
+    assert struct.numpy_dtype is struct.numpy_dtype
+    assert struct.get_size_in_whole_words(3) == 6
+
+
+def test_write_data():
+    MockSimulator.setup()
+    struct = Struct([DataType.S1615, DataType.UINT8, DataType.U032])
+    values = [
+        RangedList(10, 1.5),
+        list(range(10)),
+        0.25]
+    values[0][3:7] = 2.75
+
+    # The bytes made by concatenating and padding each struct separately
+    expected = binascii.unhexlify(
+        "00c0000002000000000000400060010003000000000000400060"
+        "0100040000000000004000600100050000000000004000600100"
+        "0600000000000040")
+    assert struct.get_data(values, 2, 5).tobytes() == expected
+
+    data = numpy.zeros(len(expected) // 4 + 3, dtype="uint32")
+    end_offset = struct.write_data(data, 8, values, 2, 5)
+    assert end_offset == 8 + len(expected)
+    assert data[2:-1].tobytes() == expected
+    assert not data[:2].any()
+    assert not data[-1]
+
+
+def test_write_data_empty():
+    struct = Struct([])
+    data = numpy.zeros(1, dtype="uint32")
+    assert struct.write_data(data, 4, [], 0, 10) == 4
+    assert len(struct.get_data([], 0, 10)) == 0
+
+
+class _OddSizedNeuronModel(AbstractNeuronModel):
+    """ A neuron model with structs that are not a whole number of words
+    """
+
+    def __init__(self):
+        super(_OddSizedNeuronModel, self).__init__(
+            [DataType.UINT8, DataType.UINT16, DataType.UINT8],
+            [DataType.UINT8, DataType.UINT8, DataType.UINT8])
+
+    def get_n_cpu_cycles(self, n_neurons):
+        return n_neurons
+
+    def add_parameters(self, parameters):
+        parameters["a"] = 7
+        parameters["b"] = 1000
+
+    def add_state_variables(self, state_variables):
+        state_variables["c"] = 3
+
+    def get_units(self, variable):
+        return ""
+
+    def has_variable(self, variable):
+        return variable in ("a", "b", "c")
+
+    def get_global_values(self):
+        return [1, 2, 3]
+
+    def get_values(self, parameters, state_variables, vertex_slice):
+        return [parameters["a"], parameters["b"], state_variables["c"]]
+
+    def update_values(self, values, parameters, state_variables):
+        pass
+
+
+_MODELS = {
+    "lif": lambda: NeuronImplStandard(
+        "LIF", "lif.aplx",
+        NeuronModelLeakyIntegrateAndFire(
+            v_init=-65.0, v_rest=-65.0, tau_m=20.0, cm=1.0, i_offset=0.5,
+            v_reset=-70.0, tau_refrac=0.1),
+        InputTypeCurrent(),
+        SynapseTypeExponential(
+            tau_syn_E=5.0, tau_syn_I=5.0, isyn_exc=0.0, isyn_inh=0.0),
+        ThresholdTypeStatic(v_thresh=-50.0)),
+    "izh": lambda: NeuronImplStandard(
+        "Izh", "izh.aplx",
+        NeuronModelIzh(
+            a=0.02, b=0.2, c=-65.0, d=2.0, v_init=-70.0, u_init=-14.0,
+            i_offset=0.0),
+        InputTypeConductance(e_rev_E=0.0, e_rev_I=-70.0),
+        SynapseTypeExponential(
+            tau_syn_E=5.0, tau_syn_I=5.0, isyn_exc=0.0, isyn_inh=0.0),
+        ThresholdTypeMaassStochastic(
+            du_th=0.5, tau_th=20.0, v_thresh=-50.0),
+        AdditionalInputCa2Adaptive(tau_ca2=50.0, i_ca2=0.0, i_alpha=0.1)),
+    "odd": lambda: NeuronImplStandard(
+        "Odd", "odd.aplx", _OddSizedNeuronModel(), InputTypeCurrent(),
+        SynapseTypeExponential(
+            tau_syn_E=5.0, tau_syn_I=5.0, isyn_exc=0.0, isyn_inh=0.0),
+        ThresholdTypeStatic(v_thresh=-50.0))}
+
+
+_MODELS = {
+    "lif": lambda: NeuronImplStandard(
+        "LIF", "lif.aplx",
+        NeuronModelLeakyIntegrateAndFire(
+            v_init=-65.0, v_rest=-65.0, tau_m=20.0, cm=1.0, i_offset=0.5,
+            v_reset=-70.0, tau_refrac=0.1),
+        InputTypeCurrent(),
+        SynapseTypeExponential(
+            tau_syn_E=5.0, tau_syn_I=5.0, isyn_exc=0.0, isyn_inh=0.0),
+        ThresholdTypeStatic(v_thresh=-50.0)),
+    "izh": lambda: NeuronImplStandard(
+        "Izh", "izh.aplx",
+        NeuronModelIzh(
+            a=0.02, b=0.2, c=-65.0, d=2.0, v_init=-70.0, u_init=-14.0,
+            i_offset=0.0),
+        InputTypeConductance(e_rev_E=0.0, e_rev_I=-70.0),
+        SynapseTypeExponential(
+            tau_syn_E=5.0, tau_syn_I=5.0, isyn_exc=0.0, isyn_inh=0.0),
+        ThresholdTypeMaassStochastic(
+            du_th=0.5, tau_th=20.0, v_thresh=-50.0),
+        AdditionalInputCa2Adaptive(tau_ca2=50.0, i_ca2=0.0, i_alpha=0.1)),
+    "odd": lambda: NeuronImplStandard(
+        "Odd", "odd.aplx", _OddSizedNeuronModel(), InputTypeCurrent(),
+        SynapseTypeExponential(
+            tau_syn_E=5.0, tau_syn_I=5.0, isyn_exc=0.0, isyn_inh=0.0),
+        ThresholdTypeStatic(v_thresh=-50.0))}
+
+
+# The bytes made by concatenating and padding the data of each component
+# separately, as get_data did before the components wrote into one buffer
+@pytest.mark.parametrize("model, vertex_slice, expected", [
+    ("lif", Slice(1, 3),
+     "000001000080dfff00000a00c279000000400000000000000000ddff"
+     "01000000008001000080dfff00000a00c27900000040000000000000"
+     "0000ddff01000000000002000080dfff00000a00c279000000400000"
+     "000000000000ddff010000000000e7ff0000e7ff0000e7ffb15698d1"
+     "8d4e06e800000000b15698d18d4e06e800000000b15698d18d4e06e8"
+     "00000000b15698d18d4e06e800000000b15698d18d4e06e800000000"
+     "b15698d18d4e06e800000000"),
+    ("lif", Slice(0, 0),
+     "008000000080dfff00000a00c279000000400000000000000000ddff"
+     "010000000000e7ffb15698d18d4e06e800000000b15698d18d4e06e8"
+     "00000000"),
+    ("izh", Slice(1, 3),
+     "008000008f0200009a1900000080dfff00000100000001000000f9ff"
+     "00000000008000008f0200009a1900000080dfff0000010000800100"
+     "0000f9ff00000000008000008f0200009a1900000080dfff00000100"
+     "000002000000f9ff0000000000800000000000000000ddff00000000"
+     "0000ddff000000000000ddff00000100660600000000e7ff33f3ffff"
+     "00000100660600000000e7ff33f3ffff00000100660600000000e7ff"
+     "33f3ffffb15698d18d4e06e800000000b15698d18d4e06e800000000"
+     "b15698d18d4e06e800000000b15698d18d4e06e800000000b15698d1"
+     "8d4e06e800000000b15698d18d4e06e800000000777d000000000000"
+     "cd0c0000777d000000000000cd0c0000777d000000000000cd0c0000"),
+    ("izh", Slice(0, 0),
+     "008000008f0200009a1900000080dfff00000100008000000000f9ff"
+     "0000000000800000000000000000ddff00000100660600000000e7ff"
+     "33f3ffffb15698d18d4e06e800000000b15698d18d4e06e800000000"
+     "777d000000000000cd0c0000"),
+    ("odd", Slice(1, 3),
+     "010203000700e80302000700e80303000700e803040000000000e7ff"
+     "0000e7ff0000e7ffb15698d18d4e06e800000000b15698d18d4e06e8"
+     "00000000b15698d18d4e06e800000000b15698d18d4e06e800000000"
+     "b15698d18d4e06e800000000b15698d18d4e06e800000000"),
+    ("odd", Slice(0, 0),
+     "010203000700e803010000000000e7ffb15698d18d4e06e800000000"
+     "b15698d18d4e06e800000000")])
+def test_neuron_impl_get_data(model, vertex_slice, expected):
+    MockSimulator.setup()
+    neuron_impl = _MODELS[model]()
+    parameters = SpynnakerRangeDictionary(4)
+    state_variables = SpynnakerRangeDictionary(4)
+    neuron_impl.add_parameters(parameters)
+    neuron_impl.add_state_variables(state_variables)
+    state_variables["c" if model == "odd" else "v"] = [1, 2, 3, 4]
+    with injection_context({"MachineTimeStep": 1000}):
+        data = neuron_impl.get_data(
+            parameters, state_variables, vertex_slice)
+    assert data.dtype == "uint32"
+    assert binascii.hexlify(data.tobytes()).decode() == expected
@@ -0,0 +1,76 @@
+import numpy
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector)
+from spynnaker.pyNN.models.neuron.synapse_dynamics.\
+    structural_connection_store import StructuralConnectionStore
+
+
+class _Edge(object):
+    def __init__(self, post_vertex=None):
+        self.post_vertex = post_vertex
+
+
+def _connections(sources, targets):
+    connections = numpy.zeros(
+        len(sources), dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+    connections["source"] = sources
+    connections["target"] = targets
+    connections["weight"] = 1.0
+    return connections
+
+
+def _as_lists(store, post_vertex, post_slice):
+    return [(app_edge, machine_edge, sources.tolist(), targets.tolist())
+            for app_edge, machine_edge, sources, targets in
+            store.get_connections(post_vertex, post_slice)]
+
+
+def test_add_and_release():
+    store = StructuralConnectionStore()
+    post_vertex = object()
+    other_vertex = object()
+    post_slice = Slice(0, 9)
+    other_slice = Slice(10, 19)
+    app_edge = _Edge(post_vertex)
+    other_app_edge = _Edge(other_vertex)
+    edge_1 = _Edge()
+    edge_2 = _Edge()
+
+    store.add(_connections([1, 2], [3, 4]), post_slice, app_edge, edge_1)
+    store.add(_connections([5], [6]), post_slice, app_edge, edge_2)
+    store.add(_connections([7], [8]), post_slice, app_edge, edge_1)
+    store.add(_connections([], []), post_slice, app_edge, _Edge())
+    store.add(_connections([9], [15]), other_slice, app_edge, edge_1)
+    store.add(_connections([0], [0]), post_slice, other_app_edge, edge_1)
+
+    # Only the source and target are held, as 32-bit values
+    assert store.n_bytes == 6 * 8
+    assert _as_lists(store, post_vertex, post_slice) == [
+        (app_edge, edge_1, [1, 2, 7], [3, 4, 8]),
+        (app_edge, edge_2, [5], [6])]
+    assert _as_lists(store, post_vertex, other_slice) == [
+        (app_edge, edge_1, [9], [15])]
+
+    store.release(post_vertex, post_slice)
+    assert _as_lists(store, post_vertex, post_slice) == []
+    assert _as_lists(store, other_vertex, post_slice) == [
+        (other_app_edge, edge_1, [0], [0])]
+    assert store.n_bytes == 2 * 8
+    assert store.max_n_bytes == 6 * 8
+
+    # Releasing a slice that is not held does nothing
+    store.release(post_vertex, post_slice)
+    assert store.n_bytes == 2 * 8
+
+    # Connections can be stored again once released
+    store.add(_connections([1], [2]), post_slice, app_edge, edge_1)
+    assert _as_lists(store, post_vertex, post_slice) == [
+        (app_edge, edge_1, [1], [2])]
+
+    items = {tuple(item.names): item.value
+             for item in store.get_provenance_data("pop")}
+    assert items == {
+        ("pop_structural_connection_store", "Bytes_held"): 3 * 8,
+        ("pop_structural_connection_store", "Max_bytes_held"): 6 * 8,
+        ("pop_structural_connection_store", "Slices_released"): 1}
@@ -0,0 +1,184 @@
+from collections import OrderedDict
+import numpy
+from pacman.model.graphs.common import Slice
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector)
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    SynapseDynamicsStatic)
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    synapse_dynamics_structural_common)
+from spynnaker.pyNN.models.neuron.synapse_dynamics.\
+    synapse_dynamics_structural_common import (
+        SynapseDynamicsStructuralCommon)
+
+
+def test_convert_per_connection_data_to_rows():
+    dynamics = SynapseDynamicsStatic()
+    connection_row_indices = numpy.array([2, 0, 2, 3, 0, 2], dtype="uint32")
+    data = numpy.arange(12, dtype="uint8").reshape((-1, 2))
+    rows = dynamics.convert_per_connection_data_to_rows(
+        connection_row_indices, 5, data)
+    assert len(rows) == 5
+    for i, row in enumerate(rows):
+        assert numpy.array_equal(
+            row, data[connection_row_indices == i].reshape(-1))
+    assert dynamics.get_n_items(rows, 4).tolist() == [
+        [1], [0], [2], [1], [0]]
+
+    assert dynamics.convert_per_connection_data_to_rows(
+        numpy.zeros(0, dtype="uint32"), 0, data[:0]) == []
+    empty_rows = dynamics.convert_per_connection_data_to_rows(
+        numpy.zeros(0, dtype="uint32"), 3, data[:0])
+    assert [row.size for row in empty_rows] == [0, 0, 0]
+
+
+class _Vertex(object):
+    pass
+
+
+class _Edge(object):
+    def __init__(self, pre_vertex, post_vertex):
+        self.pre_vertex = pre_vertex
+        self.post_vertex = post_vertex
+
+
+class _GraphMapper(object):
+    def __init__(self, slices):
+        self._slices = slices
+
+    def get_slice(self, vertex):
+        return self._slices[vertex]
+
+
+class _Spec(object):
+    def __init__(self):
+        self.arrays = list()
+
+    def write_array(self, array, data_type=None):
+        self.arrays.append(numpy.array(array))
+
+
+def _connections(sources, targets):
+    connections = numpy.zeros(
+        len(sources), dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+    connections["source"] = sources
+    connections["target"] = targets
+    return connections
+
+
+def test_write_post_to_pre_table():
+    dynamics = SynapseDynamicsStructuralCommon(s_max=2, grid=[2, 2])
+    post_vertex = _Vertex()
+    post_slice = Slice(10, 12)
+    pre_a = _Vertex()
+    pre_b = _Vertex()
+    a_0 = _Vertex()
+    a_1 = _Vertex()
+    b_0 = _Vertex()
+    slices = {a_0: Slice(0, 4), a_1: Slice(5, 9), b_0: Slice(0, 2)}
+
+    # (key, n_atoms, lo_atom, mask), not in lo_atom order
+    population_info = OrderedDict([
+        (pre_a, [(2, 5, 5, 0), (1, 5, 0, 0)]),
+        (pre_b, [(3, 3, 0, 0)])])
+    dynamics.synaptic_data_update(
+        _connections([7, 5], [10, 11]), post_slice,
+        _Edge(pre_a, post_vertex), _Edge(a_1, None))
+    dynamics.synaptic_data_update(
+        _connections([2, 1, 0], [11, 11, 11]), post_slice,
+        _Edge(pre_b, post_vertex), _Edge(b_0, None))
+    dynamics.synaptic_data_update(
+        _connections([3], [12]), post_slice,
+        _Edge(pre_a, _Vertex()), _Edge(a_0, None))
+
+    spec = _Spec()
+    dynamics._SynapseDynamicsStructuralCommon__write_post_to_pre_table(
+        spec, post_vertex, post_slice, _Vertex(), _GraphMapper(slices),
+        population_info, 0)
+
+    def identifier(pop, subpop, neuron):
+        return (pop << 24) | (subpop << 16) | neuron
+
+    # Neuron 11 has more synapses than slots, so the last one overwrites
+    # the first slot
+    assert spec.arrays[0].tolist() == [
+        identifier(0, 1, 2), -1,
+        identifier(1, 0, 0), identifier(1, 0, 2),
+        -1, -1]
+
+    # Only the connections of the slice written are released
+    assert list(dynamics._connection_store.get_connections(
+        post_vertex, post_slice)) == []
+    assert dynamics._connection_store.n_bytes == 8
+
+
+def test_distance_broadcast():
+    dynamics = SynapseDynamicsStructuralCommon(grid=[2, 2])
+    grid = numpy.array([5, 4])
+    x0 = numpy.array([[0, 0], [4, 3], [2, 1]])
+    x1 = numpy.array([[0, 0], [1, 3], [4, 0], [3, 2]])
+    for metric in ["euclidian", "manhattan"]:
+        distances = dynamics.distance(
+            x0[:, numpy.newaxis], x1, grid=grid, type=metric)
+        assert distances.shape == (3, 4)
+        for i, pre in enumerate(x0):
+            for j, post in enumerate(x1):
+                assert distances[i, j] == dynamics.distance(
+                    pre, post, grid=grid, type=metric)
+    assert dynamics.distance((0, 0), (4, 1), grid=grid) == numpy.sqrt(2)
+    assert dynamics.distance(
+        (0, 0), (4, 3), grid=grid, type="manhattan") == 2
+
+
+def test_distance_probabilities_shared():
+    first = SynapseDynamicsStructuralCommon(
+        grid=[3, 3], sigma_form_forward=1.5, p_form_lateral=0.5)
+    second = SynapseDynamicsStructuralCommon(
+        grid=[3, 3], sigma_form_forward=1.5, p_form_lateral=0.5)
+    other = SynapseDynamicsStructuralCommon(
+        grid=[3, 3], sigma_form_forward=2.0, p_form_lateral=0.5)
+    assert (first._ff_distance_probabilities is
+            second._ff_distance_probabilities)
+    assert (first._lat_distance_probabilities is
+            other._lat_distance_probabilities)
+    assert (first._ff_distance_probabilities is not
+            other._ff_distance_probabilities)
+
+    # The largest distance on a 3x3 periodic grid is sqrt(2), which squares
+    # to just over 2, so the LUT holds the probabilities for squared
+    # distances 0 to 2, padded to an even length
+    expected = (0.16 * numpy.exp(-numpy.arange(3) / (2 * 1.5 ** 2)) *
+                (2 ** 16 - 1)).astype("uint16")
+    expected = numpy.append(expected, numpy.uint16(0))
+    assert numpy.array_equal(first._ff_distance_probabilities, expected)
+
+
+def test_distance_probabilities_limit():
+    luts = synapse_dynamics_structural_common._distance_probabilities
+    max_luts = synapse_dynamics_structural_common._MAX_DISTANCE_PROBABILITIES
+    luts.clear()
+    synapse_dynamics_structural_common._MAX_DISTANCE_PROBABILITIES = 2
+    try:
+        first = SynapseDynamicsStructuralCommon(
+            grid=[3, 3], sigma_form_forward=1.5, p_form_lateral=0.5)
+        other = SynapseDynamicsStructuralCommon(
+            grid=[3, 3], sigma_form_forward=2.0, p_form_lateral=0.5)
+
+        # The lateral LUT is used again, so the first forward LUT is the
+        # least recently used, and is forgotten
+        assert len(luts) == 2
+        assert list(luts) == [
+            ((3, 3), 0.16, 2.0), ((3, 3), 0.5, 1)]
+        again = SynapseDynamicsStructuralCommon(
+            grid=[3, 3], sigma_form_forward=1.5, p_form_lateral=0.5)
+        assert (again._ff_distance_probabilities is not
+                first._ff_distance_probabilities)
+        assert numpy.array_equal(
+            again._ff_distance_probabilities,
+            first._ff_distance_probabilities)
+        assert (again._lat_distance_probabilities is
+                other._lat_distance_probabilities)
+    finally:
+        synapse_dynamics_structural_common._MAX_DISTANCE_PROBABILITIES = \
+            max_luts
+        luts.clear()
@@ -1,7 +1,11 @@
+import numpy
 import pytest
+from pacman.model.graphs.common import Slice
 from spynnaker.pyNN.exceptions import SynapseRowTooBigException
 from spynnaker.pyNN.models.neural_projections import (
     ProjectionApplicationEdge, SynapseInformation)
+from spynnaker.pyNN.models.neural_projections.connectors import (
+    AbstractConnector)
 from spynnaker.pyNN.models.neuron.synapse_dynamics import (
     SynapseDynamicsStatic, SynapseDynamicsSTDP)
 from spynnaker.pyNN.models.neuron.master_pop_table_generators import (
@@ -46,3 +50,118 @@ def test_get_max_row_length(dynamics, size, exception, max_size):
         actual_size = io._get_max_row_length(
             size, dynamics, population_table, in_edge, size)
         assert actual_size == max_size
+
+
+def _reference_row_data(ff_data, ff_size, fp_data, pp_data, fp_size, pp_size,
+                        n_rows, max_row_length):
+    # Join the rows one by one, as the rows are laid out on the machine
+    blank = [numpy.zeros(0, dtype="uint32") for _ in range(n_rows)]
+    blank_size = [numpy.zeros(1, dtype="uint32") for _ in range(n_rows)]
+    ff_data = blank if ff_data is None else ff_data
+    ff_size = blank_size if ff_size is None else ff_size
+    fp_data = blank if fp_data is None else fp_data
+    pp_data = blank if pp_data is None else pp_data
+    fp_size = blank_size if fp_size is None else fp_size
+    pp_size = blank_size if pp_size is None else pp_size
+    rows = list()
+    for i in range(n_rows):
+        row = numpy.concatenate((
+            pp_size[i], pp_data[i], ff_size[i], fp_size[i], ff_data[i],
+            fp_data[i]))
+        rows.append(numpy.concatenate((row, numpy.zeros(
+            max_row_length + 3 - row.size, dtype="uint32"))))
+    return numpy.concatenate(rows)
+
+
+@pytest.mark.parametrize(
+    "dynamics",
+    [SynapseDynamicsStatic(),
+     SynapseDynamicsSTDP(
+         TimingDependenceSpikePair(), WeightDependenceAdditive())])
+def test_get_max_row_length_and_row_data(dynamics):
+    n_rows = 20
+    post_vertex_slice = Slice(0, 99)
+    rng = numpy.random.RandomState(1)
+    n_connections = 500
+    connections = numpy.zeros(
+        n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+    connections["source"] = numpy.sort(rng.randint(0, n_rows, n_connections))
+    connections["target"] = rng.randint(0, 100, n_connections)
+    connections["weight"] = rng.randint(0, 1000, n_connections)
+    connections["delay"] = rng.randint(1, 16, n_connections)
+    connections["synapse_type"] = rng.randint(0, 2, n_connections)
+
+    # Leave one row empty
+    connections = connections[connections["source"] != 3]
+
+    population_table = MasterPopTableAsBinarySearch()
+    max_row_length, row_data = \
+        SynapseIORowBased._get_max_row_length_and_row_data(
+            connections, connections["source"], n_rows, post_vertex_slice,
+            2, population_table, dynamics, None, None)
+
+    ff_data, ff_size = None, None
+    fp_data, pp_data, fp_size, pp_size = None, None, None, None
+    if isinstance(dynamics, SynapseDynamicsStatic):
+        ff_data, ff_size = dynamics.get_static_synaptic_data(
+            connections, connections["source"], n_rows, post_vertex_slice, 2)
+    else:
+        fp_data, pp_data, fp_size, pp_size = \
+            dynamics.get_plastic_synaptic_data(
+                connections, connections["source"], n_rows,
+                post_vertex_slice, 2)
+    expected = _reference_row_data(
+        ff_data, ff_size, fp_data, pp_data, fp_size, pp_size, n_rows,
+        max_row_length)
+    assert row_data.dtype == numpy.dtype("uint32")
+    assert numpy.array_equal(row_data, expected)
+
+
+class _MockConnector(object):
+
+    def __init__(self, connections):
+        self._connections = connections
+
+    def create_synaptic_block(self, *args):
+        return numpy.copy(self._connections)
+
+
+@pytest.mark.parametrize(
+    "dynamics",
+    [SynapseDynamicsStatic(),
+     SynapseDynamicsSTDP(
+         TimingDependenceSpikePair(), WeightDependenceAdditive())])
+def test_read_synapses_with_delays(dynamics):
+    pre_vertex_slice = Slice(10, 29)
+    post_vertex_slice = Slice(100, 149)
+    n_delay_stages = 2
+    rng = numpy.random.RandomState(2)
+    n_connections = 300
+    connections = numpy.zeros(
+        n_connections, dtype=AbstractConnector.NUMPY_SYNAPSES_DTYPE)
+    connections["source"] = rng.randint(10, 30, n_connections)
+    connections["target"] = rng.randint(100, 150, n_connections)
+    connections["weight"] = rng.randint(0, 1000, n_connections)
+    connections["delay"] = rng.randint(1, 49, n_connections)
+    connections["synapse_type"] = 1
+
+    io = SynapseIORowBased()
+    synapse_info = SynapseInformation(
+        _MockConnector(connections), dynamics, 1)
+    weight_scales = [1.0, 1.0]
+    (row_data, max_row_length, delayed_row_data, max_delayed_row_length,
+     _, _) = io.get_synapses(
+        synapse_info, None, 0, None, 0, pre_vertex_slice, post_vertex_slice,
+        n_delay_stages, MasterPopTableAsBinarySearch(), 2, weight_scales,
+        1000.0, None, None)
+    read_connections = io.read_synapses(
+        synapse_info, pre_vertex_slice, post_vertex_slice, max_row_length,
+        max_delayed_row_length, 2, weight_scales, row_data.tobytes(),
+        delayed_row_data.tobytes(), n_delay_stages, 1000.0)
+
+    assert len(read_connections) == n_connections
+    fields = ["source", "target", "delay", "weight"]
+    expected = numpy.sort(connections[fields], order=fields)
+    actual = numpy.sort(read_connections[fields], order=fields)
+    for field in fields:
+        assert numpy.array_equal(expected[field], actual[field])
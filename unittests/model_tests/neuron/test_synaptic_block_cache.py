@@ -0,0 +1,65 @@
+import numpy
+from spynnaker.pyNN.models.neuron.synaptic_block_cache import (
+    SynapticBlockCache)
+
+
+def test_unbounded_cache():
+    cache = SynapticBlockCache()
+    assert cache.get("a") is None
+    block = bytearray(100)
+    cache.add("a", block, 5)
+    cached_block, max_row_length = cache.get("a")
+    assert cached_block is block
+    assert max_row_length == 5
+    assert cache.n_hits == 1
+    assert cache.n_misses == 1
+    assert cache.n_bytes == 100
+    cache.clear()
+    assert cache.get("a") is None
+    assert cache.n_bytes == 0
+
+
+def test_least_recently_used_evicted():
+    cache = SynapticBlockCache(max_bytes=250)
+    cache.add("a", bytearray(100), 1)
+    cache.add("b", bytearray(100), 2)
+
+    # Use a so that b is the least recently used
+    assert cache.get("a") is not None
+    cache.add("c", bytearray(100), 3)
+    assert cache.n_evictions == 1
+    assert cache.n_bytes == 200
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+    # A block bigger than the limit is kept on its own
+    cache.add("d", bytearray(300), 4)
+    assert cache.n_bytes == 300
+    assert cache.get("d") is not None
+    assert cache.get("a") is None
+
+
+def test_evicted_blocks_spilled():
+    cache = SynapticBlockCache(max_bytes=100, spill=True)
+    block_a = bytearray(numpy.arange(100, dtype="uint8").tobytes())
+    block_b = bytearray(numpy.arange(100, 0, -1, dtype="uint8").tobytes())
+    cache.add("a", block_a, 1)
+    cache.add("b", block_b, 2)
+    assert cache.n_evictions == 1
+    assert cache.n_spills == 1
+
+    # a comes from the scratch file, b from memory
+    spilled_block, max_row_length = cache.get("a")
+    assert max_row_length == 1
+    assert bytearray(spilled_block) == block_a
+    assert numpy.array_equal(
+        numpy.frombuffer(spilled_block, dtype="<u4"),
+        numpy.frombuffer(block_a, dtype="<u4"))
+    assert bytearray(cache.get("b")[0]) == block_b
+
+    names = [item.names[-1] for item in cache.get_provenance_data("pop")]
+    assert "Hits" in names
+    assert "Evictions" in names
+    cache.clear()
+    assert cache.get("a") is None
@@ -2,6 +2,7 @@ import os
 import struct
 import tempfile
 import unittest
+import numpy
 import spinn_utilities.conf_loader as conf_loader
 from spinn_utilities.overrides import overrides
 from spinn_machine import SDRAM
@@ -16,6 +17,7 @@ from spinn_storage_handlers import FileDataWriter, FileDataReader
 from data_specification import (
     DataSpecificationGenerator, DataSpecificationExecutor)
 from spynnaker.pyNN.models.neuron import SynapticManager
+import spynnaker.pyNN.models.neuron.synaptic_manager as synaptic_manager_module
 import spynnaker.pyNN.models.neural_projections.connectors.\
     abstract_generate_connector_on_machine as \
     abstract_generate_connector_on_machine
@@ -45,13 +47,28 @@ class MockMasterPopulationTable(object):
             self, key, master_pop_table_address, transceiver, x, y):
         return self._key_to_entry_map[key]
 
+    def read_master_population_table(
+            self, master_pop_table_address, transceiver, x, y):
+        return MockMasterPopulationTableIndex(self._key_to_entry_map)
+
+
+class MockMasterPopulationTableIndex(object):
+
+    def __init__(self, key_to_entry_map):
+        self._key_to_entry_map = key_to_entry_map
+
+    def extract_synaptic_matrix_data_location(self, key):
+        return self._key_to_entry_map[key]
+
 
 class MockTransceiverRawData(object):
 
     def __init__(self, data_to_read):
         self._data_to_read = data_to_read
+        self.n_reads = 0
 
     def read_memory(self, x, y, base_address, length):
+        self.n_reads += 1
         return self._data_to_read[base_address:base_address + length]
 
 
@@ -305,6 +322,13 @@ class TestSynapticManager(unittest.TestCase):
         assert not items[1][2]
         assert not items[2][2]
 
+        # Reading the whole table should give the same entries for the key
+        # and no entries for keys not in the table
+        index = synaptic_manager._poptable_type.read_master_population_table(
+            master_pop_table_address, transceiver, placement.x, placement.y)
+        assert index.extract_synaptic_matrix_data_location(key) == items
+        assert index.extract_synaptic_matrix_data_location(0x10000) == []
+
         data_1, row_len_1 = synaptic_manager._retrieve_synaptic_block(
             transceiver=transceiver, placement=placement,
             master_pop_table_address=master_pop_table_address,
@@ -360,12 +384,86 @@ class TestSynapticManager(unittest.TestCase):
         # The third matrix is an all-to-all matrix, so length is n_atoms
         assert row_len_3 == post_vertex_slice.n_atoms
 
+        # The master population table should only be read for the first block
+        # read; after that, only the blocks themselves should be read
+        n_reads = transceiver.n_reads
+        synaptic_manager.clear_connection_cache()
+        for synapse_index in range(3):
+            synaptic_manager._retrieve_synaptic_block(
+                transceiver=transceiver, placement=placement,
+                master_pop_table_address=master_pop_table_address,
+                indirect_synapses_address=indirect_synapses_address,
+                direct_synapses_address=direct_synapses_address, key=key,
+                n_rows=pre_vertex_slice.n_atoms, index=synapse_index,
+                using_extra_monitor_cores=False)
+        assert transceiver.n_reads - n_reads == 2 + 3
+
         # Check that all the connections have the right weight and delay
         assert len(connections_3) == \
             post_vertex_slice.n_atoms * pre_vertex_slice.n_atoms
         assert all([conn["weight"] == 4.5 for conn in connections_3])
         assert all([conn["delay"] == 4.0 for conn in connections_3])
 
+    def test_ring_buffer_expected_upper_bound(self):
+        weight_means = [0.5, 1.0, 2.0, 1.0]
+        weight_std_devs = [0.0, 0.1, 0.5, 2.0]
+        rates = [10.0, 30.0, 100.0, 5.0]
+        n_synapses = [1, 50, 200, 1000]
+
+        bounds = SynapticManager._ring_buffer_expected_upper_bound(
+            numpy.array(weight_means), numpy.array(weight_std_devs),
+            numpy.array(rates), 1000, numpy.array(n_synapses), 5.0)
+        for i, bound in enumerate(bounds):
+            single_bound = SynapticManager._ring_buffer_expected_upper_bound(
+                weight_means[i], weight_std_devs[i], rates[i], 1000,
+                n_synapses[i], 5.0)
+            self.assertAlmostEqual(bound, float(single_bound))
+            self.assertGreater(
+                bound, weight_means[i] * n_synapses[i] * rates[i] / 1000.0)
+
+    def test_poisson_spikes_per_tick_cache_limit(self):
+        rates = [10.0, 20.0, 30.0, 40.0, 50.0]
+        n_atoms = [100] * len(rates)
+        expected = SynapticManager._get_poisson_spikes_per_tick(
+            rates, n_atoms, 1000.0)
+
+        cache = synaptic_manager_module._poisson_spikes_per_tick
+        max_values = synaptic_manager_module._MAX_POISSON_SPIKES_PER_TICK
+        cache.clear()
+        synaptic_manager_module._MAX_POISSON_SPIKES_PER_TICK = 3
+        try:
+            # Only the last values used are kept, but all are returned
+            self.assertEqual(SynapticManager._get_poisson_spikes_per_tick(
+                rates, n_atoms, 1000.0), expected)
+            self.assertEqual(len(cache), 3)
+            self.assertEqual(SynapticManager._get_poisson_spikes_per_tick(
+                rates[:2], n_atoms[:2], 1000.0), expected[:2])
+            self.assertEqual(
+                sorted(rate for rate, _, _ in cache), [10.0, 20.0, 50.0])
+        finally:
+            synaptic_manager_module._MAX_POISSON_SPIKES_PER_TICK = max_values
+            cache.clear()
+
+    def test_synaptic_block_cache_limit(self):
+        default_config_paths = os.path.join(
+            os.path.dirname(abstract_spinnaker_common.__file__),
+            AbstractSpiNNakerCommon.CONFIG_FILE_NAME)
+        config = conf_loader.load_config(
+            AbstractSpiNNakerCommon.CONFIG_FILE_NAME, default_config_paths)
+
+        # The cache is limited by default
+        synaptic_manager = SynapticManager(
+            n_synapse_types=2, ring_buffer_sigma=5.0, spikes_per_second=100.0,
+            config=config)
+        self.assertIsNotNone(synaptic_manager._retrieved_blocks._max_bytes)
+
+        # None turns off the limit
+        config.set("Simulation", "max_synaptic_block_cache_bytes", "None")
+        synaptic_manager = SynapticManager(
+            n_synapse_types=2, ring_buffer_sigma=5.0, spikes_per_second=100.0,
+            config=config)
+        self.assertIsNone(synaptic_manager._retrieved_blocks._max_bytes)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,65 @@
+import numpy
+from pacman.model.graphs.common import Slice
+from unittests.mocks import MockSimulator
+# Import the neuron models first to avoid a circular import
+import spynnaker.pyNN.models.neuron  # noqa: F401
+from spynnaker.pyNN.models.spike_source.send_buffer_ticks import (
+    SendBufferTicks)
+from spynnaker.pyNN.models.spike_source.spike_source_array_vertex import (
+    SpikeSourceArrayVertex)
+
+
+def _as_lists(ticks):
+    return [list(neuron_ticks) for neuron_ticks in ticks]
+
+
+def test_from_neuron_ticks():
+    ticks = SendBufferTicks.from_neuron_ticks([5, 1, 3, 7, 2, 2], [3, 0, 3])
+    assert len(ticks) == 3
+    assert _as_lists(ticks) == [[1, 3, 5], [], [2, 2, 7]]
+    assert list(ticks[-1]) == [2, 2, 7]
+    assert _as_lists(ticks[1:]) == [[], [2, 2, 7]]
+    assert _as_lists(ticks[::2]) == [[1, 3, 5], [2, 2, 7]]
+    assert len(ticks[2:1]) == 0
+    assert list(numpy.concatenate(ticks[1:3])) == [2, 2, 7]
+
+    # Slices share the ticks they are taken from
+    assert ticks[1:][1].base is ticks[0].base
+
+
+def test_update():
+    ticks = SendBufferTicks.from_neuron_ticks(
+        [1, 2, 3, 4, 5, 6], [2, 2, 2])
+    view = ticks[1:]
+
+    # The same number of ticks updates slices taken before
+    ticks.update({1: [9, 8]})
+    assert _as_lists(ticks) == [[1, 2], [8, 9], [5, 6]]
+    assert _as_lists(view) == [[8, 9], [5, 6]]
+
+    ticks.update({0: [], 2: [7, 3, 4]})
+    assert _as_lists(ticks) == [[], [8, 9], [3, 4, 7]]
+    assert _as_lists(ticks[1:]) == [[8, 9], [3, 4, 7]]
+
+
+def test_spike_source_array_vertex():
+    MockSimulator.setup().machine_time_step = 1000
+    spike_times = [[3.0, 1.0], [], [2.5], [0.4, 5.0, 6.0]]
+    vertex = SpikeSourceArrayVertex(4, spike_times, None, "test", 100, None)
+    assert isinstance(vertex.send_buffer_times, SendBufferTicks)
+    assert _as_lists(vertex.send_buffer_times) == [
+        [1, 3], [], [3], [1, 5, 6]]
+    machine_vertex = vertex.create_machine_vertex(Slice(2, 3), None)
+    assert _as_lists(machine_vertex.send_buffer_times) == [[3], [1, 5, 6]]
+
+    # Changing some of the neurons changes only those neurons
+    vertex.set_value_by_selector([1, 3], "spike_times", [[2.0], [4.0]])
+    assert _as_lists(vertex.send_buffer_times) == [
+        [1, 3], [2], [3], [4]]
+    assert _as_lists(machine_vertex.send_buffer_times) == [[3], [4]]
+    assert list(vertex.get_value("spike_times")) == [
+        [3.0, 1.0], [2.0], [2.5], [4.0]]
+
+    # Changing all the neurons replaces the ticks
+    vertex.set_value("spike_times", [[1.0], [2.0], [3.0], [4.0]])
+    assert _as_lists(machine_vertex.send_buffer_times) == [[3], [4]]
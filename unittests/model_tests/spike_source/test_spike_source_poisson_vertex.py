@@ -0,0 +1,225 @@
+import struct
+import numpy
+import scipy.stats
+from data_specification.constants import APP_PTR_TABLE_HEADER_BYTE_SIZE
+from pacman.model.graphs.common import Slice
+# The neuron models must be imported before the Poisson source, as they
+# refer to it
+import spynnaker.pyNN.models.neuron  # noqa: F401
+from spynnaker.pyNN.models.spike_source.spike_source_poisson_vertex import (
+    SpikeSourcePoissonVertex, START_OF_POISSON_GENERATOR_PARAMETERS,
+    PARAMS_WORDS_PER_NEURON, _REGIONS)
+from unittests.mocks import MockSimulator
+
+_MACHINE_TIME_STEP = 1000
+_REGION_ADDRESS = 0x100
+_SOURCE_BYTES = PARAMS_WORDS_PER_NEURON * 4
+
+
+class _CPUInfo(object):
+    user = [0]
+
+
+class _MockTransceiver(object):
+    def __init__(self, size):
+        self.memory = bytearray(size)
+        self.n_writes = 0
+        struct.pack_into(
+            "<I", self.memory, APP_PTR_TABLE_HEADER_BYTE_SIZE +
+            _REGIONS.POISSON_PARAMS_REGION.value * 4, _REGION_ADDRESS)
+
+    def get_cpu_information_from_core(self, x, y, p):
+        return _CPUInfo()
+
+    def read_memory(self, x, y, address, length):
+        return bytearray(self.memory[address:address + length])
+
+    def write_memory(self, x, y, address, data):
+        self.memory[address:address + len(data)] = data
+        self.n_writes += 1
+
+
+class _MockSpec(object):
+    def __init__(self):
+        self.arrays = list()
+
+    def comment(self, comment):
+        pass
+
+    def switch_write_focus(self, region):
+        pass
+
+    def write_value(self, data, data_type):
+        pass
+
+    def write_array(self, array_values):
+        self.arrays.append(array_values)
+
+
+class _MockPlacement(object):
+    x = 0
+    y = 0
+    p = 1
+    vertex = None
+
+
+class _MockRoutingInfo(object):
+    def get_first_key_from_pre_vertex(self, vertex, partition_id):
+        return 0x10000
+
+
+class _MockGraph(object):
+    def get_edges_ending_at_vertex_with_partition_name(
+            self, vertex, partition_id):
+        return []
+
+
+def _vertex(n_neurons):
+    MockSimulator.setup()
+    vertex = SpikeSourcePoissonVertex(
+        n_neurons, None, "test", rate=numpy.linspace(1, 500, n_neurons),
+        max_rate=None, start=0, duration=None, seed=1,
+        max_atoms_per_core=n_neurons, model=None)
+    vertex._n_subvertices = 1
+    return vertex
+
+
+def _source_bytes(vertex, lo_atom, hi_atom):
+    return vertex._get_poisson_source_parameters(
+        Slice(lo_atom, hi_atom), _MACHINE_TIME_STEP).tobytes()
+
+
+def test_get_changed_ranges():
+    changed = numpy.array([1, 1, 0, 0, 1, 0, 1, 1, 1], dtype="bool")
+    assert SpikeSourcePoissonVertex._get_changed_ranges(changed) == [
+        (0, 1), (4, 4), (6, 8)]
+    assert SpikeSourcePoissonVertex._get_changed_ranges(
+        numpy.zeros(4, dtype="bool")) == []
+
+
+def test_mark_changed():
+    vertex = _vertex(6)
+    assert not vertex._changed_atoms.any()
+
+    rate = vertex.rate.copy()
+    rate[[1, 4]] = 7.0
+    vertex.rate = rate
+    duration = vertex.duration.copy()
+    duration[2] = 100.0
+    vertex.duration = duration
+    vertex.start = vertex.start.copy()
+    assert vertex._changed_atoms.tolist() == [
+        False, True, True, False, True, False]
+
+
+def test_update_changed_sources_on_machine():
+    n_neurons = 10
+    vertex = _vertex(n_neurons)
+    vertex_slice = Slice(0, n_neurons - 1)
+    sources_address = _REGION_ADDRESS + START_OF_POISSON_GENERATOR_PARAMETERS
+    transceiver = _MockTransceiver(sources_address + n_neurons * 24)
+
+    # Load the sources, with a time to the next spike on the machine
+    time_to_spike = numpy.arange(n_neurons) * (2 ** 15)
+    data = numpy.frombuffer(
+        _source_bytes(vertex, 0, n_neurons - 1), dtype="uint32").reshape(
+            n_neurons, PARAMS_WORDS_PER_NEURON).copy()
+    data[:, -1] = time_to_spike
+    transceiver.memory[sources_address:] = data.tobytes()
+    loaded = bytes(transceiver.memory)
+
+    rate = vertex.rate.copy()
+    rate[[3, 4]] = 0.5
+    vertex.rate = rate
+    start = vertex.start.copy()
+    start[7] = 20.0
+    vertex.start = start
+    vertex._update_poisson_parameters_on_machine(
+        transceiver, _MockGraph(), _MockPlacement(), _MockRoutingInfo(),
+        vertex_slice, _MACHINE_TIME_STEP, 1)
+
+    # One write of the shared parameters and one per range of changes
+    assert transceiver.n_writes == 3
+    assert not vertex._changed_atoms.any()
+    memory = bytes(transceiver.memory)
+
+    # Sources that haven't changed are left as they are on the machine
+    for atom in [0, 1, 2, 5, 6, 8, 9]:
+        address = sources_address + atom * _SOURCE_BYTES
+        assert (memory[address:address + _SOURCE_BYTES] ==
+                loaded[address:address + _SOURCE_BYTES])
+
+    # Changed sources are rewritten, keeping the time to the next spike
+    # unless the rate has changed
+    assert memory[sources_address + 3 * _SOURCE_BYTES:
+                  sources_address + 5 * _SOURCE_BYTES] == \
+        _source_bytes(vertex, 3, 4)
+    new_data = numpy.frombuffer(memory[sources_address:], dtype="uint32")
+    new_data = new_data.reshape(n_neurons, PARAMS_WORDS_PER_NEURON)
+    assert new_data[3, -1] == 0
+    assert new_data[7, -1] == time_to_spike[7]
+    assert new_data[7, 0] == 20
+
+
+def test_write_parameters_after_run_keeps_time_to_spike():
+    n_neurons = 6
+    vertex = _vertex(n_neurons)
+    vertex_slice = Slice(0, n_neurons - 1)
+    sources_address = _REGION_ADDRESS + START_OF_POISSON_GENERATOR_PARAMETERS
+    transceiver = _MockTransceiver(sources_address + n_neurons * 24)
+
+    # The sources have run, so the time to the next spike is on the machine
+    time_to_spike = (numpy.arange(n_neurons) + 1) * (2 ** 15)
+    data = numpy.frombuffer(
+        _source_bytes(vertex, 0, n_neurons - 1), dtype="uint32").reshape(
+            n_neurons, PARAMS_WORDS_PER_NEURON).copy()
+    data[:, -1] = time_to_spike
+    transceiver.memory[sources_address:] = data.tobytes()
+
+    # The slice is not live controlled, so nothing is read before a set
+    simulator = MockSimulator.setup()
+    simulator.has_ran = True
+    simulator.has_reset_last = False
+    simulator.use_virtual_board = False
+    simulator.transceiver = transceiver
+    vertex.read_parameters_from_machine(
+        transceiver, _MockPlacement(), vertex_slice)
+    rate = vertex.rate.copy()
+    rate[2] = 0.5
+    vertex.rate = rate
+
+    # Writing all the parameters again keeps the times from the machine,
+    # except for the source whose rate has changed
+    spec = _MockSpec()
+    vertex._write_poisson_parameters(
+        spec, _MockGraph(), _MockPlacement(), _MockRoutingInfo(),
+        vertex_slice, _MACHINE_TIME_STEP, 1)
+    written = spec.arrays[-1]
+    assert written[:, -1].tolist() == [
+        time_to_spike[0], time_to_spike[1], 0, time_to_spike[3],
+        time_to_spike[4], time_to_spike[5]]
+
+
+def test_rate_statistics():
+    vertex = _vertex(6)
+    vertex.rate = numpy.array([2.0, 50.0, 2.0, 50.0, 50.0, 200.0])
+    total_mean_rate, max_spikes = vertex._get_rate_statistics()
+    assert total_mean_rate == 354.0
+    assert max_spikes == numpy.sum(scipy.stats.poisson.ppf(
+        1.0 - (1.0 / vertex.rate), vertex.rate))
+    assert vertex._get_rate_statistics() is vertex._get_rate_statistics()
+
+    # Changing the rates computes the statistics again
+    vertex.rate = numpy.array([2.0, 50.0, 2.0, 50.0, 50.0, 100.0])
+    assert vertex._get_rate_statistics()[0] == 254.0
+
+
+def test_max_spikes_per_ts():
+    vertex = _vertex(4)
+    assert vertex._max_spikes_per_ts(1000) == 1
+    vertex._max_rate = 5000
+    assert vertex._max_spikes_per_ts(1000) == \
+        vertex._compute_max_spikes_per_ts(1000)
+    assert vertex._max_spikes_per_ts(1000) > 1
+    assert vertex._max_spikes_per_ts(100000) > \
+        vertex._max_spikes_per_ts(1000)
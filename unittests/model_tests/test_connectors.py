@@ -38,6 +38,8 @@ def n_in_slice(request):
         functools.partial(FixedNumberPostConnector, 20, with_replacement=True),
         functools.partial(FixedProbabilityConnector, 0.1),
         functools.partial(FixedProbabilityConnector, 0.5),
+        functools.partial(FixedProbabilityConnector, 0.02),
+        functools.partial(FixedProbabilityConnector, 0.5, sparse=True),
         functools.partial(IndexBasedProbabilityConnector,
                           "1 / sqrt(((i + 1) ** 2) + ((j + 1) ** 2))")],
     ids=[
@@ -51,6 +53,8 @@ def n_in_slice(request):
         "FixedNumberPostConnector20Replace-",
         "FixedProbabilityConnector0.1-",
         "FixedProbabilityConnector0.5-",
+        "FixedProbabilityConnector0.02-",
+        "FixedProbabilityConnector0.5Sparse-",
         "IndexBasedProbabilityConnector"]
     )
 def create_connector(request):
@@ -0,0 +1,123 @@
+import threading
+import time
+import numpy
+import pytest
+from six.moves import configparser
+from spynnaker.pyNN.models.neuron.synapse_dynamics import (
+    AbstractSynapseDynamics)
+from spynnaker.pyNN.models.pynn_projection_common import (
+    PyNNProjectionCommon)
+
+_N_PLACEMENTS = 6
+_EDGES_PER_PLACEMENT = 3
+
+
+class _MockVertex(object):
+    def __init__(self, label, n_atoms):
+        self.label = label
+        self.n_atoms = n_atoms
+
+
+class _MockPostVertex(_MockVertex):
+    """ A post-vertex that gives the connections of each machine edge, and\
+        keeps track of how many are read at once
+    """
+
+    def __init__(self):
+        super(_MockPostVertex, self).__init__("Post", 100)
+        self._lock = threading.Lock()
+        self._n_reading = 0
+        self.max_n_reading = 0
+
+    def get_connections_from_machine(
+            self, transceiver, placement, edge, *args):
+        with self._lock:
+            self._n_reading += 1
+            self.max_n_reading = max(self.max_n_reading, self._n_reading)
+        time.sleep(0.01)
+        with self._lock:
+            self._n_reading -= 1
+        if edge % 5 == 4:
+            return None
+        connections = numpy.zeros(
+            4, dtype=AbstractSynapseDynamics.NUMPY_CONNECTORS_DTYPE)
+        connections["source"] = edge
+        connections["target"] = numpy.arange(4) + placement * 4
+        connections["weight"] = edge * 0.5
+        connections["delay"] = placement + 1
+        return connections
+
+
+class _MockProjectionEdge(object):
+    def __init__(self, post_vertex):
+        self.pre_vertex = _MockVertex("Pre", 100)
+        self.post_vertex = post_vertex
+
+
+class _MockMachineEdge(int):
+    """ A machine edge, numbered so that it ends at the core of its number\
+        divided by the edges per core
+    """
+
+    @property
+    def post_vertex(self):
+        return self // _EDGES_PER_PLACEMENT
+
+
+class _MockGraphMapper(object):
+    def get_machine_edges(self, edge):
+        return [_MockMachineEdge(i) for i in range(
+            _N_PLACEMENTS * _EDGES_PER_PLACEMENT)]
+
+
+class _MockPlacements(object):
+    def get_placement_of_vertex(self, vertex):
+        return vertex
+
+
+class _MockSpinnakerControl(object):
+    has_ran = True
+    graph_mapper = _MockGraphMapper()
+    placements = _MockPlacements()
+    transceiver = None
+    routing_infos = None
+    machine_time_step = 1000
+    fixed_routes = None
+
+    def __init__(self, n_threads):
+        self.config = configparser.RawConfigParser()
+        self.config.add_section("Simulation")
+        self.config.set(
+            "Simulation", "n_connection_read_threads", str(n_threads))
+
+    def get_generated_output(self, name):
+        return None
+
+
+def _read_connections(n_threads):
+    post_vertex = _MockPostVertex()
+    projection = object.__new__(PyNNProjectionCommon)
+    projection._spinnaker_control = _MockSpinnakerControl(n_threads)
+    projection._projection_edge = _MockProjectionEdge(post_vertex)
+    projection._synapse_information = None
+    projection._virtual_connection_list = None
+    connections = projection._get_synaptic_data(
+        True, ["source", "target", "weight", "delay"])
+    return list(connections), post_vertex.max_n_reading
+
+
+@pytest.mark.parametrize("n_threads", [2, 4])
+def test_read_connections_in_threads(n_threads):
+    one_at_a_time, max_n_reading = _read_connections(1)
+    assert max_n_reading == 1
+    in_threads, max_n_reading = _read_connections(n_threads)
+    assert 1 < max_n_reading <= n_threads
+
+    expected = [
+        (edge, placement * 4 + target, edge * 0.5, placement + 1)
+        for edge in range(_N_PLACEMENTS * _EDGES_PER_PLACEMENT)
+        if edge % 5 != 4
+        for placement in [edge // _EDGES_PER_PLACEMENT]
+        for target in range(4)]
+    assert sorted(map(tuple, one_at_a_time)) == sorted(expected)
+    assert sorted(map(tuple, in_threads)) == sorted(expected)
@@ -0,0 +1,52 @@
+import numpy
+from data_specification.enums import DataType
+from spynnaker.pyNN.utilities.utility_calls import (
+    convert_array_to, convert_to)
+
+
+def _check(values, data_type):
+    expected = numpy.array(
+        [convert_to(value, data_type) for value in values],
+        dtype=numpy.dtype(data_type.struct_encoding))
+    converted = convert_array_to(values, data_type)
+    assert converted.dtype == expected.dtype
+    # Compare the bytes so that NaN floats compare equal
+    assert converted.tobytes() == expected.tobytes(), data_type
+
+
+def _values(data_type, rng):
+    scale = float(data_type.scale)
+    low = float(data_type.min)
+    high = min(float(data_type.max), 2.0 ** 62)
+    yield rng.uniform(low, high, 500)
+
+    # Values that are (almost) half way between two representable values
+    halves = (rng.randint(-1000, 1000, 200) + 0.5) / scale
+    yield halves
+    yield numpy.nextafter(halves, numpy.inf)
+    yield numpy.nextafter(halves, -numpy.inf)
+
+    # Values whose string form in Python 2 differs from their exact value
+    yield (rng.randint(0, 10 ** 6, 200) + 0.5) / scale + 1e-13
+
+    # Values that are written in full
+    yield numpy.array([0.0, -0.0, 1.0, -1.0, 0.1, 0.3, 0.1 + 0.2, 1e-20])
+    yield rng.randint(-100, 100, 50)
+    yield rng.uniform(-1, 1, 200).astype("float32")
+
+    # Values that do not fit in the type
+    yield numpy.array([low - 1.0, high * 2 + 1.0, -1e30, 1e30])
+    yield numpy.array([numpy.nan, numpy.inf, -numpy.inf])
+
+
+def test_convert_array_to_matches_convert_to():
+    rng = numpy.random.RandomState(42)
+    for data_type in DataType:
+        for values in _values(data_type, rng):
+            _check(values, data_type)
+
+
+def test_convert_array_to_lists():
+    converted = convert_array_to([-65.0, 0.25, 1], DataType.S1615)
+    assert converted.tolist() == [-65 * 32768, 8192, 32768]
+    assert convert_array_to(0.5, DataType.U032).tolist() == [2 ** 31]
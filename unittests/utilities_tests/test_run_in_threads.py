@@ -0,0 +1,67 @@
+import threading
+import time
+import pytest
+from spynnaker.pyNN.utilities.utility_calls import run_in_threads
+
+
+class LocalTransceiver(object):
+    """ A stand-in for a transceiver that reads from local memory, and keeps\
+        track of how many reads are happening at once
+    """
+
+    def __init__(self, memory):
+        self._memory = memory
+        self._lock = threading.Lock()
+        self._n_reading = 0
+        self.max_n_reading = 0
+
+    def read_memory(self, x, y, base_address, length):
+        with self._lock:
+            self._n_reading += 1
+            self.max_n_reading = max(self.max_n_reading, self._n_reading)
+        time.sleep(0.01)
+        with self._lock:
+            self._n_reading -= 1
+        return self._memory[x, y][base_address:base_address + length]
+
+
+@pytest.mark.parametrize("n_threads", [1, 4])
+def test_read_cores_in_threads(n_threads):
+    memory = {
+        (x, y): bytearray([x, y]) * 8 for x in range(4) for y in range(4)}
+    transceiver = LocalTransceiver(memory)
+
+    def read(core):
+        x, y = core
+        return core, transceiver.read_memory(x, y, 2, 4)
+
+    results = dict(run_in_threads(read, sorted(memory), n_threads))
+
+    assert len(results) == len(memory)
+    for (x, y), data in results.items():
+        assert data == bytearray([x, y, x, y])
+    assert 1 <= transceiver.max_n_reading <= n_threads
+
+
+def test_run_in_threads_raises():
+    def fail(item):
+        if item == 3:
+            raise ValueError(item)
+        return item
+
+    with pytest.raises(ValueError):
+        list(run_in_threads(fail, range(10), 4))
+
+
+def test_run_in_threads_closed_early():
+    def slow(item):
+        time.sleep(0.01)
+        return item
+
+    results = run_in_threads(slow, range(10), 4)
+    assert next(results) in range(10)
+    results.close()
+
+    for result in run_in_threads(slow, range(10), 4):
+        break
+    assert result in range(10)
@@ -0,0 +1,29 @@
+import numpy
+from spynnaker.pyNN.utilities.running_stats import (
+    RunningStats, grouped_stats)
+
+
+def test_grouped_stats():
+    groups = [0, 1, 0, 0, 2, 1]
+    means = [1.0, 2.0, 3.0, 4.0, 5.0, 0.5]
+    variances = [0.1, 0.0, 0.3, 1.0, 0.2, 0.4]
+    n_items = [2, 5, 0, 7, 1, 3]
+    n_groups = 4
+
+    stats = [RunningStats() for _ in range(n_groups)]
+    for group, mean, variance, n in zip(groups, means, variances, n_items):
+        stats[group].add_items(mean, variance, n)
+
+    total_items, group_means, group_variances = grouped_stats(
+        groups, means, variances, n_items, n_groups)
+    assert numpy.allclose(total_items, [s.n_items for s in stats])
+    assert numpy.allclose(group_means, [s.mean for s in stats])
+    assert numpy.allclose(group_variances, [s.variance for s in stats])
+
+
+def test_grouped_stats_empty():
+    total_items, group_means, group_variances = grouped_stats(
+        [], [], [], [], 2)
+    assert list(total_items) == [0, 0]
+    assert list(group_means) == [0, 0]
+    assert list(group_variances) == [0, 0]
@@ -0,0 +1,131 @@
+import os
+import shutil
+import tempfile
+import numpy
+import pytest
+from spynnaker.pyNN.utilities import utility_calls
+from spynnaker.pyNN.utilities.binary_spike_file import (
+    is_binary_spike_file, write_binary_spike_file)
+
+SPIKES = """# time\tneuron
+5.0\t3
+1.5\t0
+# a comment in the middle
+2.0\t3
+7.25\t1
+(1 + 2)\t2.0
+0.5\t3
+"""
+
+
+def _write(directory, name, text):
+    path = os.path.join(directory, name)
+    with open(path, "w") as f:
+        f.write(text)
+    return path
+
+
+def _check_block_sizes(function):
+    # Check with blocks that split the file in many places
+    block_bytes = utility_calls._READ_BLOCK_BYTES
+    try:
+        for utility_calls._READ_BLOCK_BYTES in [1, 7, 1000]:
+            function()
+    finally:
+        utility_calls._READ_BLOCK_BYTES = block_bytes
+
+
+def test_read_spikes_from_file():
+    directory = tempfile.mkdtemp()
+    try:
+        path = _write(directory, "spikes.txt", SPIKES)
+
+        def check():
+            spikes = utility_calls.read_spikes_from_file(path)
+            assert spikes.tolist() == [
+                [0, 1.5], [1, 7.25], [2, 3.0], [3, 0.5], [3, 2.0], [3, 5.0]]
+            spikes = utility_calls.read_spikes_from_file(
+                path, min_atom=1, max_atom=3, min_time=3.0, max_time=8)
+            assert spikes.tolist() == [[1, 7.25], [2, 3.0]]
+
+        _check_block_sizes(check)
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_read_in_data_from_file():
+    directory = tempfile.mkdtemp()
+    try:
+        path = _write(directory, "gsyn.txt", (
+            "# time\tneuron\tvalue\textra\n"
+            "1\t0\t0.25\tx\n"
+            "0\t1\t-1.5\tx\n"
+            "0\t0\t2.0\tx\n"
+            "3\t2\t1.0\tx\n"))
+
+        def check():
+            data = utility_calls.read_in_data_from_file(
+                path, 0, 2, 0, 10, True)
+            assert data.tolist() == [
+                [0, 0, 2.0], [0, 1, 0.25], [1, 0, -1.5]]
+
+        _check_block_sizes(check)
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_read_in_data_from_file_wrong_columns():
+    directory = tempfile.mkdtemp()
+    try:
+        three_columns = _write(
+            directory, "three.txt", "1\t0\t0.25\n0\t1\t-1.5\n")
+        four_columns = _write(
+            directory, "four.txt", "1\t0\t0.25\t2\n0\t1\t-1.5\t3\n")
+        mixed_columns = _write(
+            directory, "mixed.txt", "1\t0\t0.25\tx\n0\t1\t-1.5\n")
+        # Lines of two and four values have as many as two lines of three
+        uneven_columns = _write(
+            directory, "uneven.txt", "1\t0\n0\t1\t-1.5\t2\n")
+
+        def check():
+            assert len(utility_calls.read_in_data_from_file(
+                three_columns, 0, 2, 0, 10)) == 2
+            assert len(utility_calls.read_in_data_from_file(
+                four_columns, 0, 2, 0, 10, True)) == 2
+            for path, extra in [
+                    (three_columns, True), (four_columns, False),
+                    (mixed_columns, True), (mixed_columns, False),
+                    (uneven_columns, False)]:
+                with pytest.raises(ValueError):
+                    utility_calls.read_in_data_from_file(
+                        path, 0, 2, 0, 10, extra)
+
+        _check_block_sizes(check)
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_binary_spike_file():
+    directory = tempfile.mkdtemp()
+    try:
+        text_path = _write(directory, "spikes.txt", SPIKES)
+        binary_path = os.path.join(directory, "spikes.bin")
+        write_binary_spike_file(
+            binary_path, utility_calls.read_spikes_from_file(text_path))
+        assert is_binary_spike_file(binary_path)
+        assert not is_binary_spike_file(text_path)
+
+        for min_atom, max_atom, min_time, max_time in [
+                (None, None, None, None), (1, 3, 3.0, 8), (0.5, 2.5, 0, 10),
+                (3, 100, 1, 5), (4, None, None, None), (2, 1, 0, 10)]:
+            assert numpy.array_equal(
+                utility_calls.read_spikes_from_file(
+                    binary_path, min_atom, max_atom, min_time, max_time),
+                utility_calls.read_spikes_from_file(
+                    text_path, min_atom, max_atom, min_time, max_time))
+
+        write_binary_spike_file(binary_path, numpy.zeros((0, 2)))
+        assert utility_calls.read_spikes_from_file(binary_path).shape == (
+            0, 2)
+    finally:
+        shutil.rmtree(directory)